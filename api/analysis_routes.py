@@ -2,16 +2,17 @@
 Analysis routes for generating candidate interview analysis
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+import asyncio
 import json
 import os
 from dotenv import load_dotenv
 
-from core.database import get_db
+from core.database import AsyncReadSessionLocal, AsyncSessionLocal
 from core.models import Candidate
 from core.auth import get_current_user
+from core.clients import get_agent, get_groq_model
 from agno.agent import Agent
-from agno.models.groq import Groq
 
 load_dotenv()
 
@@ -41,12 +42,15 @@ def generate_analysis_with_llm(candidate: Candidate) -> dict:
         except:
             pass
     
-    # Create LLM agent
-    agent = Agent(
-        name="Interview Analyst",
-        model=Groq(id="llama-3.3-70b-versatile"),
-        description="Generates comprehensive interview analysis",
-        markdown=False,
+    # Shared LLM agent
+    agent = get_agent(
+        "interview_analyst",
+        lambda: Agent(
+            name="Interview Analyst",
+            model=get_groq_model("llama-3.3-70b-versatile"),
+            description="Generates comprehensive interview analysis",
+            markdown=False,
+        )
     )
     
     # Build prompt
@@ -112,19 +116,22 @@ IMPORTANT:
 @router.get("/{candidate_id}/analysis")
 async def get_candidate_analysis(
     candidate_id: int,
-    db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """
     Get or generate comprehensive analysis for a candidate
     Admin-only endpoint
+    
+    No session is held while the LLM runs: the candidate is read on the read
+    pool, and the result is stored through a fresh writer session afterwards.
     """
     # Verify admin access
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
     # Get candidate
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    async with AsyncReadSessionLocal() as db:
+        candidate = await db.scalar(select(Candidate).where(Candidate.id == candidate_id))
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
@@ -142,11 +149,14 @@ async def get_candidate_analysis(
         except:
             pass
     
-    # Generate new analysis
-    analysis = generate_analysis_with_llm(candidate)
+    # Generate new analysis (the agent call blocks, keep it off the event loop)
+    analysis = await asyncio.to_thread(generate_analysis_with_llm, candidate)
     
     # Save to database
-    candidate.overall_analysis = json.dumps(analysis)
-    db.commit()
+    async with AsyncSessionLocal() as db:
+        candidate = await db.get(Candidate, candidate_id)
+        if candidate is not None:
+            candidate.overall_analysis = json.dumps(analysis)
+            await db.commit()
     
     return analysis
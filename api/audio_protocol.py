@@ -0,0 +1,103 @@
+"""
+Binary audio framing for the interview WebSocket (protocol v2)
+
+Protocol v1 sends reply audio base64-encoded inside JSON (or, in streaming
+mode, as bare MP3 frames). Protocol v2 sends every piece of audio as a
+binary frame: a fixed 10-byte header followed by the raw audio bytes.
+
+Header layout (network byte order):
+    version   u8   always 2
+    kind      u8   1 = complete reply, 2 = streamed segment
+    codec     u8   id from CODECS
+    flags     u8   bit 0 set on the last frame of a reply (a streamed reply
+                   ends with an empty-payload frame carrying this flag)
+    reply     u32  interviewer reply the audio belongs to: 1 for the
+                   introduction, then one more for every reply (including
+                   repeat prompts), so no two replies share a number
+    index     u16  segment index within the reply
+"""
+import struct
+from typing import Dict, Tuple
+from core.audio_codecs import MP3, OPUS_WEBM, available_codecs
+
+PROTOCOL_V1 = 1
+PROTOCOL_V2 = 2
+
+FRAME_HEADER = struct.Struct("!BBBBIH")
+
+FRAME_REPLY = 1
+FRAME_SEGMENT = 2
+
+FLAG_FINAL = 0x01
+
+# Codec id -> MIME type. edge-tts produces MP3; Opus in WebM is transcoded
+# from it and is only offered when PyAV can encode it (see core.audio_codecs).
+CODECS: Dict[int, str] = {
+    1: MP3,
+    2: OPUS_WEBM,
+}
+CODEC_IDS: Dict[str, int] = {mime: codec_id for codec_id, mime in CODECS.items()}
+DEFAULT_CODEC = MP3
+
+
+def negotiate(init_message: Dict) -> Tuple[int, str]:
+    """
+    Pick the protocol version and audio codec for a connection
+
+    The first requested codec the server can produce is chosen, so a
+    client listing "audio/webm;codecs=opus" first receives Opus replies.
+    Codecs the server cannot produce here, and malformed "codecs" values
+    (not a list, or entries that are not strings), fall back to the default.
+
+    Args:
+        init_message: Client init message; may carry "protocol" (1 or 2) and
+            "codecs" (MIME types in order of preference)
+
+    Returns:
+        Tuple of (protocol_version, codec_mime)
+    """
+    protocol = PROTOCOL_V2 if init_message.get("protocol") == PROTOCOL_V2 else PROTOCOL_V1
+
+    requested = init_message.get("codecs")
+    if not isinstance(requested, list):
+        requested = []
+    supported = available_codecs()
+    codec = next(
+        (mime for mime in requested if isinstance(mime, str) and mime in CODEC_IDS and mime in supported),
+        DEFAULT_CODEC
+    )
+
+    return protocol, codec
+
+
+def pack_audio_frame(
+    audio: bytes,
+    codec: str,
+    kind: int,
+    reply: int,
+    index: int = 0,
+    final: bool = True
+) -> bytes:
+    """
+    Build a v2 binary audio frame
+
+    Args:
+        audio: Raw audio bytes
+        codec: Negotiated codec MIME type
+        kind: FRAME_REPLY or FRAME_SEGMENT
+        reply: Number of the interviewer reply within the session
+        index: Segment index within the reply
+        final: Whether this is the last frame of the reply
+
+    Returns:
+        Header followed by the audio bytes
+    """
+    header = FRAME_HEADER.pack(
+        PROTOCOL_V2,
+        kind,
+        CODEC_IDS[codec],
+        FLAG_FINAL if final else 0,
+        reply & 0xFFFFFFFF,
+        index & 0xFFFF,
+    )
+    return header + audio
@@ -4,14 +4,16 @@ Handles signup, login, and user verification
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, EmailStr
 
-from core.database import get_db
+from core.database import get_async_db, get_async_read_db
 from core.models import User, Candidate
 from core.auth import (
-    hash_password, 
-    verify_password, 
+    ahash_password, 
+    averify_password, 
     create_access_token,
     get_current_user,
     security
@@ -39,37 +41,43 @@ class AuthResponse(BaseModel):
 
 
 @router.post("/signup", response_model=AuthResponse)
-async def signup(request: SignupRequest, db: Session = Depends(get_db)):
+async def signup(request: SignupRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Candidate signup - Step 1 of registration
     Creates user account with email and password
     """
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == request.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == request.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
-    # Create new user
+    # End the lookup transaction so the single writer connection is free
+    # while bcrypt runs on the password executor
+    await db.rollback()
+    password_hash = await ahash_password(request.password)
+    
+    # Create new user with an empty candidate record (to be completed in
+    # application form), committed together
     new_user = User(
         email=request.email,
         name=request.name,
-        password_hash=hash_password(request.password),
+        password_hash=password_hash,
         role="candidate"
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    
-    # Create empty candidate record (to be completed in application form)
-    candidate = Candidate(
-        user_id=new_user.id,
-        application_completed=False
-    )
-    db.add(candidate)
-    db.commit()
+    db.add(Candidate(user=new_user, application_completed=False))
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Same email registered concurrently while the password was hashed
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     
     # Generate token
     token = create_access_token(data={
@@ -91,33 +99,36 @@ async def signup(request: SignupRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=AuthResponse)
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+async def login(request: LoginRequest, db: AsyncSession = Depends(get_async_read_db)):
     """
     Login for both admins and candidates
     Returns JWT token and user information
     """
     # Find user
-    user = db.query(User).filter(User.email == request.email).first()
+    user = await db.scalar(select(User).where(User.email == request.email))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
     
-    # Verify password
-    if not verify_password(request.password, user.password_hash):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid email or password"
-        )
-    
     # Get application status (for candidates)
     application_completed = False
     if user.role == "candidate":
-        candidate = db.query(Candidate).filter(Candidate.user_id == user.id).first()
+        candidate = await db.scalar(select(Candidate).where(Candidate.user_id == user.id))
         if candidate:
             application_completed = candidate.application_completed
     
+    # Return the read connection to the pool before the slow bcrypt check
+    await db.commit()
+    
+    # Verify password
+    if not await averify_password(request.password, user.password_hash):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password"
+        )
+    
     # Generate token
     token = create_access_token(data={
         "user_id": user.id,
@@ -138,7 +149,7 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/me")
-async def get_me(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_me(current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_async_read_db)):
     """
     Get current user information
     """
@@ -146,7 +157,7 @@ async def get_me(current_user: User = Depends(get_current_user), db: Session = D
     full_name = current_user.name
     
     if current_user.role == "candidate":
-        candidate = db.query(Candidate).filter(Candidate.user_id == current_user.id).first()
+        candidate = await db.scalar(select(Candidate).where(Candidate.user_id == current_user.id))
         if candidate:
             application_completed = candidate.application_completed
             candidate_id = candidate.id
@@ -1,12 +1,13 @@
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks
 import shutil
+import asyncio
 from pathlib import Path
 from typing import Optional
 from core.resume_service import extract_text_from_pdf, screen_resume
 from core.notification_service import (
     initialize_candidate, 
     verify_otp, 
-    get_candidates_db, 
+    get_candidate, 
     advance_candidate, 
     send_otp_email, 
     send_offer_letter_email
@@ -39,7 +40,7 @@ async def apply(
     is_suitable = screen_resume(text, role)
     
     if is_suitable:
-        candidate_data, otp = initialize_candidate(email, fullName, role)
+        candidate_data, otp = await asyncio.to_thread(initialize_candidate, email, fullName, role)
         # Send email in background to speed up response
         background_tasks.add_task(send_otp_email, email, otp, "Aptitude Round")
         
@@ -62,7 +63,7 @@ async def apply(
 
 @router.post("/verify-otp")
 async def verify_candidate_otp(email: str = Form(...), otp: str = Form(...)):
-    success, message = verify_otp(email, otp)
+    success, message = await asyncio.to_thread(verify_otp, email, otp)
     if success:
         return {"status": "success", "message": message}
     else:
@@ -70,16 +71,16 @@ async def verify_candidate_otp(email: str = Form(...), otp: str = Form(...)):
 
 @router.get("/status/{email}")
 async def get_status(email: str):
-    db = get_candidates_db()
-    if email in db:
-        return db[email]
+    candidate = await asyncio.to_thread(get_candidate, email)
+    if candidate is not None:
+        return candidate
     else:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
 @router.post("/complete-round")
 async def complete_round(background_tasks: BackgroundTasks, email: str = Form(...)):
     """Mark the current round as completed and trigger next steps in background"""
-    result = advance_candidate(email)
+    result = await asyncio.to_thread(advance_candidate, email)
     if result:
         candidate, next_otp, next_round = result
         
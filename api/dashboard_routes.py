@@ -1,15 +1,26 @@
 """
 Dashboard routes for admin panel
-Provides endpoints for dashboard statistics and candidate data
+Provides endpoints for dashboard statistics and candidate data, and a
+Server-Sent Events stream of candidate changes
 """
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Dict, Any
+import json
+import heapq
+import base64
+import asyncio
+from datetime import datetime
+from itertools import islice
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
+from sqlalchemy import Select, and_, func, select, tuple_
+from typing import Annotated, List, Dict, Any, Literal, Optional, Tuple
 
-from core.database import get_db
-from core.models import User, Candidate
-from core.auth import require_admin
+from core.database import AsyncReadSessionLocal, get_async_read_db
+from core.models import User, Candidate, DashboardStats
+from core.dashboard_stats import STATS_ID, as_response, candidate_status
+from core.dashboard_events import dashboard_events
+from core.auth import authenticate_token, require_admin
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
@@ -17,30 +28,36 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 @router.get("/stats")
 async def get_dashboard_stats(
     current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get dashboard statistics for admin
     Only accessible by admins
     """
+    # Single-row read of the incrementally maintained aggregates
+    stats = await db.get(DashboardStats, STATS_ID)
+    if stats is not None:
+        return as_response(stats)
+    
+    # Database not migrated yet: aggregate over candidates
     # Total candidates count
-    total_candidates = db.query(Candidate).count()
+    total_candidates = await db.scalar(select(func.count(Candidate.id)))
     
     # Candidates with completed applications
-    active_candidates = db.query(Candidate).filter(
-        Candidate.application_completed == True
-    ).count()
+    active_candidates = await db.scalar(
+        select(func.count(Candidate.id)).where(Candidate.application_completed == True)
+    )
     
     # Calculate average score from completed interviews (round 3)
-    avg_score_result = db.query(func.avg(Candidate.round_3_score)).filter(
-        Candidate.round_3_score.isnot(None)
-    ).scalar()
+    avg_score_result = await db.scalar(
+        select(func.avg(Candidate.round_3_score)).where(Candidate.round_3_score.isnot(None))
+    )
     avg_score = round(avg_score_result) if avg_score_result else 0
     
     # Count of candidates with any interview progress
-    candidates_interviewed = db.query(Candidate).filter(
-        Candidate.current_round > 0
-    ).count()
+    candidates_interviewed = await db.scalar(
+        select(func.count(Candidate.id)).where(Candidate.current_round > 0)
+    )
     
     return {
         "total_interviews": candidates_interviewed,
@@ -50,32 +67,148 @@ async def get_dashboard_stats(
     }
 
 
+# Sort keys for the candidate listing; every key is paired with the id so
+# the order is total and pages can resume from a (value, id) cursor
+SORT_COLUMNS = {
+    "updated_at": Candidate.updated_at,
+    "round_1_score": Candidate.round_1_score,
+    "round_2_score": Candidate.round_2_score,
+    "round_3_score": Candidate.round_3_score,
+}
+
+# Listing status (see core.dashboard_stats.candidate_status) as conditions on
+# ix_candidates_round_updated_at_score. A status spanning several rounds has
+# one condition per round: each is read in index order and the pages merged,
+# since SQLite would sort an IN over rounds in a temporary B-tree.
+# current_round only takes the values 0-3 (see Candidate).
+STATUS_FILTERS = {
+    "registered": (Candidate.current_round == 0,),
+    "in_progress": (Candidate.current_round == 1, Candidate.current_round == 2),
+    "completed": (and_(Candidate.current_round == 3, Candidate.round_3_score.isnot(None)),),
+    "pending": (and_(Candidate.current_round == 3, Candidate.round_3_score.is_(None)),),
+}
+
+MAX_PAGE_SIZE = 100
+
+# Dashboard stream: client reconnect delay and idle keepalive interval
+SSE_RETRY_MS = 5000
+SSE_KEEPALIVE_SECONDS = 15
+
+
+def encode_cursor(sort: str, candidate: Candidate) -> str:
+    """Opaque cursor for the page after this candidate"""
+    value = getattr(candidate, sort)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return base64.urlsafe_b64encode(json.dumps([value, candidate.id]).encode()).decode()
+
+
+def decode_cursor(sort: str, cursor: str) -> Tuple[Any, int]:
+    """(sort value, id) of the last candidate on the previous page"""
+    try:
+        value, candidate_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if sort == "updated_at":
+            value = datetime.fromisoformat(value)
+        return value, int(candidate_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def candidate_listing_queries(
+    sort: str = "updated_at",
+    order: str = "desc",
+    status: Optional[str] = None,
+    role: Optional[str] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None,
+    after: Optional[Tuple[Any, int]] = None
+) -> List[Select]:
+    """
+    Candidate listing statements with users joined in the same query
+
+    Args:
+        sort: Key from SORT_COLUMNS
+        order: "desc" or "asc"
+        status: Key from STATUS_FILTERS
+        role: Exact role_applied_for
+        min_score: Lowest Round 3 score (inclusive)
+        max_score: Highest Round 3 score (inclusive)
+        after: (sort value, id) cursor to continue from
+
+    Returns:
+        One select statement per STATUS_FILTERS condition (a single one
+        without a status), without a limit, each in listing order
+    """
+    column = SORT_COLUMNS[sort]
+    statement = select(Candidate).join(Candidate.user).options(contains_eager(Candidate.user))
+
+    if sort != "updated_at":
+        # Candidates without that round's score are not ranked
+        statement = statement.where(column.isnot(None))
+    if role is not None:
+        statement = statement.where(Candidate.role_applied_for == role)
+    if sort == "updated_at" and (min_score is not None or max_score is not None):
+        # Only Round 3 candidates have a Round 3 score; the round lets the
+        # score be checked on index entries read in updated_at order
+        statement = statement.where(Candidate.current_round == 3)
+    if min_score is not None:
+        statement = statement.where(Candidate.round_3_score >= min_score)
+    if max_score is not None:
+        statement = statement.where(Candidate.round_3_score <= max_score)
+
+    key = tuple_(column, Candidate.id)
+    if after is not None:
+        statement = statement.where(key < tuple_(*after) if order == "desc" else key > tuple_(*after))
+
+    if order == "desc":
+        statement = statement.order_by(column.desc(), Candidate.id.desc())
+    else:
+        statement = statement.order_by(column.asc(), Candidate.id.asc())
+
+    if status is None:
+        return [statement]
+    return [statement.where(condition) for condition in STATUS_FILTERS[status]]
+
+
 @router.get("/candidates")
 async def get_recent_candidates(
+    response: Response,
     current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db),
-    limit: int = 10
+    db: AsyncSession = Depends(get_async_read_db),
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = 10,
+    cursor: Optional[str] = None,
+    sort: Literal["updated_at", "round_1_score", "round_2_score", "round_3_score"] = "updated_at",
+    order: Literal["desc", "asc"] = "desc",
+    status: Optional[Literal["registered", "in_progress", "completed", "pending"]] = None,
+    role: Optional[str] = None,
+    min_score: Optional[int] = None,
+    max_score: Optional[int] = None
 ):
     """
-    Get recent candidates with their interview status
+    Get candidates with their interview status, newest first by default
     Only accessible by admins
+
+    Keyset paginated: when more candidates follow, the X-Next-Cursor header
+    holds the cursor for the next page (pass it back with the same filters).
+    Sorting by a round score lists only candidates who have that score.
     """
-    candidates = db.query(Candidate).join(User).order_by(
-        Candidate.updated_at.desc()
-    ).limit(limit).all()
+    after = decode_cursor(sort, cursor) if cursor else None
+    statements = candidate_listing_queries(sort, order, status, role, min_score, max_score, after)
+
+    # One extra row tells whether there is a next page
+    pages = [(await db.scalars(statement.limit(limit + 1))).all() for statement in statements]
+    candidates = list(islice(
+        heapq.merge(*pages, key=lambda candidate: (getattr(candidate, sort), candidate.id), reverse=order == "desc"),
+        limit + 1
+    ))
+    if len(candidates) > limit:
+        candidates = candidates[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(sort, candidates[-1])
     
     result = []
     for candidate in candidates:
         # Determine status based on current round and scores
-        status = "registered"
-        if candidate.current_round == 0:
-            status = "registered"
-        elif candidate.current_round < 3:
-            status = "in_progress"
-        elif candidate.current_round == 3 and candidate.round_3_score is not None:
-            status = "completed"
-        else:
-            status = "pending"
+        candidate_state = candidate_status(candidate)
         
         # Calculate overall score if interview is completed
         overall_score = None
@@ -87,7 +220,7 @@ async def get_recent_candidates(
             "candidateName": candidate.full_name or candidate.user.name or candidate.user.email.split('@')[0],
             "email": candidate.user.email,
             "role": candidate.role_applied_for or "Not specified",
-            "status": status,
+            "status": candidate_state,
             "score": overall_score,
             "currentRound": candidate.current_round,
             "round1Score": candidate.round_1_score,
@@ -98,3 +231,48 @@ async def get_recent_candidates(
         })
     
     return result
+
+
+@router.get("/stream")
+async def stream_dashboard_events(request: Request, token: Optional[str] = None):
+    """
+    Server-Sent Events stream of candidate changes for the admin dashboard
+    Only accessible by admins
+
+    Authenticates with the Bearer header or, for EventSource clients that
+    cannot set headers, a token query parameter. Each "candidate_updated"
+    event carries the candidate's listing fields and the current stats; a
+    "resync" event means events were dropped and the client should reload.
+    """
+    authorization = request.headers.get("Authorization", "")
+    if authorization.startswith("Bearer "):
+        token = authorization[len("Bearer "):]
+    if not token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    # Short-lived session: the stream must not hold a pooled connection
+    async with AsyncReadSessionLocal() as db:
+        current_user = await authenticate_token(token, db)
+    await require_admin(current_user)
+
+    queue = dashboard_events.subscribe()
+
+    async def events():
+        try:
+            yield f"retry: {SSE_RETRY_MS}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+        finally:
+            dashboard_events.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -3,6 +3,11 @@ FastAPI routes for speech-to-speech interview
 """
 from fastapi import APIRouter, WebSocket
 from api.websocket_handler import interview_websocket_endpoint
+from core.tts_cache import tts_cache
+from core.intro_pool import intro_pool
+from core.admission import interview_admission
+from core.metrics import stage_metrics
+from core.speculation import speculation_stats
 
 # Create router
 router = APIRouter(prefix="/interview", tags=["Interview"])
@@ -15,18 +20,56 @@ async def websocket_interview(websocket: WebSocket):
     
     Protocol:
     1. Client connects and sends init message:
-       {"type": "init", "session_id": "unique_id", "job_role": "Software Engineer"}
+       {"type": "init", "job_role": "Software Engineer", "streaming": false}
+    
+    If the worker is at its session capacity the client is queued in arrival order and receives
+       {"type": "queued", "position": 3, "eta_seconds": 90} periodically, then
+       {"type": "admitted", "waited_seconds": 42.0}
+    
+    Adding "protocol": 2 and "codecs": ["audio/mpeg"] to init switches audio to binary frames:
+       a 10-byte header (version, kind, codec, flags, reply number, segment index) followed by raw
+       audio, with JSON messages carrying only text and metadata. Listing
+       "audio/webm;codecs=opus" first in "codecs" requests low-bitrate Opus replies (each
+       reply, or each streamed sentence, is one WebM file). The chosen protocol and codec
+       are echoed in the session message.
+    
+    Adding "speculative": true to init (default: SPECULATIVE_QUESTIONS) prefetches the next
+       question and its audio while the candidate answers; it is sent as is when it still
+       fits the answer, otherwise the question is regenerated with the answer as context.
+    
+    Server sends {"type": "session", "session_id": "...", "resume_token": "..."}. Each turn is
+       checkpointed; after a dropped connection the client reconnects with
+       {"type": "init", "resume": true, "session_id": "...", "resume_token": "..."}
+       and receives {"type": "resumed", "stage": "...", "last_interviewer_text": "..."}
+       on any worker, continuing from step 3.
     
     2. Server sends introduction:
        {"type": "interviewer_response", "text": "...", "audio": "base64_audio", "stage": "introduction"}
+       
+       With "streaming": true every reply is instead sent sentence by sentence
+       while the LLM is still generating it:
+       {"type": "audio_start", "format": "audio/mpeg"}
+       {"type": "audio_segment", "index": 0, "text": "First sentence."} + binary MP3 frames
+       (forwarded as edge-tts produces them; append them in order until the next message)
+       ...
+       {"type": "audio_end", "text": "...", "stage": "...", "segments": N, "bytes": N}
     
-    3. Client sends audio chunks as binary WebSocket frames
+    3. Client sends each answer as one binary WebSocket frame, or streams it while recording:
+       {"type": "answer_start"}, binary chunks (MediaRecorder timeslice), {"type": "answer_end"}
+       Chunked answers are transcribed in segments in the background, so only
+       the tail remains when answer_end arrives.
     
     4. Server responds with:
        {"type": "interviewer_response", "text": "...", "transcript": "...", "audio": "base64_audio", "stage": "..."}
+       Silence is trimmed before transcription; an answer with no detected
+       speech gets a short request to repeat it and does not advance the interview.
+    
+    5. Client sends {"type": "playback_complete"} when a reply has finished playing
     
-    5. Interview ends with:
+    6. Interview ends with:
        {"type": "interview_complete", "summary": {...scores and details...}}
+       The summary's "turn_timings" lists each turn's seconds per stage
+       (stt, llm, tts, first_audio, send, turn).
     """
     await interview_websocket_endpoint(websocket)
 
@@ -40,10 +83,31 @@ async def interview_info():
         "protocol": {
             "init": {
                 "type": "init",
-                "session_id": "unique_session_id",
-                "job_role": "Software Engineer"
+                "job_role": "Software Engineer",
+                "streaming": False,
+                "speculative": False,
+                "protocol": 1,
+                "codecs": ["audio/webm;codecs=opus", "audio/mpeg"]
+            },
+            "binary_audio_frame_v2": "!BBBBIH header (version, kind, codec, flags, reply, index) + raw audio",
+            "resume": {
+                "type": "init",
+                "resume": True,
+                "session_id": "session_id from the session message",
+                "resume_token": "token from the session message"
             },
             "audio_format": "WebM/MP3 binary data",
+            "chunked_answer": {
+                "start": {"type": "answer_start"},
+                "audio": "Binary WebM chunks while recording",
+                "end": {"type": "answer_end"}
+            },
+            "streaming_format": {
+                "start": {"type": "audio_start", "format": "audio/mpeg"},
+                "segment": {"type": "audio_segment", "index": 0, "text": "One sentence"},
+                "audio": "Binary MP3 frame following each segment",
+                "end": {"type": "audio_end", "text": "Response text", "stage": "...", "segments": 0, "bytes": 0}
+            },
             "response_format": {
                 "type": "interviewer_response",
                 "text": "Response text",
@@ -54,8 +118,39 @@ async def interview_info():
         },
         "features": [
             "Real-time speech-to-speech conversation",
+            "Optional sentence-by-sentence audio streaming",
             "Structured interview flow (intro, technical, behavioral, conclusion)",
             "Automatic scoring and evaluation",
             "Interview summary with scores"
         ]
     }
+
+
+@router.get("/tts-cache/stats")
+async def tts_cache_stats():
+    """Get hit-rate counters for the interviewer speech cache (this worker)"""
+    return tts_cache.stats()
+
+
+@router.get("/intro-pool/stats")
+async def intro_pool_stats():
+    """Get pre-generated introduction counts per role and hit counters (this worker)"""
+    return intro_pool.stats()
+
+
+@router.get("/admission/stats")
+async def admission_stats():
+    """Get session capacity, queue depth and admission wait times (this worker)"""
+    return interview_admission.stats()
+
+
+@router.get("/latency/stats")
+async def latency_stats():
+    """Get turn latency percentiles by stage and job role (this worker)"""
+    return stage_metrics.snapshot()
+
+
+@router.get("/speculation/stats")
+async def speculation_stats_endpoint():
+    """Get speculative question hit rate and wasted tokens (this worker)"""
+    return speculation_stats.stats()
@@ -32,3 +32,6 @@ def setup_logger(name: str = "ai_hiring_manager"):
 
 # Create a default logger instance for easy import
 logger = setup_logger()
+
+# core.* modules log through logging.getLogger(__name__); give them the same output
+setup_logger("core")
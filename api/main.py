@@ -3,6 +3,7 @@ FastAPI application for AI Hiring Manager chatbot
 """
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 from typing import Optional
 import os
@@ -57,6 +58,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Dashboard candidate pagination
 )
 
 # Include routers
@@ -109,12 +111,28 @@ async def startup_event():
     init_db()
     logger.info("Database initialized")
     
+    # Pre-generate interview introductions in the background
+    from core.intro_pool import intro_pool
+    intro_pool.start()
+    logger.info("Introduction pool warming started")
+    
     # Load documents
     logger.info("Loading documents into knowledge base...")
     load_documents()
     logger.info("API ready!")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks and close database connections"""
+    from core.intro_pool import intro_pool
+    from core.database import dispose_engines
+    from core.auth import password_executor
+    await intro_pool.stop()
+    await dispose_engines()
+    password_executor.shutdown()
+
+
 # Health check endpoint
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
 async def health_check():
@@ -126,6 +144,32 @@ async def health_check():
         message="AI Hiring Manager API is running"
     )
 
+# Metrics endpoint
+@app.get("/metrics", response_class=PlainTextResponse, tags=["Health"])
+async def metrics():
+    """
+    Prometheus metrics: interview turn latency by stage and job role,
+    plus admission queue and TTS cache gauges
+    """
+    from core.metrics import stage_metrics, render_gauges
+    from core.admission import interview_admission
+    from core.tts_cache import tts_cache
+    from core.speculation import speculation_stats
+    from core.dashboard_events import dashboard_events
+    from core.principal_cache import principal_cache
+    from core.auth import password_executor
+    
+    body = (
+        stage_metrics.render_prometheus()
+        + render_gauges("interview_admission", interview_admission.stats())
+        + render_gauges("tts_cache", tts_cache.stats())
+        + render_gauges("interview_speculation", speculation_stats.stats())
+        + render_gauges("dashboard_events", dashboard_events.stats())
+        + render_gauges("auth_principal_cache", principal_cache.stats())
+        + render_gauges("auth_password_executor", password_executor.stats())
+    )
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
 # Chat endpoint
 @app.post("/chat", response_model=ChatResponse, tags=["Chat"])
 async def chat(request: ChatRequest):
@@ -3,13 +3,15 @@ Quiz/Round completion routes
 Handles quiz submissions and score updates for candidates
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from typing import List
 
-from core.database import get_db
+from core.database import get_async_db, get_async_read_db
 from core.models import User, Candidate
 from core.auth import get_current_user
+from core.dashboard_events import publish_candidate_change
 
 router = APIRouter(prefix="/quiz", tags=["Quiz"])
 
@@ -30,15 +32,15 @@ class QuizSubmission(BaseModel):
 async def submit_quiz(
     submission: QuizSubmission,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Submit quiz answers and update candidate record with score
     """
     # Find candidate record
-    candidate = db.query(Candidate).filter(
-        Candidate.user_id == current_user.id
-    ).first()
+    candidate = await db.scalar(
+        select(Candidate).where(Candidate.user_id == current_user.id)
+    )
     
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate record not found")
@@ -75,8 +77,9 @@ async def submit_quiz(
     else:
         candidate.overall_status = "rejected"
     
-    db.commit()
-    db.refresh(candidate)
+    await db.commit()
+    await db.refresh(candidate)
+    await publish_candidate_change(db, candidate, "quiz_submitted")
     
     return {
         "success": True,
@@ -91,14 +94,14 @@ async def submit_quiz(
 @router.get("/status")
 async def get_quiz_status(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get current quiz/interview status for logged-in candidate
     """
-    candidate = db.query(Candidate).filter(
-        Candidate.user_id == current_user.id
-    ).first()
+    candidate = await db.scalar(
+        select(Candidate).where(Candidate.user_id == current_user.id)
+    )
     
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate record not found")
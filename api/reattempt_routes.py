@@ -2,18 +2,21 @@
 Re-attempt routes for admin to grant candidates permission to retake assessments
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from datetime import datetime
 import json
 
-from core.database import get_db
+from core.database import get_async_db, get_async_read_db
 from core.models import Candidate, CandidateAttempt, User
 from core.auth import get_current_user, require_admin
+from core.dashboard_events import publish_candidate_change
 
 router = APIRouter(prefix="/admin/candidate", tags=["Re-Attempt"])
 
 
-def archive_current_attempt(candidate: Candidate, db: Session):
+async def archive_current_attempt(candidate: Candidate, db: AsyncSession):
     """
     Archive the current attempt data before starting a new attempt
     
@@ -53,7 +56,7 @@ def archive_current_attempt(candidate: Candidate, db: Session):
     )
     
     db.add(attempt)
-    db.commit()
+    await db.commit()
     return attempt
 
 
@@ -61,20 +64,22 @@ def archive_current_attempt(candidate: Candidate, db: Session):
 async def grant_reattempt(
     candidate_id: int,
     current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Grant a candidate permission to re-attempt the assessment
     Archives current attempt data and resets scores
     """
-    # Get candidate
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    # Get candidate (with its user, for the response name)
+    candidate = await db.scalar(
+        select(Candidate).where(Candidate.id == candidate_id).options(selectinload(Candidate.user))
+    )
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
     # Archive current attempt if they have taken it
     if candidate.current_round > 0:
-        archive_current_attempt(candidate, db)
+        await archive_current_attempt(candidate, db)
     
     # Reset candidate scores and progress
     candidate.current_round = 0
@@ -90,13 +95,17 @@ async def grant_reattempt(
     candidate.can_reattempt = True
     candidate.updated_at = datetime.utcnow()
     
-    db.commit()
-    db.refresh(candidate)
+    # Read before refresh, which expires the loaded user relationship
+    candidate_name = candidate.full_name or candidate.user.name
+    
+    await db.commit()
+    await db.refresh(candidate)
+    await publish_candidate_change(db, candidate, "reattempt_granted")
     
     return {
         "message": "Re-attempt access granted successfully",
         "candidate_id": candidate.id,
-        "candidate_name": candidate.full_name or candidate.user.name,
+        "candidate_name": candidate_name,
         "new_attempt_number": candidate.current_attempt_number,
         "can_reattempt": candidate.can_reattempt
     }
@@ -106,13 +115,13 @@ async def grant_reattempt(
 async def revoke_reattempt(
     candidate_id: int,
     current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Revoke re-attempt permission before candidate starts
     Admin can change their mind
     """
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    candidate = await db.scalar(select(Candidate).where(Candidate.id == candidate_id))
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
@@ -126,7 +135,7 @@ async def revoke_reattempt(
         )
     
     candidate.can_reattempt = False
-    db.commit()
+    await db.commit()
     
     return {
         "message": "Re-attempt permission revoked",
@@ -138,20 +147,24 @@ async def revoke_reattempt(
 async def get_candidate_attempts(
     candidate_id: int,
     current_user: User = Depends(require_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get all attempts for a specific candidate
     Returns historical attempt data
     """
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    candidate = await db.scalar(
+        select(Candidate).where(Candidate.id == candidate_id).options(selectinload(Candidate.user))
+    )
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
     # Get all archived attempts
-    attempts = db.query(CandidateAttempt).filter(
-        CandidateAttempt.candidate_id == candidate_id
-    ).order_by(CandidateAttempt.attempt_number).all()
+    attempts = (await db.scalars(
+        select(CandidateAttempt).where(
+            CandidateAttempt.candidate_id == candidate_id
+        ).order_by(CandidateAttempt.attempt_number)
+    )).all()
     
     result = []
     for attempt in attempts:
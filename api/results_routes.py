@@ -3,9 +3,10 @@ Interview results routes
 Provides detailed interview results for candidates
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
+from core.database import get_async_read_db
 from core.models import User, Candidate
 from core.auth import require_admin, get_current_user
 
@@ -16,14 +17,14 @@ router = APIRouter(prefix="/interview", tags=["Interview Results"])
 async def get_interview_results(
     candidate_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get detailed interview results for a candidate
     Accessible by admins or the candidate themselves
     """
     # Fetch candidate
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    candidate = await db.scalar(select(Candidate).where(Candidate.id == candidate_id))
     
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
@@ -33,7 +34,7 @@ async def get_interview_results(
         raise HTTPException(status_code=403, detail="Not authorized to view these results")
     
     # Get user info
-    user = db.query(User).filter(User.id == candidate.user_id).first()
+    user = await db.scalar(select(User).where(User.id == candidate.user_id))
     
     # Calculate round percentages
     round_1_percentage = (candidate.round_1_score * 20) if candidate.round_1_score else None  # Out of 5 -> percentage
@@ -1,114 +1,441 @@
 """
 WebSocket handler for real-time speech-to-speech interview
 """
-import os
+import time
 import asyncio
-import tempfile
 import json
+import secrets
+import uuid
 import base64
+from contextlib import contextmanager
 from pathlib import Path
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Dict
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
 import sys
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.interview_agent import InterviewAgent
-from core.audio_services import AudioProcessor
-from core.database import SessionLocal
+from core.interview_agent import InterviewAgent, InterviewState
+from core.audio_services import (
+    AudioProcessor,
+    IncrementalTranscriber,
+    SentenceSpeechPipeline,
+)
+from core.audio_codecs import playback_seconds
+from core.intro_pool import intro_pool
+from core.admission import interview_admission
+from core.session_store import save_checkpoint, load_checkpoint, delete_checkpoint
+from core.metrics import stage_metrics
+from core.speculation import SPECULATIVE_QUESTIONS, SpeculativeQuestion
+from api.audio_protocol import (
+    PROTOCOL_V1,
+    PROTOCOL_V2,
+    DEFAULT_CODEC,
+    FRAME_REPLY,
+    FRAME_SEGMENT,
+    negotiate,
+    pack_audio_frame,
+)
+from sqlalchemy import select
+from core.database import AsyncSessionLocal
 from core.models import Candidate, User
 from core.auth import verify_token
+from core.dashboard_events import publish_candidate_change
 from api.logger import logger
 
+# Extra time allowed past the estimated playback length of the final reply
+PLAYBACK_GRACE_SECONDS = 1.0
+
+# Reply to a turn with no detected speech; no LLM call is made for it
+REPEAT_PROMPT = "Sorry, I didn't catch that. Could you please repeat your answer?"
+
 
 class InterviewSession:
     """Manages a single interview session"""
     
-    def __init__(self, session_id: str, job_role: str = "Software Engineer"):
+    def __init__(
+        self,
+        session_id: str,
+        job_role: str = "Software Engineer",
+        streaming: bool = False,
+        speculative: bool = SPECULATIVE_QUESTIONS
+    ):
         """
         Initialize interview session
         
         Args:
             session_id: Unique session identifier
             job_role: Role being interviewed for
+            streaming: Stream reply audio as binary frames instead of one base64 JSON payload
+            speculative: Prefetch the next question while the candidate is answering
         """
         self.session_id = session_id
         self.job_role = job_role
+        self.streaming = streaming
+        self.speculative = speculative
         self.agent = InterviewAgent(job_role=job_role)
         self.audio_processor = AudioProcessor()
         self.is_active = True
         self.conversation_log = []
+        self.incoming_answer: Optional[IncrementalTranscriber] = None
+        self.discarded_answer: Optional[str] = None  # Why the chunked answer in progress is dropped
+        self.user_id: Optional[int] = None
+        self.resume_token = secrets.token_urlsafe(24)
+        self.turn = 0
+        self.reply = 0  # Interviewer replies sent, numbering v2 audio frames
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        self.protocol = PROTOCOL_V1
+        self.codec = DEFAULT_CODEC
+        self.turn_timings: List[Dict[str, float]] = []
+        self._turn_timing: Optional[Dict[str, float]] = None
+        self._turn_started = 0.0
+        self._speculation: Optional[SpeculativeQuestion] = None
+    
+    @classmethod
+    def from_checkpoint(cls, checkpoint: Dict) -> "InterviewSession":
+        """
+        Rehydrate a session from a stored checkpoint without regenerating anything
+        
+        Args:
+            checkpoint: Checkpoint dict from core.session_store.load_checkpoint
+            
+        Returns:
+            Interview session positioned where the checkpoint was taken
+        """
+        session = cls(
+            checkpoint["session_id"],
+            checkpoint["job_role"],
+            streaming=bool(checkpoint["streaming"]),
+            speculative=bool(checkpoint["speculative"])
+        )
+        session.user_id = checkpoint["user_id"]
+        session.resume_token = checkpoint["resume_token"]
+        session.turn = checkpoint["turn"]
+        session.agent.state = InterviewState.model_validate_json(checkpoint["state"])
+        session.conversation_log = json.loads(checkpoint["conversation_log"])
+        session.reply = sum(1 for entry in session.conversation_log if entry["role"] == "interviewer")
+        return session
     
-    async def start_interview(self) -> str:
+    def use_protocol(self, protocol: int, codec: str):
+        """
+        Apply the negotiated protocol and synthesize replies in its codec
+        
+        Args:
+            protocol: PROTOCOL_V1 or PROTOCOL_V2
+            codec: Audio codec MIME type
+        """
+        self.protocol = protocol
+        self.codec = codec
+        self.audio_processor.tts.codec = codec
+    
+    def audio_frame(self, audio: bytes, kind: int, index: int = 0, final: bool = True) -> bytes:
+        """
+        Encode reply audio for a binary WebSocket frame
+        
+        Args:
+            audio: Raw audio bytes
+            kind: FRAME_REPLY or FRAME_SEGMENT
+            index: Segment index within the reply
+            final: Whether this is the last frame of the reply
+            
+        Returns:
+            Raw audio (protocol v1) or header plus audio (protocol v2)
+        """
+        if self.protocol != PROTOCOL_V2:
+            return audio
+        return pack_audio_frame(audio, self.codec, kind, self.reply, index, final)
+    
+    def start_turn(self):
+        """Start timing a turn (from receiving the answer to sending the reply)"""
+        self._turn_timing = {}
+        self._turn_started = time.perf_counter()
+    
+    def end_turn(self):
+        """Finish timing the current turn and keep its stage breakdown"""
+        if self._turn_timing is None:
+            return
+        self.record_stage("turn", time.perf_counter() - self._turn_started)
+        timing = {stage: round(seconds, 4) for stage, seconds in self._turn_timing.items()}
+        self.turn_timings.append({"turn": self.turn, **timing})
+        self._turn_timing = None
+    
+    def record_stage(self, stage: str, seconds: float):
+        """
+        Record a stage duration for this turn and the process-wide histograms
+        
+        Args:
+            stage: Stage name ("stt", "llm", "tts", "first_audio", "send", "turn")
+            seconds: Measured duration
+        """
+        stage_metrics.observe(stage, self.job_role, seconds)
+        if self._turn_timing is not None:
+            self._turn_timing[stage] = self._turn_timing.get(stage, 0.0) + seconds
+    
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as one stage of the current turn"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, time.perf_counter() - start)
+    
+    def checkpoint(self):
+        """
+        Persist session state in the background
+        
+        Waits for scores still being computed so they are included, and
+        chains on the previous checkpoint so writes land in order.
+        """
+        previous = self._checkpoint_task
+        
+        async def _save():
+            if previous is not None:
+                await previous
+            await self.agent.wait_for_scores()
+            await asyncio.to_thread(save_checkpoint, {
+                "session_id": self.session_id,
+                "resume_token": self.resume_token,
+                "user_id": self.user_id,
+                "job_role": self.job_role,
+                "streaming": self.streaming,
+                "speculative": self.speculative,
+                "turn": self.turn,
+                "state": self.agent.state.model_dump_json(),
+                "conversation_log": json.dumps(self.conversation_log),
+            })
+        
+        self._checkpoint_task = asyncio.create_task(_save())
+    
+    async def discard_checkpoint(self):
+        """Remove the checkpoint once the interview has finished"""
+        if self._checkpoint_task is not None:
+            await self._checkpoint_task
+        await asyncio.to_thread(delete_checkpoint, self.session_id)
+    
+    async def start_interview(
+        self,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> tuple[Optional[bytes], str]:
         """
         Start the interview and get introduction audio
         
+        Args:
+            on_delta: Optional callback receiving the introduction as it streams in
+            
         Returns:
-            Path to introduction audio file
+            Tuple of (intro_audio, intro_text). The audio is None in streaming
+            mode, where it is synthesized while the text is being generated.
         """
         # Get introduction text from agent
-        intro_text = self.agent.get_introduction()
+        with self.timed("llm"):
+            intro_text = await self.agent.aget_introduction(on_delta)
+        self._log_introduction(intro_text)
         
-        # Log conversation
+        # Generate speech (streaming sessions synthesize while generating)
+        audio = None
+        if not self.streaming:
+            with self.timed("tts"):
+                audio = await self.audio_processor.generate_speech_response(intro_text)
+        
+        return audio, intro_text
+    
+    def take_pooled_introduction(self) -> Optional[tuple[bytes, str]]:
+        """
+        Start the interview with a pre-generated introduction if one is ready
+        
+        Returns:
+            Tuple of (intro_audio, intro_text), or None if the pool has no
+            introduction for this role yet (start_interview should be used)
+        """
+        pooled = intro_pool.take(self.job_role, self.codec)
+        if pooled is None:
+            return None
+        
+        intro_text, intro_audio = pooled
+        self._log_introduction(intro_text)
+        return intro_audio, intro_text
+    
+    def _log_introduction(self, intro_text: str):
+        """Log conversation"""
         self.conversation_log.append({
             "role": "interviewer",
             "text": intro_text,
             "stage": "introduction"
         })
-        
-        # Generate speech
-        audio_path = await self.audio_processor.generate_speech_response(intro_text)
-        
-        return audio_path, intro_text
     
-    async def process_candidate_audio(self, audio_data: bytes) -> tuple[str, str]:
+    async def transcribe_candidate_audio(self, audio_data: bytes) -> str:
         """
-        Process candidate's audio response
+        Transcribe and log the candidate's audio response
         
         Args:
             audio_data: Raw audio bytes
             
         Returns:
-            Tuple of (response_audio_path, response_text)
+            Transcript, empty if no speech was detected
+        """
+        with self.timed("stt"):
+            transcript = await self.audio_processor.transcribe_speech(audio_data)
+        self._log_candidate_response(transcript)
+        return transcript
+    
+    def begin_answer(self):
+        """Start buffering a chunked answer, transcribing segments as they fill"""
+        self.cancel_answer()
+        self.discarded_answer = None
+        self.incoming_answer = IncrementalTranscriber(self.audio_processor.transcribe_speech)
+    
+    async def finish_answer(self) -> str:
         """
-        # Save audio to temp file
-        temp_audio = tempfile.NamedTemporaryFile(delete=False, suffix=".webm")
-        temp_audio.write(audio_data)
-        temp_audio.close()
+        Finish a chunked answer and log its transcript
         
-        try:
-            # Transcribe audio
-            transcript = await self.audio_processor.stt.transcribe_audio_async(temp_audio.name)
-            
-            # Log candidate response
-            self.conversation_log.append({
-                "role": "candidate",
-                "text": transcript,
-                "stage": str(self.agent.state.stage)
-            })
-            
-            # Get agent response
-            response_text = self.agent.process_candidate_response(transcript)
-            
-            # Log interviewer response
-            self.conversation_log.append({
-                "role": "interviewer",
-                "text": response_text,
-                "stage": str(self.agent.state.stage)
-            })
+        Returns:
+            Transcript of the whole answer
+        """
+        answer, self.incoming_answer = self.incoming_answer, None
+        with self.timed("stt"):
+            transcript = await answer.finish()
+        self._log_candidate_response(transcript)
+        return transcript
+    
+    def cancel_answer(self):
+        """Drop a chunked answer in progress"""
+        if self.incoming_answer is not None:
+            self.incoming_answer.cancel()
+            self.incoming_answer = None
+    
+    def discard_answer(self, reason: str):
+        """
+        Drop a chunked answer in progress and ignore its remaining chunks
+        
+        The answer stays open until answer_end, so chunks still in flight
+        are not mistaken for complete single-blob answers.
+        
+        Args:
+            reason: Error reported to the candidate at answer_end
+        """
+        self.cancel_answer()
+        self.discarded_answer = reason
+    
+    def _log_candidate_response(self, transcript: str):
+        """Log candidate response (silent turns are not logged)"""
+        if not transcript.strip():
+            return
+        self.conversation_log.append({
+            "role": "candidate",
+            "text": transcript,
+            "stage": str(self.agent.state.stage)
+        })
+    
+    async def respond_to_candidate(
+        self,
+        transcript: str,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> tuple[Optional[bytes], str]:
+        """
+        Generate and log the interviewer's reply to a transcript
+        
+        Args:
+            transcript: What the candidate said
+            on_delta: Optional callback receiving the reply as it streams in
             
-            # Generate speech response
-            response_audio_path = await self.audio_processor.generate_speech_response(response_text)
+        Returns:
+            Tuple of (response_audio, response_text). The audio is None in
+            streaming mode.
+        """
+        # Get agent response
+        with self.timed("llm"):
+            response_text = await self.agent.aprocess_candidate_response(transcript, on_delta)
+        
+        # Log interviewer response
+        self.conversation_log.append({
+            "role": "interviewer",
+            "text": response_text,
+            "stage": str(self.agent.state.stage)
+        })
+        
+        # Generate speech response (streaming sessions synthesize while generating)
+        response_audio = None
+        if not self.streaming:
+            with self.timed("tts"):
+                response_audio = await self.audio_processor.generate_speech_response(response_text)
+        
+        return response_audio, response_text
+    
+    async def ask_to_repeat(self) -> tuple[bytes, str]:
+        """
+        Ask the candidate to repeat a turn that contained no speech
+        
+        The interview state does not advance, and the fixed prompt is
+        served from the TTS cache after its first synthesis.
+        
+        Returns:
+            Tuple of (response_audio, response_text)
+        """
+        with self.timed("tts"):
+            response_audio = await self.audio_processor.generate_speech_response(REPEAT_PROMPT)
+        return response_audio, REPEAT_PROMPT
+    
+    def speculate(self):
+        """
+        Start generating the next question and its audio in the background
+        
+        Does nothing unless speculative mode is on and the next reply is
+        going to be a question.
+        """
+        self.cancel_speculation()
+        if not self.speculative or not self.is_active:
+            return
+        
+        speculative = self.agent.speculative_question_prompt()
+        if speculative is None:
+            return
+        prompt, depends_on_answer = speculative
+        
+        async def _prefetch() -> tuple[str, Optional[bytes]]:
+            question_text = await self.agent.aprefetch_question(prompt)
+            question_audio = await self.audio_processor.generate_speech_response(question_text)
+            return question_text, question_audio
+        
+        self._speculation = SpeculativeQuestion(
+            prompt, depends_on_answer, self.turn, asyncio.create_task(_prefetch())
+        )
+    
+    async def take_speculative_reply(self, transcript: str) -> Optional[tuple[Optional[bytes], str]]:
+        """
+        Reply with the prefetched question if it fits the candidate's answer
+        
+        Args:
+            transcript: What the candidate said
             
-            return response_audio_path, response_text, transcript
+        Returns:
+            Tuple of (response_audio, response_text), or None if the reply
+            has to be generated (respond_to_candidate)
+        """
+        speculation, self._speculation = self._speculation, None
+        if speculation is None:
+            return None
         
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_audio.name)
-            except:
-                pass
+        with self.timed("llm"):
+            prefetched = await speculation.resolve(transcript, self.turn)
+        if prefetched is None:
+            return None
+        
+        question_text, question_audio = prefetched
+        response_text = self.agent.accept_prefetched_question(transcript, question_text)
+        self.conversation_log.append({
+            "role": "interviewer",
+            "text": response_text,
+            "stage": str(self.agent.state.stage)
+        })
+        return question_audio, response_text
+    
+    def cancel_speculation(self):
+        """Discard a speculative question in progress"""
+        if self._speculation is not None:
+            self._speculation.cancel()
+            self._speculation = None
     
     def get_interview_summary(self) -> Dict:
         """Get final interview summary with scores"""
@@ -121,7 +448,8 @@ class InterviewSession:
             "scores": scores,
             "total_questions": len(self.agent.state.responses),
             "conversation_log": self.conversation_log,
-            "stage": str(self.agent.state.stage)
+            "stage": str(self.agent.state.stage),
+            "turn_timings": self.turn_timings
         }
 
 
@@ -130,6 +458,242 @@ class WebSocketManager:
     
     def __init__(self):
         self.active_sessions: Dict[str, InterviewSession] = {}
+        self.connections: Dict[str, WebSocket] = {}
+    
+    async def register_session(self, websocket: WebSocket, session: InterviewSession):
+        """
+        Make a session the active one for its id
+        
+        A resume can arrive before the server notices the old connection
+        dropped. The earlier copy of the session is then stopped and its
+        connection closed, so its handler exits without touching the new one.
+        
+        Args:
+            websocket: Connection serving the session
+            session: Session to register
+        """
+        session_id = session.session_id
+        previous = self.active_sessions.get(session_id)
+        previous_socket = self.connections.get(session_id)
+        self.active_sessions[session_id] = session
+        self.connections[session_id] = websocket
+        
+        if previous is not None and previous is not session:
+            previous.is_active = False
+            previous.cancel_answer()
+            previous.cancel_speculation()
+        if previous_socket is not None and previous_socket is not websocket:
+            try:
+                await previous_socket.close(code=4001, reason="Session resumed on another connection")
+            except Exception as e:
+                logger.info(f"Superseded connection for {session_id} already closed: {e}")
+    
+    async def send_interviewer_response(
+        self,
+        websocket: WebSocket,
+        session: InterviewSession,
+        text: str,
+        audio: Optional[bytes],
+        stage: str
+    ) -> float:
+        """
+        Send a complete interviewer reply
+        
+        Protocol v1 embeds the audio base64-encoded in the JSON message.
+        Protocol v2 sends the JSON without audio, followed by one binary
+        frame carrying the raw audio.
+        
+        Args:
+            websocket: WebSocket connection
+            session: Interview session the reply belongs to
+            text: Reply text
+            audio: Synthesized audio in the session codec
+            stage: Interview stage to report to the client
+            
+        Returns:
+            Estimated playback length of the reply in seconds
+        """
+        session.reply += 1
+        audio = audio or b""
+        
+        with session.timed("send"):
+            if session.protocol == PROTOCOL_V2:
+                await websocket.send_json({
+                    "type": "interviewer_response",
+                    "text": text,
+                    "stage": stage,
+                    "audio_bytes": len(audio)
+                })
+                await websocket.send_bytes(session.audio_frame(audio, FRAME_REPLY))
+            else:
+                await websocket.send_json({
+                    "type": "interviewer_response",
+                    "text": text,
+                    "audio": base64.b64encode(audio).decode('utf-8'),
+                    "stage": stage
+                })
+        return playback_seconds(audio, session.codec)
+    
+    async def send_prepared_stream(
+        self,
+        websocket: WebSocket,
+        session: InterviewSession,
+        text: str,
+        audio: bytes
+    ) -> float:
+        """
+        Send already synthesized audio using the streaming message sequence
+        
+        Args:
+            websocket: WebSocket connection
+            session: Interview session the reply belongs to
+            text: Reply text
+            audio: Synthesized audio in the session codec
+            
+        Returns:
+            Estimated playback length of the reply in seconds
+        """
+        session.reply += 1
+        with session.timed("send"):
+            await websocket.send_json({
+                "type": "audio_start",
+                "format": session.codec
+            })
+            await websocket.send_json({
+                "type": "audio_segment",
+                "index": 0,
+                "text": text
+            })
+            await websocket.send_bytes(session.audio_frame(audio, FRAME_SEGMENT))
+            await websocket.send_json({
+                "type": "audio_end",
+                "text": text,
+                "stage": str(session.agent.state.stage),
+                "segments": 1,
+                "bytes": len(audio)
+            })
+        return playback_seconds(audio, session.codec)
+    
+    async def stream_interviewer_response(
+        self,
+        websocket: WebSocket,
+        session: InterviewSession,
+        generate: Callable[[Callable[[str], None]], Awaitable]
+    ) -> tuple[str, float]:
+        """
+        Generate an interviewer reply and stream its audio sentence by sentence
+        
+        LLM tokens are fed into a SentenceSpeechPipeline, so edge-tts starts on
+        the first sentence while the model is still writing the next one.
+        The client receives an ``audio_start`` marker, then for each sentence
+        an ``audio_segment`` message followed by its audio as binary frames,
+        and finally an ``audio_end`` marker with the full text. MP3 frames are
+        forwarded as edge-tts produces them (play or append them in order
+        until the next message); with Opus each sentence is one WebM file.
+        Under protocol v2 the reply ends with an empty frame flagged final.
+        
+        Args:
+            websocket: WebSocket connection
+            session: Interview session the reply belongs to
+            generate: Session coroutine function taking an ``on_delta`` callback
+                and returning a tuple whose last item is the reply text
+            
+        Returns:
+            Tuple of (response_text, estimated playback length in seconds)
+        """
+        session.reply += 1
+        pipeline = SentenceSpeechPipeline(session.audio_processor.tts)
+        
+        async def _produce():
+            try:
+                return await generate(pipeline.feed)
+            finally:
+                pipeline.close()
+        
+        await websocket.send_json({
+            "type": "audio_start",
+            "format": session.codec
+        })
+        
+        started = time.perf_counter()
+        producer = asyncio.create_task(_produce())
+        segment_count = 0
+        byte_count = 0
+        duration = 0.0
+        try:
+            async for sentence, chunks in pipeline.segments():
+                with session.timed("send"):
+                    await websocket.send_json({
+                        "type": "audio_segment",
+                        "index": segment_count,
+                        "text": sentence
+                    })
+                segment_audio = bytearray()
+                async for chunk in chunks:
+                    if byte_count == 0:
+                        # Time to first audio: what the candidate actually waits for
+                        session.record_stage("first_audio", time.perf_counter() - started)
+                    with session.timed("send"):
+                        await websocket.send_bytes(
+                            session.audio_frame(chunk, FRAME_SEGMENT, index=segment_count, final=False)
+                        )
+                    byte_count += len(chunk)
+                    segment_audio.extend(chunk)
+                duration += playback_seconds(bytes(segment_audio), session.codec)
+                segment_count += 1
+            
+            result = await producer
+        except BaseException:
+            producer.cancel()
+            pipeline.cancel()
+            raise
+        
+        if session.protocol == PROTOCOL_V2:
+            # Segment lengths are not known up front, so an empty frame marks the end
+            with session.timed("send"):
+                await websocket.send_bytes(
+                    session.audio_frame(b"", FRAME_SEGMENT, index=max(segment_count - 1, 0), final=True)
+                )
+        
+        response_text = result[-1]
+        await websocket.send_json({
+            "type": "audio_end",
+            "text": response_text,
+            "stage": str(session.agent.state.stage),
+            "segments": segment_count,
+            "bytes": byte_count
+        })
+        return response_text, duration
+    
+    async def wait_for_playback(self, websocket: WebSocket, duration: float):
+        """
+        Wait until the client reports the last reply has finished playing
+        
+        Clients send ``{"type": "playback_complete"}`` when playback ends.
+        Clients that never send it are released once the reply's estimated
+        duration has elapsed, so the final message is never cut off.
+        
+        Args:
+            websocket: WebSocket connection
+            duration: Estimated playback length of the reply in seconds
+        """
+        async def _receive_ack():
+            while True:
+                message = await websocket.receive()
+                if message.get("type") == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
+                if "text" in message and message["text"]:
+                    data = json.loads(message["text"])
+                    if data.get("type") == "playback_complete":
+                        return
+        
+        try:
+            await asyncio.wait_for(
+                _receive_ack(),
+                timeout=duration + PLAYBACK_GRACE_SECONDS
+            )
+        except asyncio.TimeoutError:
+            pass
     
     async def handle_interview_connection(self, websocket: WebSocket):
         """
@@ -141,6 +705,8 @@ class WebSocketManager:
         await websocket.accept()
         
         session_id = None
+        session = None
+        admitted_at = None
         
         try:
             # Wait for initialization message
@@ -153,54 +719,120 @@ class WebSocketManager:
                 })
                 return
             
-            # Create new session
-            session_id = init_message.get("session_id", f"session_{id(websocket)}")
-            job_role = init_message.get("job_role", "Software Engineer")
+            # Wait for a free session slot, keeping the client informed
+            async def _notify_queued(position: int, eta_seconds: float):
+                await websocket.send_json({
+                    "type": "queued",
+                    "position": position,
+                    "eta_seconds": round(eta_seconds)
+                })
             
-            session = InterviewSession(session_id, job_role)
+            waited = await interview_admission.acquire(_notify_queued)
+            admitted_at = time.monotonic()
+            if waited > 0:
+                await websocket.send_json({
+                    "type": "admitted",
+                    "waited_seconds": round(waited, 1)
+                })
             
             # Try to get user ID from token if provided
+            user_id = None
             token = init_message.get("token")
             if token:
                 try:
                     payload = verify_token(token)
-                    session.user_id = payload.get("user_id")
+                    user_id = payload.get("user_id")
                 except Exception as e:
                     logger.error(f"Could not decode token: {e}")
-                    session.user_id = None
-            else:
-                session.user_id = None
             
-            self.active_sessions[session_id] = session
+            protocol, codec = negotiate(init_message)
             
-            # Start interview
-            intro_audio_path, intro_text = await session.start_interview()
-            
-            # Read audio file and send
-            with open(intro_audio_path, "rb") as f:
-                audio_bytes = f.read()
-            
-            # Send introduction
-            await websocket.send_json({
-                "type": "interviewer_response",
-                "text": intro_text,
-                "audio": base64.b64encode(audio_bytes).decode('utf-8'),
-                "stage": "introduction"
-            })
+            if init_message.get("resume"):
+                # Rehydrate a dropped session from its last checkpoint
+                checkpoint = await asyncio.to_thread(
+                    load_checkpoint,
+                    init_message.get("session_id", ""),
+                    init_message.get("resume_token", "")
+                )
+                if checkpoint is None or (user_id is not None and checkpoint["user_id"] not in (None, user_id)):
+                    await websocket.send_json({
+                        "type": "error",
+                        "message": "Session cannot be resumed"
+                    })
+                    return
+                
+                session = InterviewSession.from_checkpoint(checkpoint)
+                session.use_protocol(protocol, codec)
+                session_id = session.session_id
+                await self.register_session(websocket, session)
+                
+                last_reply = next(
+                    (entry["text"] for entry in reversed(session.conversation_log) if entry["role"] == "interviewer"),
+                    None
+                )
+                await websocket.send_json({
+                    "type": "resumed",
+                    "session_id": session_id,
+                    "stage": str(session.agent.state.stage),
+                    "last_interviewer_text": last_reply,
+                    "protocol": session.protocol,
+                    "codec": session.codec
+                })
+                session.speculate()
             
-            # Clean up intro audio with proper error handling
-            await asyncio.sleep(0.5)  # Give time for file to be fully released
-            try:
-                if os.path.exists(intro_audio_path):
-                    os.unlink(intro_audio_path)
-            except Exception as e:
-                logger.warning(f"Warning: Could not delete intro audio file: {e}")
-                # Don't crash on cleanup errors
+            else:
+                # Create new session (the id is the checkpoint key, so it is never client-chosen)
+                session_id = f"session_{uuid.uuid4().hex}"
+                job_role = init_message.get("job_role", "Software Engineer")
+                
+                streaming = bool(init_message.get("streaming", False))
+                speculative = bool(init_message.get("speculative", SPECULATIVE_QUESTIONS))
+                
+                session = InterviewSession(session_id, job_role, streaming=streaming, speculative=speculative)
+                session.user_id = user_id
+                session.use_protocol(protocol, codec)
+                
+                await self.register_session(websocket, session)
+                
+                # Tell the client how to resume if the connection drops
+                await websocket.send_json({
+                    "type": "session",
+                    "session_id": session_id,
+                    "resume_token": session.resume_token,
+                    "protocol": session.protocol,
+                    "codec": session.codec
+                })
+                
+                # Start interview and send introduction, instantly if one is pre-generated
+                session.start_turn()
+                pooled_intro = session.take_pooled_introduction()
+                if pooled_intro is not None:
+                    intro_audio, intro_text = pooled_intro
+                    if session.streaming:
+                        await self.send_prepared_stream(websocket, session, intro_text, intro_audio)
+                    else:
+                        await self.send_interviewer_response(
+                            websocket, session, intro_text, intro_audio, "introduction"
+                        )
+                elif session.streaming:
+                    await self.stream_interviewer_response(websocket, session, session.start_interview)
+                else:
+                    intro_audio, intro_text = await session.start_interview()
+                    await self.send_interviewer_response(
+                        websocket, session, intro_text, intro_audio, "introduction"
+                    )
+                
+                session.end_turn()
+                session.checkpoint()
+                session.speculate()
             
             # Main interview loop
             while session.is_active:
                 # Receive message from client
                 message = await websocket.receive()
+                if self.active_sessions.get(session_id) is not session:
+                    # Resumed on another connection; that handler owns the session now
+                    break
                 
                 if "text" in message:
                     # Text message (control messages)
@@ -208,16 +840,63 @@ class WebSocketManager:
                     
                     if data.get("type") == "end_interview":
                         session.is_active = False
+                        await session.agent.wait_for_scores()
+                        await session.discard_checkpoint()
                         summary = session.get_interview_summary()
                         await websocket.send_json({
                             "type": "interview_complete",
                             "summary": summary
                         })
                         break
+                    
+                    elif data.get("type") == "answer_start":
+                        # Chunked answer: audio frames follow until answer_end
+                        session.begin_answer()
+                        continue
+                    
+                    elif data.get("type") == "answer_end":
+                        if session.discarded_answer is not None:
+                            # One error and a repeat prompt for the whole dropped answer
+                            reason, session.discarded_answer = session.discarded_answer, None
+                            session.start_turn()
+                            await websocket.send_json({
+                                "type": "error",
+                                "message": reason
+                            })
+                            transcript = ""
+                        elif session.incoming_answer is None:
+                            continue
+                        else:
+                            session.start_turn()
+                            
+                            # Send processing status
+                            await websocket.send_json({
+                                "type": "status",
+                                "message": "Processing your response..."
+                            })
+                            
+                            # Only the tail is left to transcribe at this point
+                            transcript = await session.finish_answer()
+                    
+                    else:
+                        continue
                 
                 elif "bytes" in message:
-                    # Audio data from candidate
+                    if session.discarded_answer is not None:
+                        # Rest of an answer that was already dropped
+                        continue
+                    
+                    if session.incoming_answer is not None:
+                        # Chunk of an answer still being recorded
+                        try:
+                            await session.incoming_answer.add_chunk(message["bytes"])
+                        except ValueError as e:
+                            session.discard_answer(str(e))
+                        continue
+                    
+                    # Complete answer sent as a single blob
                     audio_data = message["bytes"]
+                    session.start_turn()
                     
                     # Send processing status
                     await websocket.send_json({
@@ -225,112 +904,143 @@ class WebSocketManager:
                         "message": "Processing your response..."
                     })
                     
-                    # Process audio
-                    response_audio_path, response_text, transcript = await session.process_candidate_audio(audio_data)
+                    transcript = await session.transcribe_candidate_audio(audio_data)
+                
+                else:
+                    continue
+                
+                if not transcript.strip():
+                    # No speech detected: ask again without calling the LLM
+                    repeat_audio, repeat_text = await session.ask_to_repeat()
+                    if session.streaming:
+                        await self.send_prepared_stream(websocket, session, repeat_text, repeat_audio)
+                    else:
+                        await self.send_interviewer_response(
+                            websocket, session, repeat_text, repeat_audio,
+                            str(session.agent.state.stage)
+                        )
+                    session.end_turn()
+                    continue
+                
+                # Send candidate's transcript first (fix ordering bug)
+                await websocket.send_json({
+                    "type": "candidate_transcript",
+                    "transcript": transcript,
+                    "stage": str(session.agent.state.stage)
+                })
+                
+                prefetched = await session.take_speculative_reply(transcript)
+                if prefetched is not None:
+                    # The question prefetched during the answer fits; send it as is
+                    response_audio, response_text = prefetched
+                    if session.streaming:
+                        response_playback_seconds = await self.send_prepared_stream(
+                            websocket, session, response_text, response_audio or b""
+                        )
+                    else:
+                        response_playback_seconds = await self.send_interviewer_response(
+                            websocket, session, response_text, response_audio,
+                            str(session.agent.state.stage)
+                        )
+                elif session.streaming:
+                    # Stream the reply while it is being generated
+                    response_text, response_playback_seconds = await self.stream_interviewer_response(
+                        websocket, session,
+                        lambda on_delta: session.respond_to_candidate(transcript, on_delta)
+                    )
+                else:
+                    response_audio, response_text = await session.respond_to_candidate(transcript)
+                    response_playback_seconds = await self.send_interviewer_response(
+                        websocket, session, response_text, response_audio,
+                        str(session.agent.state.stage)
+                    )
+                
+                # Persist the turn so a dropped connection can resume here
+                session.turn += 1
+                session.end_turn()
+                session.checkpoint()
+                
+                # Start on the next question while the candidate answers
+                if session.agent.state.stage.value != "conclusion":
+                    session.speculate()
+                
+                # Check if interview is complete
+                if session.agent.state.stage.value == "conclusion":
+                    session.is_active = False
+                    await session.discard_checkpoint()
+                    summary = session.get_interview_summary()
                     
-                    # FIRST: Send candidate's transcript (fix ordering bug)
-                    await websocket.send_json({
-                        "type": "candidate_transcript",
-                        "transcript": transcript,
-                        "stage": str(session.agent.state.stage)
-                    })
+                    # Save Round 3 score to database
+                    try:
+                        # Get token from init message (we'll need to store it)
+                        if hasattr(session, 'user_id') and session.user_id:
+                            db = AsyncSessionLocal()
+                            try:
+                                candidate = await db.scalar(
+                                    select(Candidate).where(Candidate.user_id == session.user_id)
+                                )
+                                
+                                if candidate:
+                                    # Calculate overall score from the summary
+                                    scores = summary.get('scores', {})
+                                    logger.debug(f"DEBUG: Full interview summary: {json.dumps(summary, indent=2)}")
+                                    logger.debug(f"DEBUG: Scores object: {scores}")
+                                    
+                                    # Try different possible score keys
+                                    overall_score = 0
+                                    
+                                    # Method 1: Direct overall/overall_score key
+                                    if 'overall' in scores:
+                                        overall_score = scores['overall']
+                                    elif 'overall_score' in scores:
+                                        overall_score = scores['overall_score']
+                                    # Method 2: Calculate from component scores
+                                    elif isinstance(scores, dict) and len(scores) > 0:
+                                        # Extract numeric scores
+                                        numeric_scores = []
+                                        for key, value in scores.items():
+                                            if isinstance(value, (int, float)) and value >= 0:
+                                                numeric_scores.append(value)
+                                        
+                                        if numeric_scores:
+                                            overall_score = sum(numeric_scores) / len(numeric_scores)
+                                            print(f"DEBUG: Calculated from components: {numeric_scores} → {overall_score}")
+                                    
+                                    # Ensure score is in valid range
+                                    overall_score = max(0, min(100, overall_score))
+                                    
+                                    logger.debug(f"DEBUG: Final overall score to save: {overall_score}")
+                                    
+                                    # Save Round 3 score
+                                    candidate.round_3_score = int(overall_score)
+                                    candidate.round_3_analysis = json.dumps(scores)
+                                    candidate.current_round = 3
+                                    candidate.overall_status = "completed"
+                                    
+                                    await db.commit()
+                                    await publish_candidate_change(db, candidate, "interview_completed")
+                                logger.info(f"✅ Saved Round 3 score: {overall_score}% for candidate {candidate.id}")
+                            except Exception as db_error:
+                                logger.error(f"❌ Database error saving score: {db_error}")
+                                import traceback
+                                logger.error(traceback.format_exc())
+                                await db.rollback()
+                            finally:
+                                await db.close()
+                    except Exception as e:
+                        logger.error(f"❌ Error saving interview score: {e}")
+                        import traceback
+                        logger.error(traceback.format_exc())
                     
-                    # THEN: Read and send AI response
-                    with open(response_audio_path, "rb") as f:
-                        response_audio_bytes = f.read()
+                    # Wait for final audio to finish playing before sending complete message
+                    # This prevents the thank you message from being cut off
+                    await self.wait_for_playback(websocket, response_playback_seconds)
                     
-                    # Send AI response
                     await websocket.send_json({
-                        "type": "interviewer_response",
-                        "text": response_text,
-                        "audio": base64.b64encode(response_audio_bytes).decode('utf-8'),
-                        "stage": str(session.agent.state.stage)
+                        "type": "interview_complete",
+                        "summary": summary
                     })
-                    
-                    # Clean up audio file with proper error handling
-                    await asyncio.sleep(0.5)  # Give time for file to be fully released
-                    try:
-                        if os.path.exists(response_audio_path):
-                            os.unlink(response_audio_path)
-                    except Exception as e:
-                        logger.warning(f"Warning: Could not delete response audio file: {e}")
-                        # Don't crash on cleanup errors
-                    
-                    # Check if interview is complete
-                    if session.agent.state.stage.value == "conclusion":
-                        session.is_active = False
-                        summary = session.get_interview_summary()
-                        
-                        # Save Round 3 score to database
-                        try:
-                            # Get token from init message (we'll need to store it)
-                            if hasattr(session, 'user_id') and session.user_id:
-                                db = SessionLocal()
-                                try:
-                                    candidate = db.query(Candidate).filter(
-                                        Candidate.user_id == session.user_id
-                                    ).first()
-                                    
-                                    if candidate:
-                                        # Calculate overall score from the summary
-                                        scores = summary.get('scores', {})
-                                        logger.debug(f"DEBUG: Full interview summary: {json.dumps(summary, indent=2)}")
-                                        logger.debug(f"DEBUG: Scores object: {scores}")
-                                        
-                                        # Try different possible score keys
-                                        overall_score = 0
-                                        
-                                        # Method 1: Direct overall/overall_score key
-                                        if 'overall' in scores:
-                                            overall_score = scores['overall']
-                                        elif 'overall_score' in scores:
-                                            overall_score = scores['overall_score']
-                                        # Method 2: Calculate from component scores
-                                        elif isinstance(scores, dict) and len(scores) > 0:
-                                            # Extract numeric scores
-                                            numeric_scores = []
-                                            for key, value in scores.items():
-                                                if isinstance(value, (int, float)) and value >= 0:
-                                                    numeric_scores.append(value)
-                                            
-                                            if numeric_scores:
-                                                overall_score = sum(numeric_scores) / len(numeric_scores)
-                                                print(f"DEBUG: Calculated from components: {numeric_scores} → {overall_score}")
-                                        
-                                        # Ensure score is in valid range
-                                        overall_score = max(0, min(100, overall_score))
-                                        
-                                        logger.debug(f"DEBUG: Final overall score to save: {overall_score}")
-                                        
-                                        # Save Round 3 score
-                                        candidate.round_3_score = int(overall_score)
-                                        candidate.round_3_analysis = json.dumps(scores)
-                                        candidate.current_round = 3
-                                        candidate.overall_status = "completed"
-                                        
-                                        db.commit()
-                                    logger.info(f"✅ Saved Round 3 score: {overall_score}% for candidate {candidate.id}")
-                                except Exception as db_error:
-                                    logger.error(f"❌ Database error saving score: {db_error}")
-                                    import traceback
-                                    logger.error(traceback.format_exc())
-                                    db.rollback()
-                                finally:
-                                    db.close()
-                        except Exception as e:
-                            logger.error(f"❌ Error saving interview score: {e}")
-                            import traceback
-                            logger.error(traceback.format_exc())
-                        
-                        # Wait for final audio to finish playing before sending complete message
-                        # This prevents the thank you message from being cut off
-                        await asyncio.sleep(2)
-                        
-                        await websocket.send_json({
-                            "type": "interview_complete",
-                            "summary": summary
-                        })
-                        break
+                    break
         
         except WebSocketDisconnect:
             logger.info(f"WebSocket disconnected: {session_id}")
@@ -350,9 +1060,16 @@ class WebSocketManager:
                 logger.error("Could not send error message, WebSocket already closed")
         
         finally:
-            # Clean up session
-            if session_id and session_id in self.active_sessions:
+            # Clean up session, unless a resume on another connection has taken it over
+            if session is not None and self.active_sessions.get(session_id) is session:
+                session.cancel_answer()
+                session.cancel_speculation()
                 del self.active_sessions[session_id]
+                self.connections.pop(session_id, None)
+            
+            # Free the slot for the next queued client
+            if admitted_at is not None:
+                interview_admission.release(time.monotonic() - admitted_at)
 
 
 # Global manager instance
@@ -365,10 +1082,22 @@ async def interview_websocket_endpoint(websocket: WebSocket):
     
     Usage from client:
     1. Connect to WebSocket
-    2. Send init message: {"type": "init", "session_id": "...", "job_role": "..."}
+    2. Send init message: {"type": "init", "job_role": "...", "streaming": false}
+       Add "protocol": 2 and "codecs": [...] to receive audio as binary frames
+       (see api.audio_protocol) instead of base64 inside JSON
+       If the server is at capacity, receive {"type": "queued", "position": N, "eta_seconds": N}
+       updates until {"type": "admitted", "waited_seconds": N}
+       Receive {"type": "session", "session_id": "...", "resume_token": "..."}
+       After a dropped connection, reconnect with
+       {"type": "init", "resume": true, "session_id": "...", "resume_token": "..."}
+       and receive {"type": "resumed", ...} instead of a new introduction
     3. Receive introduction audio
-    4. Send audio chunks as binary data
-    5. Receive responses as JSON with audio
-    6. Send {"type": "end_interview"} to end
+    4. Send each answer as one binary message, or as {"type": "answer_start"},
+       binary chunks while recording, then {"type": "answer_end"}
+    5. Receive responses as JSON with audio, or with "streaming": true as an
+       audio_start message, an audio_segment message plus binary audio frames per
+       sentence (sent as they are synthesized), and an audio_end message
+    6. Send {"type": "playback_complete"} when a reply finishes playing
+    7. Send {"type": "end_interview"} to end
     """
     await websocket_manager.handle_interview_connection(websocket)
@@ -0,0 +1,109 @@
+"""
+Benchmark authenticated request throughput with and without the principal cache
+Serves the real quiz and dashboard routers in-process (httpx ASGITransport)
+against a seeded temporary database and sends concurrent authenticated
+requests from many candidates and a few admins: first with the cache in
+core/principal_cache.py disabled (a user lookup per request, the old
+behaviour), then enabled. Reports requests per second, latency percentiles
+and the cache hit rate.
+
+Usage: python benchmarks/bench_auth_cache.py [seconds] [clients] [users]
+"""
+import sys
+import time
+import random
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from fastapi import FastAPI
+
+from benchmarks.bench_db_async import CANDIDATES, percentile, seed
+from core import database
+from core.auth import create_access_token
+from core.migrations import migrate
+from core.principal_cache import AUTH_CACHE_TTL_SECONDS, principal_cache
+from api.quiz_routes import router as quiz_router
+from api.dashboard_routes import router as dashboard_router
+
+ADMIN_SHARE = 0.1
+
+
+async def run(app: FastAPI, cached: bool, seconds: float, clients: int, users: int) -> dict:
+    """Send requests from concurrent clients for a fixed time"""
+    principal_cache.clear()
+    principal_cache.ttl_seconds = AUTH_CACHE_TTL_SECONDS if cached else 0
+    principal_cache.hits = principal_cache.misses = 0
+
+    # Candidate users are ids 1..CANDIDATES, the admin is the last user
+    candidate_tokens = [create_access_token({"user_id": i}) for i in range(1, users + 1)]
+    admin_token = create_access_token({"user_id": CANDIDATES + 1})
+
+    deadline = time.perf_counter() + seconds
+    latencies: list[float] = []
+    errors = 0
+
+    async def client(http: httpx.AsyncClient):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            if random.random() < ADMIN_SHARE:
+                path, token = "/dashboard/stats", admin_token
+            else:
+                path, token = "/quiz/status", random.choice(candidate_tokens)
+            start = time.perf_counter()
+            response = await http.get(path, headers={"Authorization": f"Bearer {token}"})
+            latencies.append(time.perf_counter() - start)
+            errors += response.status_code != 200
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        await asyncio.gather(*(client(http) for _ in range(clients)))
+
+    return {
+        "requests_per_sec": len(latencies) / seconds,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "hit_rate": principal_cache.stats()["hit_rate"],
+        "errors": errors,
+    }
+
+
+async def main_async(seconds: float, clients: int, users: int):
+    db_path = Path(tempfile.mkdtemp(prefix="bench_auth_")) / "bench.db"
+    seed(db_path)
+
+    # Point the app's sessions at the benchmark database
+    sync_engine, write_engine, read_engine = database.create_engines(db_path)
+    migrate(sync_engine)
+    database.AsyncSessionLocal.configure(bind=write_engine)
+    database.AsyncReadSessionLocal.configure(bind=read_engine)
+
+    app = FastAPI()
+    app.include_router(quiz_router)
+    app.include_router(dashboard_router)
+
+    print(f"Authenticated requests: {clients} clients, {users} candidates, {seconds:.0f}s per mode")
+    print(f"{'cache':<6} {'req/s':>8} {'p50':>8} {'p95':>8} {'hit rate':>9} {'errors':>7}")
+    for cached in (False, True):
+        r = await run(app, cached, seconds, clients, users)
+        print(f"{'on' if cached else 'off':<6} {r['requests_per_sec']:>8.1f} {r['p50_ms']:>6.2f}ms"
+              f" {r['p95_ms']:>6.2f}ms {r['hit_rate']:>9.1%} {r['errors']:>7}")
+
+    await write_engine.dispose()
+    await read_engine.dispose()
+    sync_engine.dispose()
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    users = int(sys.argv[3]) if len(sys.argv) > 3 else 500
+    asyncio.run(main_async(seconds, clients, min(users, CANDIDATES)))
+
+
+if __name__ == "__main__":
+    main()
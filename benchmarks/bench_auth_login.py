@@ -0,0 +1,128 @@
+"""
+Benchmark logins per second and event-loop lag during a login storm
+Serves the real auth router in-process (httpx ASGITransport) against a
+temporary database of users with real bcrypt hashes, and runs concurrent
+login clients next to simulated interview sessions that tick every 20 ms
+like an audio stream. Their tick lateness is the lag a live interview on
+the same worker would feel. Runs twice: bcrypt on the event loop (the old
+behaviour, PasswordExecutor with 0 workers), then on the dedicated pool.
+
+Usage: python benchmarks/bench_auth_login.py [seconds] [login_clients] [interviews]
+"""
+import sys
+import time
+import random
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.bench_db_async import TICK_SECONDS, percentile
+from core import auth, database
+from core.database import Base
+from core.models import User, Candidate
+from api.auth_routes import router as auth_router
+
+USERS = 50
+PASSWORD = "correct horse battery staple"
+
+
+def seed(db_path: Path):
+    """Create users that share one real bcrypt hash"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    password_hash = auth.hash_password(PASSWORD)
+    db = sessionmaker(bind=engine)()
+    for i in range(USERS):
+        user = User(email=f"candidate{i}@example.com", name=f"Candidate {i}", password_hash=password_hash, role="candidate")
+        db.add(user)
+        db.add(Candidate(user=user, application_completed=True))
+    db.commit()
+    db.close()
+    engine.dispose()
+
+
+async def run(app: FastAPI, workers: int, seconds: float, clients: int, interviews: int) -> dict:
+    """Login storm plus ticking interviews with one executor configuration"""
+    auth.password_executor = auth.PasswordExecutor(workers=workers, max_queued=clients)
+
+    deadline = time.perf_counter() + seconds
+    login_latencies: list[float] = []
+    tick_lag: list[float] = []
+    failures = 0
+
+    async def login_client(http: httpx.AsyncClient):
+        nonlocal failures
+        while time.perf_counter() < deadline:
+            email = f"candidate{random.randrange(USERS)}@example.com"
+            start = time.perf_counter()
+            response = await http.post("/auth/login", json={"email": email, "password": PASSWORD})
+            login_latencies.append(time.perf_counter() - start)
+            failures += response.status_code != 200
+
+    async def interview():
+        while time.perf_counter() < deadline:
+            expected = time.perf_counter() + TICK_SECONDS
+            await asyncio.sleep(TICK_SECONDS)
+            tick_lag.append(max(0.0, time.perf_counter() - expected))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        await asyncio.gather(
+            *(login_client(http) for _ in range(clients)),
+            *(interview() for _ in range(interviews)),
+        )
+    auth.password_executor.shutdown()
+
+    return {
+        "logins_per_sec": len(login_latencies) / seconds,
+        "login_p50_ms": percentile(login_latencies, 0.5) * 1000,
+        "login_p99_ms": percentile(login_latencies, 0.99) * 1000,
+        "lag_p50_ms": percentile(tick_lag, 0.5) * 1000,
+        "lag_p99_ms": percentile(tick_lag, 0.99) * 1000,
+        "failures": failures,
+    }
+
+
+async def main_async(seconds: float, clients: int, interviews: int):
+    db_path = Path(tempfile.mkdtemp(prefix="bench_login_")) / "bench.db"
+    seed(db_path)
+
+    # Point the app's sessions at the benchmark database
+    sync_engine, write_engine, read_engine = database.create_engines(db_path)
+    sync_engine.connect().close()  # Switch the file to WAL before readers open it
+    database.AsyncSessionLocal.configure(bind=write_engine)
+    database.AsyncReadSessionLocal.configure(bind=read_engine)
+
+    app = FastAPI()
+    app.include_router(auth_router)
+
+    print(f"Login storm: {clients} clients, {interviews} interviews, bcrypt rounds {auth.BCRYPT_ROUNDS}, {seconds:.0f}s per mode")
+    print(f"{'bcrypt':<10} {'logins/s':>9} {'login p50':>10} {'login p99':>10} {'lag p50':>9} {'lag p99':>9} {'failed':>7}")
+    for workers in (0, auth.PASSWORD_HASH_WORKERS):
+        r = await run(app, workers, seconds, clients, interviews)
+        mode = "loop" if workers == 0 else f"pool x{workers}"
+        print(f"{mode:<10} {r['logins_per_sec']:>9.1f} {r['login_p50_ms']:>8.1f}ms {r['login_p99_ms']:>8.1f}ms"
+              f" {r['lag_p50_ms']:>7.1f}ms {r['lag_p99_ms']:>7.1f}ms {r['failures']:>7}")
+
+    await write_engine.dispose()
+    await read_engine.dispose()
+    sync_engine.dispose()
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    interviews = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    asyncio.run(main_async(seconds, clients, interviews))
+
+
+if __name__ == "__main__":
+    main()
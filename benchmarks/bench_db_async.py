@@ -0,0 +1,186 @@
+"""
+Benchmark blocking vs async database access under mixed load
+Runs admin dashboard requests and interview sessions on one event loop
+against a seeded temporary SQLite database, first with the blocking
+Session used inside coroutines (the old behaviour), then with the
+aiosqlite-backed AsyncSession the routes now use. Interview sessions tick
+every 20 ms like an audio stream and occasionally save a score; their
+tick lateness is the event loop lag a live interview would feel.
+
+Usage: python benchmarks/bench_db_async.py [seconds] [dashboard_clients] [interviews]
+"""
+import sys
+import time
+import random
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import Response
+from sqlalchemy import create_engine, func
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.database import Base
+from core.models import User, Candidate
+from api.dashboard_routes import get_dashboard_stats, get_recent_candidates
+
+TICK_SECONDS = 0.02
+SCORE_EVERY_TICKS = 50
+CANDIDATES = 5000
+
+
+def seed(db_path: Path):
+    """Create the schema and a realistic number of candidates"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    for i in range(CANDIDATES):
+        user = User(email=f"candidate{i}@example.com", name=f"Candidate {i}", password_hash="x", role="candidate")
+        db.add(user)
+        db.flush()
+        db.add(Candidate(
+            user_id=user.id,
+            full_name=user.name,
+            role_applied_for="Software Engineer",
+            application_completed=random.random() < 0.8,
+            current_round=random.randint(0, 3),
+            round_3_score=random.randint(40, 95) if random.random() < 0.4 else None,
+        ))
+    db.add(User(email="admin@example.com", name="Admin", password_hash="x", role="admin"))
+    db.commit()
+    db.close()
+    engine.dispose()
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Percentile (0-1) of a list of samples"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def sync_dashboard(db) -> None:
+    """The dashboard queries as they ran before, on a blocking Session"""
+    db.query(Candidate).count()
+    db.query(Candidate).filter(Candidate.application_completed == True).count()
+    db.query(func.avg(Candidate.round_3_score)).filter(Candidate.round_3_score.isnot(None)).scalar()
+    db.query(Candidate).filter(Candidate.current_round > 0).count()
+    for candidate in db.query(Candidate).join(User).order_by(Candidate.updated_at.desc()).limit(10).all():
+        candidate.user.email
+
+
+def sync_save_score(db, candidate_id: int):
+    """Interview score write on a blocking Session"""
+    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    candidate.round_3_score = random.randint(40, 95)
+    db.commit()
+
+
+async def async_dashboard(db, admin: User) -> None:
+    """The ported dashboard routes on an AsyncSession"""
+    await get_dashboard_stats(current_user=admin, db=db)
+    await get_recent_candidates(response=Response(), current_user=admin, db=db, limit=10)
+
+
+async def async_save_score(db, candidate_id: int):
+    """Interview score write on an AsyncSession"""
+    candidate = await db.get(Candidate, candidate_id)
+    candidate.round_3_score = random.randint(40, 95)
+    await db.commit()
+
+
+async def run(mode: str, db_path: Path, seconds: float, dashboards: int, interviews: int) -> dict:
+    """Run the mixed workload in one mode and collect measurements"""
+    if mode == "sync":
+        engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+        factory = sessionmaker(bind=engine)
+    else:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+    admin = User(id=0, email="admin@example.com", role="admin")
+
+    deadline = time.perf_counter() + seconds
+    request_latencies: list[float] = []
+    tick_lag: list[float] = []
+    score_writes = 0
+
+    async def dashboard_client():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if mode == "sync":
+                db = factory()
+                try:
+                    sync_dashboard(db)
+                finally:
+                    db.close()
+            else:
+                async with factory() as db:
+                    await async_dashboard(db, admin)
+            request_latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0)
+
+    async def interview():
+        nonlocal score_writes
+        ticks = 0
+        while time.perf_counter() < deadline:
+            expected = time.perf_counter() + TICK_SECONDS
+            await asyncio.sleep(TICK_SECONDS)
+            tick_lag.append(max(0.0, time.perf_counter() - expected))
+            ticks += 1
+            if ticks % SCORE_EVERY_TICKS == 0:
+                candidate_id = random.randint(1, CANDIDATES)
+                if mode == "sync":
+                    db = factory()
+                    try:
+                        sync_save_score(db, candidate_id)
+                    finally:
+                        db.close()
+                else:
+                    async with factory() as db:
+                        await async_save_score(db, candidate_id)
+                score_writes += 1
+
+    await asyncio.gather(
+        *(dashboard_client() for _ in range(dashboards)),
+        *(interview() for _ in range(interviews)),
+    )
+
+    if mode == "sync":
+        engine.dispose()
+    else:
+        await engine.dispose()
+
+    return {
+        "requests_per_sec": len(request_latencies) / seconds,
+        "request_p50_ms": percentile(request_latencies, 0.5) * 1000,
+        "request_p95_ms": percentile(request_latencies, 0.95) * 1000,
+        "score_writes_per_sec": score_writes / seconds,
+        "lag_p50_ms": percentile(tick_lag, 0.5) * 1000,
+        "lag_p99_ms": percentile(tick_lag, 0.99) * 1000,
+        "lag_max_ms": max(tick_lag, default=0.0) * 1000,
+    }
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    dashboards = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    interviews = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    db_path = Path(tempfile.mkdtemp(prefix="bench_db_")) / "bench.db"
+    seed(db_path)
+
+    print(f"Mixed load: {dashboards} dashboard clients, {interviews} interviews, {seconds:.0f}s per mode")
+    print(f"{'mode':<7} {'req/s':>8} {'req p50':>9} {'req p95':>9} {'writes/s':>9} {'lag p50':>9} {'lag p99':>9} {'lag max':>9}")
+    for mode in ("sync", "async"):
+        r = asyncio.run(run(mode, db_path, seconds, dashboards, interviews))
+        print(f"{mode:<7} {r['requests_per_sec']:>8.1f} {r['request_p50_ms']:>7.1f}ms {r['request_p95_ms']:>7.1f}ms"
+              f" {r['score_writes_per_sec']:>9.1f} {r['lag_p50_ms']:>7.1f}ms {r['lag_p99_ms']:>7.1f}ms {r['lag_max_ms']:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark interview session setup time
+Compares building every client and agent per session (the old behaviour,
+reproduced by clearing the shared registry before each session) with
+reusing the process-wide clients from core.clients
+
+Usage: python benchmarks/bench_session_setup.py [iterations]
+No network access is needed; a placeholder GROQ_API_KEY is used if unset.
+"""
+import os
+import sys
+import time
+import statistics
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark-placeholder-key")
+
+from core.clients import clear_clients
+from api.websocket_handler import InterviewSession
+
+
+def time_setup(iterations: int, cold: bool) -> list[float]:
+    """Time InterviewSession construction in milliseconds"""
+    timings = []
+    for i in range(iterations):
+        if cold:
+            clear_clients()
+        start = time.perf_counter()
+        InterviewSession(f"bench_{i}", "Software Engineer")
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label: str, timings: list[float]):
+    """Print summary statistics for a run"""
+    ordered = sorted(timings)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(f"{label:<28} mean {statistics.mean(timings):8.3f} ms   "
+          f"p50 {statistics.median(timings):8.3f} ms   p95 {p95:8.3f} ms")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    # Warm imports so the first cold run is not dominated by module loading
+    time_setup(1, cold=True)
+
+    print(f"Interview session setup ({iterations} sessions)")
+    report("per-session clients (before)", time_setup(iterations, cold=True))
+    clear_clients()
+    time_setup(1, cold=False)
+    report("shared clients (after)", time_setup(iterations, cold=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark SQLite engine profiles under concurrent reads and writes
+Runs dashboard-style readers and interview score writers concurrently
+against a seeded temporary database for each engine profile from
+core.database.create_engines: "default" (rollback journal, one shared
+pool) and "wal" (WAL, tuned pragmas, read-only pool plus a single writer).
+Reports read and write throughput, latency and "database is locked" errors.
+
+Usage: python benchmarks/bench_sqlite_concurrency.py [seconds] [readers] [writers]
+"""
+import sys
+import time
+import random
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from benchmarks.bench_db_async import CANDIDATES, percentile, seed
+from core.database import create_engines
+from core.models import User, Candidate
+
+
+async def read_dashboard(db):
+    """Dashboard stats and recent candidates"""
+    await db.scalar(select(func.count(Candidate.id)))
+    await db.scalar(select(func.count(Candidate.id)).where(Candidate.application_completed == True))
+    await db.scalar(select(func.avg(Candidate.round_3_score)).where(Candidate.round_3_score.isnot(None)))
+    await db.scalar(select(func.count(Candidate.id)).where(Candidate.current_round > 0))
+    (await db.scalars(
+        select(Candidate).join(User).options(selectinload(Candidate.user))
+        .order_by(Candidate.updated_at.desc()).limit(10)
+    )).all()
+
+
+async def write_score(db):
+    """Save a Round 3 score"""
+    candidate = await db.get(Candidate, random.randint(1, CANDIDATES))
+    candidate.round_3_score = random.randint(40, 95)
+    candidate.current_round = 3
+    await db.commit()
+
+
+async def run(profile: str, seconds: float, readers: int, writers: int) -> dict:
+    """Run the concurrent workload against a fresh database with one profile"""
+    db_path = Path(tempfile.mkdtemp(prefix=f"bench_sqlite_{profile}_")) / "bench.db"
+    seed(db_path)
+
+    sync_engine, write_engine, read_engine = create_engines(db_path, profile)
+    sync_engine.connect().close()  # Switch the file to WAL before readers open it
+    write_factory = async_sessionmaker(write_engine, expire_on_commit=False)
+    read_factory = async_sessionmaker(read_engine, expire_on_commit=False)
+
+    deadline = time.perf_counter() + seconds
+    read_latencies: list[float] = []
+    write_latencies: list[float] = []
+    errors = {"locked": 0}
+
+    async def worker(factory, operation, latencies):
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                async with factory() as db:
+                    await operation(db)
+            except OperationalError as e:
+                if "locked" not in str(e):
+                    raise
+                errors["locked"] += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(
+        *(worker(read_factory, read_dashboard, read_latencies) for _ in range(readers)),
+        *(worker(write_factory, write_score, write_latencies) for _ in range(writers)),
+    )
+
+    await write_engine.dispose()
+    if read_engine is not write_engine:
+        await read_engine.dispose()
+    sync_engine.dispose()
+
+    return {
+        "reads_per_sec": len(read_latencies) / seconds,
+        "read_p95_ms": percentile(read_latencies, 0.95) * 1000,
+        "writes_per_sec": len(write_latencies) / seconds,
+        "write_p95_ms": percentile(write_latencies, 0.95) * 1000,
+        "locked_errors": errors["locked"],
+    }
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    writers = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+
+    print(f"SQLite concurrency: {readers} readers, {writers} writers, {seconds:.0f}s per profile")
+    print(f"{'profile':<8} {'reads/s':>9} {'read p95':>10} {'writes/s':>9} {'write p95':>10} {'locked':>7}")
+    for profile in ("default", "wal"):
+        r = asyncio.run(run(profile, seconds, readers, writers))
+        print(f"{profile:<8} {r['reads_per_sec']:>9.1f} {r['read_p95_ms']:>8.1f}ms"
+              f" {r['writes_per_sec']:>9.1f} {r['write_p95_ms']:>8.1f}ms {r['locked_errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Check that real agents build through the shared client registry
+Builds an InterviewAgent with its real agno agent factory (unlike the load
+test, which stubs _build_agent), so a factory that takes the registry lock
+again through get_groq_model would hang here. Each build runs on a worker
+thread with a timeout; a second agent for the same role must reuse the
+first one's cached agent and model.
+
+Usage: python benchmarks/check_agent_registry.py [timeout_seconds]
+Exits with status 1 if a build hangs or the agent is not shared.
+No network access is needed; a placeholder GROQ_API_KEY is used if unset.
+"""
+import os
+import sys
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark-placeholder-key")
+
+from core.clients import clear_clients
+from core.interview_agent import InterviewAgent
+
+
+def build(job_role: str, timeout: float):
+    """Build an InterviewAgent on a worker thread; None if it does not finish in time"""
+    built = []
+    worker = threading.Thread(target=lambda: built.append(InterviewAgent(job_role=job_role)), daemon=True)
+    worker.start()
+    worker.join(timeout)
+    return built[0] if built else None
+
+
+def main():
+    timeout = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    clear_clients()
+
+    first = build("Software Engineer", timeout)
+    if first is None:
+        print(f"FAIL: building an InterviewAgent did not finish within {timeout:.0f}s")
+        sys.exit(1)
+
+    second = build("Software Engineer", timeout)
+    if second is None:
+        print(f"FAIL: building a second InterviewAgent did not finish within {timeout:.0f}s")
+        sys.exit(1)
+
+    other_role = build("Data Scientist", timeout)
+    if other_role is None:
+        print(f"FAIL: building an agent for another role did not finish within {timeout:.0f}s")
+        sys.exit(1)
+
+    if second.agent is not first.agent:
+        print("FAIL: agents for the same role were not shared")
+        sys.exit(1)
+    if other_role.agent.model is not first.agent.model:
+        print("FAIL: agents for different roles did not share the Groq model")
+        sys.exit(1)
+
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Query-plan regression check for the hot candidate queries
+Seeds a temporary database with 100k candidates (and attempt history) in
+the pre-migration schema, i.e. without the indexes added by migrations,
+applies pending migrations with core.migrations.migrate, then runs
+EXPLAIN QUERY PLAN for each hot query. Fails when a plan scans a table
+without an index or sorts with a temporary B-tree, or when a filtered
+candidate listing walks all candidates instead of searching an index.
+
+Usage: python benchmarks/check_query_plans.py [candidates]
+Exits with status 1 if any query regressed.
+"""
+import sys
+import random
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.dialects import sqlite
+
+from core.database import Base
+from core.migrations import migrate
+from core.models import User, Candidate, CandidateAttempt
+from api.dashboard_routes import candidate_listing_queries
+
+CANDIDATES = 100_000
+ROLES = ("Software Engineer", "Data Scientist", "Product Manager", "DevOps Engineer")
+
+# Indexes the migration is expected to create on an existing database
+MIGRATED_INDEXES = (
+    "ix_candidates_updated_at",
+    "ix_candidates_round_updated_at_score",
+    "ix_candidates_role_updated_at",
+    "ix_candidates_round_1_score",
+    "ix_candidates_round_2_score",
+    "ix_candidates_round_3_score",
+    "ix_candidate_attempts_candidate_attempt",
+)
+
+HOT_QUERIES = {
+    "candidate by user_id": select(Candidate).where(Candidate.user_id == 4242),
+    "recent candidates": (
+        select(Candidate).join(User).order_by(Candidate.updated_at.desc()).limit(10)
+    ),
+    "candidates past round 0": (
+        select(func.count(Candidate.id)).where(Candidate.current_round > 0)
+    ),
+    "attempt history": (
+        select(CandidateAttempt)
+        .where(CandidateAttempt.candidate_id == 4242)
+        .order_by(CandidateAttempt.attempt_number)
+    ),
+    "candidate listing page": (
+        candidate_listing_queries(after=(datetime(2026, 1, 1), 4242))[0].limit(25)
+    ),
+    "candidate listing by role": candidate_listing_queries(role="Data Scientist")[0].limit(25),
+    "candidate listing by score": (
+        candidate_listing_queries(sort="round_2_score", after=(3, 4242))[0].limit(25)
+    ),
+}
+
+# Listings with a filter that matches few candidates: walking every
+# candidate in updated_at order (SCAN ... USING INDEX) also counts as a problem
+FILTERED_QUERIES = {
+    "candidate listing min score": candidate_listing_queries(min_score=80)[0].limit(25),
+    "candidate listing score range": (
+        candidate_listing_queries(min_score=60, max_score=70, after=(datetime(2026, 1, 1), 4242))[0].limit(25)
+    ),
+}
+for status in ("registered", "in_progress", "completed", "pending"):
+    statements = candidate_listing_queries(status=status)
+    for i, statement in enumerate(statements, 1):
+        suffix = f" ({i}/{len(statements)})" if len(statements) > 1 else ""
+        FILTERED_QUERIES[f"candidate listing {status}{suffix}"] = statement.limit(25)
+
+def seed(db_path: Path, candidates: int):
+    """Create the pre-migration schema and bulk-load candidates"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    now = datetime.utcnow()
+
+    with engine.begin() as conn:
+        for name in MIGRATED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+        conn.execute(User.__table__.insert(), [
+            {"id": i, "email": f"candidate{i}@example.com", "name": f"Candidate {i}",
+             "password_hash": "x", "role": "candidate"}
+            for i in range(1, candidates + 1)
+        ])
+        conn.execute(Candidate.__table__.insert(), [
+            {"id": i, "user_id": i, "full_name": f"Candidate {i}",
+             "role_applied_for": random.choice(ROLES),
+             "current_round": random.randint(0, 3),
+             "round_1_score": random.randint(0, 5),
+             "round_2_score": random.randint(0, 5) if random.random() < 0.6 else None,
+             "round_3_score": random.randint(40, 95) if random.random() < 0.3 else None,
+             "updated_at": now - timedelta(seconds=random.randint(0, 90 * 86400))}
+            for i in range(1, candidates + 1)
+        ])
+        conn.execute(CandidateAttempt.__table__.insert(), [
+            {"candidate_id": i, "attempt_number": n}
+            for i in range(1, candidates + 1, 10) for n in (1, 2)
+        ])
+
+    return engine
+
+
+def plan_problems(plan: list[str], filtered: bool = False) -> list[str]:
+    """Plan steps that read a whole table (or, if filtered, all candidates) or sort without an index"""
+    problems = []
+    for detail in plan:
+        if detail.startswith("SCAN ") and (" USING " not in detail or filtered):
+            problems.append(detail)
+        elif "TEMP B-TREE" in detail:
+            problems.append(detail)
+    return problems
+
+
+def main():
+    candidates = int(sys.argv[1]) if len(sys.argv) > 1 else CANDIDATES
+
+    db_path = Path(tempfile.mkdtemp(prefix="query_plans_")) / "plans.db"
+    print(f"Seeding {candidates} candidates...")
+    engine = seed(db_path, candidates)
+    migrate(engine)
+
+    queries = [(name, statement, False) for name, statement in HOT_QUERIES.items()]
+    queries += [(name, statement, True) for name, statement in FILTERED_QUERIES.items()]
+
+    failed = 0
+    with engine.connect() as conn:
+        for name, statement, filtered in queries:
+            sql = str(statement.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+            plan = [row[3] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+            problems = plan_problems(plan, filtered)
+            failed += bool(problems)
+
+            print(f"{'FAIL' if problems else 'ok':<5} {name}")
+            for detail in plan:
+                print(f"        {detail}")
+
+    engine.dispose()
+    print(f"{len(queries) - failed}/{len(queries)} hot queries use an index")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Concurrency check for the async interview agent
+Runs several interviews at once in one event loop with Groq chat replaced
+by the stub in benchmarks/stub_backends.py, recording when each turn
+(aprocess_candidate_response) starts and ends. If the LLM path blocked the
+event loop, turns would run one after another; the check fails unless
+turns of different sessions overlap and the whole run takes far less than
+the turns would back to back.
+
+Usage: python benchmarks/check_turn_interleaving.py [sessions] [turns] [chat_latency]
+Exits with status 1 if turns did not interleave.
+"""
+import os
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark-placeholder-key")
+
+from benchmarks.stub_backends import CANDIDATE_ANSWERS, LatencyModel, install
+from core.interview_agent import InterviewAgent
+
+# Serial run time over wall time must exceed this share of the session count
+MIN_SPEEDUP_SHARE = 0.5
+
+
+async def interview(agent: InterviewAgent, turns: int, intervals: list):
+    """Answer `turns` questions, recording (start, end) of each turn"""
+    await agent.aget_introduction()
+    for i in range(turns):
+        start = time.perf_counter()
+        await agent.aprocess_candidate_response(CANDIDATE_ANSWERS[i % len(CANDIDATE_ANSWERS)])
+        intervals.append((start, time.perf_counter()))
+    await agent.wait_for_scores()
+
+
+def max_overlap(intervals: list) -> int:
+    """Largest number of turns in progress at the same moment"""
+    edges = sorted([(start, 1) for start, _ in intervals] + [(end, -1) for _, end in intervals])
+    current = peak = 0
+    for _, step in edges:
+        current += step
+        peak = max(peak, current)
+    return peak
+
+
+async def main_async(sessions: int, turns: int, chat_latency: str) -> bool:
+    install(LatencyModel(chat_latency), LatencyModel("fixed:0"), LatencyModel("fixed:0"))
+
+    agents = [InterviewAgent(job_role="Software Engineer") for _ in range(sessions)]
+    intervals = [[] for _ in agents]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(interview(agent, turns, log) for agent, log in zip(agents, intervals)))
+    wall = time.perf_counter() - start
+
+    all_turns = [interval for log in intervals for interval in log]
+    serial = sum(end - begin for begin, end in all_turns)
+    speedup = serial / wall if wall else 0.0
+    overlap = max_overlap(all_turns)
+
+    print(f"{sessions} sessions x {turns} turns, chat latency {chat_latency}")
+    print(f"wall {wall:.2f}s, turns back to back {serial:.2f}s, speedup {speedup:.1f}x, "
+          f"peak concurrent turns {overlap}")
+
+    ok = overlap == sessions and speedup >= sessions * MIN_SPEEDUP_SHARE
+    print("ok" if ok else "FAIL: turns did not interleave")
+    return ok
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    turns = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    chat_latency = sys.argv[3] if len(sys.argv) > 3 else "fixed:0.2"
+    if not asyncio.run(main_async(sessions, turns, chat_latency)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+Load test for the interview WebSocket
+Runs the interview router in a local uvicorn server (on its own thread and
+event loop) with Groq chat, Whisper and edge-tts replaced by the stubs in
+benchmarks/stub_backends.py, then drives /interview/ws with simulated
+candidates that answer every question with a recorded clip. Concurrency
+ramps through the given levels; for each level it reports completed
+sessions per second, per-turn latency percentiles and the server event
+loop lag measured while the level ran.
+
+Usage:
+    python benchmarks/load_test.py --levels 1,5,10,25,50 --sessions-per-client 2 \\
+        --chat-latency lognormal:0.6,0.4 --stt-latency lognormal:0.4,0.3 \\
+        --tts-latency fixed:0.3 [--streaming] [--protocol 2] [--audio answer.webm] \\
+        [--tts-cache] [--intro-pool]
+
+The TTS cache and the introduction pool are off by default: the stub chat
+only has a handful of distinct replies, so with them on nearly every reply
+would be served from memory after warm-up and --tts-latency would hardly
+show up in the results. Enable them to measure their effect.
+
+No network access is needed. Checkpoints and the TTS cache are written to a
+temporary directory, not the application database.
+"""
+import os
+import sys
+import json
+import math
+import time
+import wave
+import socket
+import asyncio
+import argparse
+import tempfile
+import threading
+from collections import deque
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+WORK_DIR = Path(tempfile.mkdtemp(prefix="interview_load_"))
+os.environ.setdefault("GROQ_API_KEY", "benchmark-placeholder-key")
+os.environ["TTS_CACHE_DIR"] = str(WORK_DIR / "tts_cache")
+
+import uvicorn
+import websockets
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+
+from benchmarks.stub_backends import LatencyModel, install
+from core.database import Base, SessionLocal
+import core.models  # noqa: F401  (registers tables on Base)
+
+LAG_INTERVAL = 0.05
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Percentile (0-1) of a list of samples"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def synthetic_answer() -> bytes:
+    """A WAV clip with speech-level audio between stretches of silence"""
+    rate = 16000
+    samples = bytearray()
+    for i in range(rate * 3):
+        voiced = rate // 2 <= i < rate * 5 // 2
+        value = int(8000 * math.sin(2 * math.pi * 220 * i / rate)) if voiced else 0
+        samples += value.to_bytes(2, "little", signed=True)
+    path = WORK_DIR / "answer.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(bytes(samples))
+    return path.read_bytes()
+
+
+def disable_tts_cache():
+    """Give every session a TTS service without the shared cache, so each reply is synthesized"""
+    from core.audio_services import AudioProcessor
+
+    init = AudioProcessor.__init__
+
+    def _init(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        self.tts.cache = None
+
+    AudioProcessor.__init__ = _init
+
+
+def build_app(lag_samples: deque, args) -> FastAPI:
+    """Interview-only app that records event loop lag on the server loop"""
+    from api.interview_routes import router as interview_router
+    from core.intro_pool import intro_pool
+
+    app = FastAPI()
+    app.include_router(interview_router)
+
+    # An empty role set makes every introduction a miss that is never warmed
+    intro_pool.roles = frozenset([args.job_role] if args.intro_pool else [])
+
+    @app.on_event("startup")
+    async def start_intro_pool():
+        if args.intro_pool:
+            intro_pool.start()
+
+    @app.on_event("startup")
+    async def start_lag_monitor():
+        async def _monitor():
+            loop = asyncio.get_running_loop()
+            while True:
+                expected = loop.time() + LAG_INTERVAL
+                await asyncio.sleep(LAG_INTERVAL)
+                lag_samples.append((time.monotonic(), max(0.0, loop.time() - expected)))
+
+        app.state.lag_monitor = asyncio.create_task(_monitor())
+
+    return app
+
+
+def start_server(app: FastAPI) -> tuple[uvicorn.Server, int]:
+    """Start uvicorn on a free port in a background thread"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, port
+
+
+class SessionResult:
+    """Measurements from one simulated interview"""
+
+    def __init__(self):
+        self.ok = False
+        self.error = None
+        self.admit_wait = 0.0
+        self.turn_latencies: list[float] = []
+        self.first_audio_latencies: list[float] = []
+
+
+async def run_candidate(url: str, audio: bytes, args) -> SessionResult:
+    """Drive one interview from init to interview_complete"""
+    result = SessionResult()
+    try:
+        async with websockets.connect(url, max_size=None) as ws:
+            sent_at = time.perf_counter()
+            await ws.send(json.dumps({
+                "type": "init",
+                "job_role": args.job_role,
+                "streaming": args.streaming,
+                "protocol": args.protocol,
+            }))
+
+            first_audio = None
+            while True:
+                message = await ws.recv()
+                if isinstance(message, bytes):
+                    if first_audio is None:
+                        first_audio = time.perf_counter() - sent_at
+                    continue
+
+                data = json.loads(message)
+                kind = data.get("type")
+
+                if kind == "session":
+                    result.admit_wait = time.perf_counter() - sent_at
+                elif kind == "error":
+                    raise RuntimeError(data.get("message"))
+                elif kind == "interview_complete":
+                    result.ok = True
+                    return result
+                elif kind in ("interviewer_response", "audio_end"):
+                    if "audio_bytes" in data:
+                        # Protocol v2: the reply audio follows as a binary frame
+                        await ws.recv()
+                    # Reply complete; v1 replies carry their audio inline
+                    latency = time.perf_counter() - sent_at
+                    result.turn_latencies.append(latency)
+                    result.first_audio_latencies.append(first_audio if first_audio is not None else latency)
+
+                    await ws.send(json.dumps({"type": "playback_complete"}))
+                    if "conclusion" in str(data.get("stage", "")).lower():
+                        continue
+
+                    await asyncio.sleep(args.think)
+                    sent_at = time.perf_counter()
+                    first_audio = None
+                    await ws.send(audio)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+async def run_level(url: str, concurrency: int, audio: bytes, args) -> tuple[list[SessionResult], float]:
+    """Run concurrency * sessions_per_client interviews, concurrency at a time"""
+    total = concurrency * args.sessions_per_client
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(i: int) -> SessionResult:
+        async with semaphore:
+            return await run_candidate(url, audio, args)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_one(i) for i in range(total)))
+    return results, time.perf_counter() - start
+
+
+def report(concurrency: int, results: list[SessionResult], elapsed: float, lag: list[float]):
+    """Print one row of the results table"""
+    ok = [r for r in results if r.ok]
+    turns = [t for r in ok for t in r.turn_latencies[1:]]
+    first_audio = [t for r in ok for t in r.first_audio_latencies[1:]]
+    admit = [r.admit_wait for r in ok]
+    print(
+        f"{concurrency:>5} {len(ok):>5} {len(results) - len(ok):>5} {len(ok) / elapsed:>9.2f}"
+        f" {percentile(turns, 0.5):>7.2f} {percentile(turns, 0.95):>7.2f} {percentile(turns, 0.99):>7.2f}"
+        f" {percentile(first_audio, 0.5):>7.2f} {percentile(admit, 0.95):>7.2f}"
+        f" {percentile(lag, 0.5) * 1000:>8.1f} {percentile(lag, 0.99) * 1000:>8.1f} {max(lag, default=0.0) * 1000:>8.1f}"
+    )
+    for r in results:
+        if r.error:
+            print(f"      error: {r.error}")
+            break
+
+
+async def main_async(args):
+    install(
+        LatencyModel(args.chat_latency),
+        LatencyModel(args.stt_latency),
+        LatencyModel(args.tts_latency),
+        args.tokens_per_second,
+    )
+    if not args.tts_cache:
+        disable_tts_cache()
+
+    # Keep checkpoints out of the application database
+    engine = create_engine(f"sqlite:///{WORK_DIR / 'load_test.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal.configure(bind=engine)
+
+    audio = Path(args.audio).read_bytes() if args.audio else synthetic_answer()
+
+    lag_samples: deque = deque()
+    server, port = start_server(build_app(lag_samples, args))
+    url = f"ws://127.0.0.1:{port}/interview/ws"
+
+    print(f"chat {args.chat_latency}  stt {args.stt_latency}  tts {args.tts_latency}  "
+          f"streaming={args.streaming}  protocol={args.protocol}  answer={len(audio)} bytes  "
+          f"tts_cache={'on' if args.tts_cache else 'off'}  intro_pool={'on' if args.intro_pool else 'off'}")
+    print("                                  turn latency (s)       first   admit      loop lag (ms)")
+    print(" conc    ok  fail  sess/sec     p50     p95     p99   audio     p95      p50      p99      max")
+
+    try:
+        for concurrency in args.levels:
+            level_start = time.monotonic()
+            results, elapsed = await run_level(url, concurrency, audio, args)
+            lag = [value for at, value in list(lag_samples) if at >= level_start]
+            report(concurrency, results, elapsed, lag)
+    finally:
+        server.should_exit = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the interview WebSocket against stub backends")
+    parser.add_argument("--levels", type=lambda s: [int(v) for v in s.split(",")], default=[1, 5, 10, 25, 50],
+                        help="Comma-separated concurrency levels to ramp through")
+    parser.add_argument("--sessions-per-client", type=int, default=2, help="Interviews per concurrent client at each level")
+    parser.add_argument("--chat-latency", default="lognormal:0.6,0.4", help="Groq chat time to first token")
+    parser.add_argument("--stt-latency", default="lognormal:0.4,0.3", help="Whisper transcription time")
+    parser.add_argument("--tts-latency", default="fixed:0.3", help="edge-tts time to first audio")
+    parser.add_argument("--tokens-per-second", type=float, default=200.0, help="Chat streaming rate")
+    parser.add_argument("--think", type=float, default=0.0, help="Seconds a candidate waits before answering")
+    parser.add_argument("--streaming", action="store_true", help="Use sentence-streamed replies")
+    parser.add_argument("--protocol", type=int, default=1, choices=(1, 2), help="WebSocket protocol version")
+    parser.add_argument("--job-role", default="Software Engineer")
+    parser.add_argument("--audio", help="Recorded answer to send every turn (default: synthetic WAV)")
+    parser.add_argument("--tts-cache", action="store_true", help="Serve repeated replies from the TTS cache")
+    parser.add_argument("--intro-pool", action="store_true", help="Serve introductions from the pre-generated pool")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Local stand-ins for Groq chat, Groq Whisper and edge-tts
+Each stub sleeps for a latency drawn from a configurable distribution and
+returns plausible output, so the interview pipeline can be driven end to
+end without network access. install() patches them in at the same seams
+the real clients are created through.
+
+Latency specs: "fixed:0.5", "uniform:0.2,0.8" or "lognormal:0.6,0.4"
+(median seconds, sigma).
+"""
+import math
+import time
+import random
+import asyncio
+from types import SimpleNamespace
+
+
+class LatencyModel:
+    """Latency distribution parsed from a spec string"""
+
+    def __init__(self, spec: str):
+        """
+        Initialize the model
+
+        Args:
+            spec: "fixed:S", "uniform:LO,HI" or "lognormal:MEDIAN,SIGMA"
+        """
+        self.spec = spec
+        kind, _, params = spec.partition(":")
+        values = [float(v) for v in params.split(",") if v]
+        if kind == "fixed" and len(values) == 1:
+            self._sample = lambda: values[0]
+        elif kind == "uniform" and len(values) == 2:
+            self._sample = lambda: random.uniform(values[0], values[1])
+        elif kind == "lognormal" and len(values) == 2:
+            mu = math.log(values[0])
+            self._sample = lambda: random.lognormvariate(mu, values[1])
+        else:
+            raise ValueError(f"Invalid latency spec: {spec}")
+
+    def sample(self) -> float:
+        """Draw one latency in seconds"""
+        return max(0.0, self._sample())
+
+
+INTERVIEWER_LINES = [
+    "Thanks for sharing that.",
+    "That is a helpful example.",
+    "I appreciate the detail there.",
+    "Good, let us keep going.",
+]
+
+INTERVIEWER_QUESTIONS = [
+    "Can you walk me through a project you are proud of and the trade-offs you made?",
+    "How do you approach debugging a problem you cannot reproduce locally?",
+    "Tell me about a time you disagreed with a teammate and how you resolved it.",
+    "What would you do differently if you started your last project again?",
+    "How do you decide when a piece of code is ready for review?",
+]
+
+CANDIDATE_ANSWERS = [
+    "My name is Alex and I am ready to begin.",
+    "In my last role I rebuilt our deployment pipeline, which cut release time from hours to minutes.",
+    "I start by adding logging around the failure and narrowing down the inputs until it reproduces.",
+    "We disagreed on the database schema, so we wrote down both options and tested them against real queries.",
+    "I would invest in automated tests earlier, because they would have caught most of our regressions.",
+]
+
+
+class StubChatAgent:
+    """Stands in for an Agno agent backed by Groq chat completions"""
+
+    def __init__(self, latency: LatencyModel, tokens_per_second: float = 200.0):
+        """
+        Initialize the stub
+
+        Args:
+            latency: Time to first token
+            tokens_per_second: Streaming rate after the first token
+        """
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+
+    def _reply(self, prompt: str) -> str:
+        """Canned reply for a prompt"""
+        if "scale of 0-100" in prompt:
+            return str(random.randint(55, 95))
+        return f"{random.choice(INTERVIEWER_LINES)} {random.choice(INTERVIEWER_QUESTIONS)}"
+
+    def run(self, prompt: str):
+        """Blocking run"""
+        time.sleep(self.latency.sample())
+        return SimpleNamespace(content=self._reply(prompt))
+
+    def arun(self, prompt: str, stream: bool = False):
+        """Async run: a coroutine, or an async iterator of RunContent events when streaming"""
+        if stream:
+            return self._astream(prompt)
+        return self._arun(prompt)
+
+    async def _arun(self, prompt: str):
+        await asyncio.sleep(self.latency.sample())
+        return SimpleNamespace(content=self._reply(prompt))
+
+    async def _astream(self, prompt: str):
+        await asyncio.sleep(self.latency.sample())
+        words = self._reply(prompt).split(" ")
+        for i, word in enumerate(words):
+            if i:
+                await asyncio.sleep(1.0 / self.tokens_per_second)
+            yield SimpleNamespace(event="RunContent", content=word if i == 0 else " " + word)
+
+
+def make_stub_transcribe(latency: LatencyModel):
+    """Build a blocking stand-in for SpeechToTextService.transcribe_audio"""
+
+    def transcribe_audio(self, audio_data: bytes, filename: str = "audio.webm") -> str:
+        # The real SDK call is blocking and runs in the default executor
+        time.sleep(latency.sample())
+        return random.choice(CANDIDATE_ANSWERS)
+
+    return transcribe_audio
+
+
+def make_stub_communicate(latency: LatencyModel, bytes_per_char: int = 400, chunk_bytes: int = 4096):
+    """Build a stand-in for edge_tts.Communicate producing MP3-sized output"""
+
+    class StubCommunicate:
+        def __init__(self, text: str, voice: str, **kwargs):
+            self.text = text
+
+        async def stream(self):
+            await asyncio.sleep(latency.sample())
+            remaining = max(len(self.text) * bytes_per_char, chunk_bytes)
+            while remaining > 0:
+                size = min(chunk_bytes, remaining)
+                remaining -= size
+                yield {"type": "audio", "data": b"\xff\xf3" + bytes(size - 2)}
+
+    return StubCommunicate
+
+
+def install(
+    chat_latency: LatencyModel,
+    stt_latency: LatencyModel,
+    tts_latency: LatencyModel,
+    tokens_per_second: float = 200.0
+):
+    """
+    Patch the stubs into the interview pipeline
+
+    Must be called before any interview session is created.
+
+    Args:
+        chat_latency: Groq chat time to first token
+        stt_latency: Whisper transcription time
+        tts_latency: edge-tts time to first audio
+        tokens_per_second: Streaming rate of the chat stub
+    """
+    import core.audio_services as audio_services
+    from core.clients import clear_clients
+    from core.interview_agent import InterviewAgent
+
+    clear_clients()
+    agent = StubChatAgent(chat_latency, tokens_per_second)
+    InterviewAgent._build_agent = staticmethod(lambda job_role, model_name: agent)
+    audio_services.SpeechToTextService.transcribe_audio = make_stub_transcribe(stt_latency)
+    audio_services.edge_tts.Communicate = make_stub_communicate(tts_latency)
@@ -0,0 +1,152 @@
+"""
+Admission control for concurrent interview sessions
+Caps the number of interviews running on a worker and queues the rest in
+arrival order, so a spike in connections waits its turn instead of every
+session in progress slowing down together
+"""
+import os
+import time
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional
+
+MAX_INTERVIEW_SESSIONS = int(os.getenv("MAX_INTERVIEW_SESSIONS", "20"))
+ADMISSION_UPDATE_SECONDS = float(os.getenv("ADMISSION_UPDATE_SECONDS", "5"))
+
+# Session length assumed for ETAs until real sessions have finished
+DEFAULT_SESSION_SECONDS = 600.0
+
+
+class AdmissionController:
+    """FIFO admission queue in front of a fixed number of session slots"""
+
+    def __init__(
+        self,
+        capacity: int = MAX_INTERVIEW_SESSIONS,
+        update_interval: float = ADMISSION_UPDATE_SECONDS
+    ):
+        """
+        Initialize the controller
+
+        Args:
+            capacity: Maximum number of concurrent sessions
+            update_interval: Seconds between position/ETA updates to queued clients
+        """
+        self.capacity = capacity
+        self.update_interval = update_interval
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._avg_session_seconds = DEFAULT_SESSION_SECONDS
+        self._recent_waits: Deque[float] = deque(maxlen=1000)
+        self.admitted_total = 0
+        self.queued_total = 0
+        self.abandoned_total = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of clients waiting for a slot"""
+        return len(self._waiters)
+
+    def eta_seconds(self, position: int) -> float:
+        """Estimated wait for a client at a 1-based queue position"""
+        return position * self._avg_session_seconds / max(self.capacity, 1)
+
+    async def acquire(self, notify: Optional[Callable[[int, float], Awaitable]] = None) -> float:
+        """
+        Wait for a session slot
+
+        Args:
+            notify: Called with (position, eta_seconds) when queued and then
+                every update_interval seconds until admitted
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+
+        if self.active < self.capacity and not self._waiters:
+            self.active += 1
+            self._admit(0.0)
+            return 0.0
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued_total += 1
+
+        try:
+            while True:
+                if notify is not None:
+                    position = self._waiters.index(waiter) + 1
+                    await notify(position, self.eta_seconds(position))
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter), timeout=self.update_interval)
+                    break
+                except asyncio.TimeoutError:
+                    continue
+        except BaseException:
+            # Client went away while queued
+            self.abandoned_total += 1
+            if waiter.done() and not waiter.cancelled():
+                # A slot was already handed over; pass it on
+                self.release()
+            else:
+                waiter.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+        waited = time.monotonic() - start
+        self._admit(waited)
+        return waited
+
+    def release(self, session_seconds: Optional[float] = None):
+        """
+        Free a slot, handing it straight to the next queued client
+
+        Args:
+            session_seconds: Length of the finished session (updates ETAs)
+        """
+        if session_seconds is not None:
+            # Exponential moving average of session length
+            self._avg_session_seconds = 0.8 * self._avg_session_seconds + 0.2 * session_seconds
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Slot transfers without decrementing, so nobody can jump the queue
+                waiter.set_result(True)
+                return
+        self.active -= 1
+
+    def _admit(self, waited: float):
+        """Record an admission"""
+        self.admitted_total += 1
+        self._recent_waits.append(waited)
+
+    def stats(self) -> Dict[str, float]:
+        """Queue depth and admission wait metrics"""
+        waits = sorted(self._recent_waits)
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            return waits[min(len(waits) - 1, int(p * len(waits)))]
+
+        return {
+            "capacity": self.capacity,
+            "active_sessions": self.active,
+            "queue_depth": self.queue_depth,
+            "admitted_total": self.admitted_total,
+            "queued_total": self.queued_total,
+            "abandoned_total": self.abandoned_total,
+            "wait_seconds_p50": percentile(0.50),
+            "wait_seconds_p95": percentile(0.95),
+            "wait_seconds_max": waits[-1] if waits else 0.0,
+            "avg_session_seconds": self._avg_session_seconds,
+        }
+
+
+# Process-wide controller for interview WebSocket sessions
+interview_admission = AdmissionController()
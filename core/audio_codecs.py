@@ -0,0 +1,129 @@
+"""
+Output codecs for synthesized interviewer speech
+edge-tts only produces MP3. Clients that negotiate Opus in WebM receive
+that MP3 transcoded with PyAV, which roughly halves reply bandwidth at
+speech quality. Transcoding is CPU work, so callers run transcode() in a
+worker thread.
+"""
+import io
+import os
+import logging
+from functools import lru_cache
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+MP3 = "audio/mpeg"
+OPUS_WEBM = "audio/webm;codecs=opus"
+
+# edge-tts default output is audio-24khz-48kbitrate-mono-mp3
+EDGE_TTS_BITRATE = 48_000
+EDGE_TTS_SAMPLE_RATE = 24_000
+
+# Opus bitrate for transcoded replies (speech stays clear well below this)
+OPUS_BITRATE = int(os.getenv("TTS_OPUS_BITRATE", "24000"))
+
+# File extension of each codec in the on-disk TTS cache
+FILE_EXTENSIONS: Dict[str, str] = {
+    MP3: "mp3",
+    OPUS_WEBM: "webm",
+}
+
+
+@lru_cache(maxsize=1)
+def available_codecs() -> Tuple[str, ...]:
+    """
+    Codecs this process can produce, in order of preference for the server
+
+    Returns:
+        MP3, plus Opus/WebM when PyAV with a libopus encoder is installed
+    """
+    try:
+        import av
+    except ImportError:
+        return (MP3,)
+
+    if "libopus" in av.codecs_available and "webm" in av.formats_available:
+        return (MP3, OPUS_WEBM)
+    return (MP3,)
+
+
+def transcode(mp3_audio: bytes, codec: str) -> bytes:
+    """
+    Convert edge-tts MP3 output to another codec
+
+    Args:
+        mp3_audio: MP3 bytes from edge-tts
+        codec: Target codec MIME type
+
+    Returns:
+        Audio in the target codec (empty on failure)
+    """
+    if codec == MP3 or not mp3_audio:
+        return mp3_audio
+    if codec != OPUS_WEBM:
+        raise ValueError(f"Unsupported codec: {codec}")
+
+    try:
+        import av
+
+        out = io.BytesIO()
+        with av.open(io.BytesIO(mp3_audio)) as source, av.open(out, mode="w", format="webm") as target:
+            stream = target.add_stream("libopus", rate=EDGE_TTS_SAMPLE_RATE)
+            stream.bit_rate = OPUS_BITRATE
+            stream.layout = "mono"
+            resampler = av.AudioResampler(format="s16", layout="mono", rate=EDGE_TTS_SAMPLE_RATE)
+            for frame in source.decode(audio=0):
+                for resampled in resampler.resample(frame):
+                    for packet in stream.encode(resampled):
+                        target.mux(packet)
+            for resampled in resampler.resample(None):
+                for packet in stream.encode(resampled):
+                    target.mux(packet)
+            for packet in stream.encode(None):
+                target.mux(packet)
+        return out.getvalue()
+    except Exception as e:
+        logger.error(f"Could not transcode speech to {codec}: {e}")
+        return b""
+
+
+def estimate_mp3_duration(num_bytes: int) -> float:
+    """
+    Estimate playback length of edge-tts MP3 output
+
+    Args:
+        num_bytes: Size of the MP3 audio in bytes
+
+    Returns:
+        Approximate duration in seconds
+    """
+    return num_bytes * 8 / EDGE_TTS_BITRATE
+
+
+def playback_seconds(audio: bytes, codec: str) -> float:
+    """
+    Playback length of one reply (or one streamed sentence)
+
+    MP3 is estimated from its constant bitrate. WebM is read from the
+    container, falling back to the Opus target bitrate.
+
+    Args:
+        audio: Complete audio in the given codec
+        codec: Codec MIME type
+
+    Returns:
+        Duration in seconds
+    """
+    if codec == MP3 or not audio:
+        return estimate_mp3_duration(len(audio))
+
+    try:
+        import av
+
+        with av.open(io.BytesIO(audio)) as container:
+            if container.duration is not None:
+                return container.duration / av.time_base
+    except Exception:
+        pass
+    return len(audio) * 8 / OPUS_BITRATE
@@ -2,12 +2,35 @@
 Audio services for speech-to-text and text-to-speech using Groq and Edge-TTS
 """
 import os
+import re
+import time
 import asyncio
-import tempfile
-from pathlib import Path
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable, Optional
 import edge_tts
-from groq import Groq
+from core.clients import get_groq_client
+from core.audio_codecs import MP3, estimate_mp3_duration, transcode
+from core.tts_cache import TTSCache, tts_cache
+from core.vad import ends_in_silence, prepare_for_transcription
+
+# Incremental transcription: segment size sent to Whisper while the candidate
+# is still speaking, and cap on answer audio held in memory per session
+TRANSCRIBE_SEGMENT_BYTES = int(os.getenv("TRANSCRIBE_SEGMENT_BYTES", str(160 * 1024)))
+MAX_BUFFERED_AUDIO_BYTES = int(os.getenv("MAX_BUFFERED_AUDIO_BYTES", str(8 * 1024 * 1024)))
+
+# EBML ID of a WebM Cluster element; the header ends where the first one starts
+WEBM_CLUSTER_ID = b"\x1f\x43\xb6\x75"
+# EBML ID of the Timecode element that opens every Cluster
+WEBM_TIMECODE_ID = 0xE7
+
+# Segment cuts: Cluster boundaries checked for a pause (latest first), and
+# how transcripts of overlapping segments are matched up at the seam
+PAUSE_PROBE_CLUSTERS = 3
+MIN_OVERLAP_WORDS = 2
+MAX_OVERLAP_WORDS = 60
+SEAM_WORDS = 2
+
+# End of a sentence: terminal punctuation, optional closing quote/bracket, whitespace
+SENTENCE_BOUNDARY = re.compile(r'[.!?]+["\')\]]*\s+')
 
 
 class SpeechToTextService:
@@ -24,27 +47,28 @@ class SpeechToTextService:
         if not self.api_key:
             raise ValueError("GROQ_API_KEY not found in environment")
         
-        self.client = Groq(api_key=self.api_key)
+        # Process-wide client so sessions share one keep-alive connection pool
+        self.client = get_groq_client(self.api_key)
         self.model = "whisper-large-v3"
     
-    def transcribe_audio(self, audio_file_path: str) -> str:
+    def transcribe_audio(self, audio_data: bytes, filename: str = "audio.webm") -> str:
         """
-        Transcribe audio file to text
+        Transcribe in-memory audio to text
         
         Args:
-            audio_file_path: Path to audio file
+            audio_data: Raw audio bytes
+            filename: Name sent with the upload so Whisper can infer the container format
             
         Returns:
             Transcribed text
         """
         try:
-            with open(audio_file_path, "rb") as audio_file:
-                transcription = self.client.audio.transcriptions.create(
-                    file=(Path(audio_file_path).name, audio_file.read()),
-                    model=self.model,
-                    response_format="json",
-                    language="en",
-                )
+            transcription = self.client.audio.transcriptions.create(
+                file=(filename, audio_data),
+                model=self.model,
+                response_format="json",
+                language="en",
+            )
             
             return transcription.text
         
@@ -52,84 +76,326 @@ class SpeechToTextService:
             print(f"Error in transcription: {e}")
             return ""
     
-    async def transcribe_audio_async(self, audio_file_path: str) -> str:
+    async def transcribe_audio_async(self, audio_data: bytes, filename: str = "audio.webm") -> str:
         """
         Async version of transcribe_audio
         
         Args:
-            audio_file_path: Path to audio file
+            audio_data: Raw audio bytes
+            filename: Name sent with the upload
             
         Returns:
             Transcribed text
         """
         # Run sync version in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.transcribe_audio, audio_file_path)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.transcribe_audio, audio_data, filename)
+
+
+class IncrementalTranscriber:
+    """
+    Transcribe a candidate's answer in segments while it is still being recorded
+    
+    Audio arrives as a sequence of WebM chunks (MediaRecorder with a
+    timeslice). The header at the start of the answer (everything before
+    the first Cluster element) is kept and prepended to every later
+    segment, and segments are only cut where a Cluster starts, so each one
+    decodes on its own. Whenever the buffer grows past ``segment_bytes`` it
+    is cut at the latest Cluster boundary that falls in a pause and sent to
+    Whisper in the background. If no boundary falls in a pause, it is cut
+    at the latest one and the cluster before the cut is sent again at the
+    start of the next segment; the words both segments transcribe are kept
+    once (merge_transcripts). Only the short tail is left to transcribe
+    when the answer ends.
+    
+    If the first segment has no Cluster (not WebM, or an unusually large
+    header), the answer is transcribed in one piece when it ends.
+    """
+    
+    def __init__(
+        self,
+        transcribe: Callable[[bytes], Awaitable[str]],
+        segment_bytes: int = TRANSCRIBE_SEGMENT_BYTES,
+        max_buffered_bytes: int = MAX_BUFFERED_AUDIO_BYTES
+    ):
+        """
+        Initialize the transcriber
+        
+        Args:
+            transcribe: Coroutine function transcribing one segment
+            segment_bytes: Segment size that triggers a background transcription
+            max_buffered_bytes: Cap on audio held in memory (buffered plus in flight)
+        """
+        self.transcribe = transcribe
+        self.segment_bytes = segment_bytes
+        self.max_buffered_bytes = max_buffered_bytes
+        self._header: Optional[bytes] = None
+        self._whole_answer = False
+        self._buffer = bytearray()
+        self._buffer_overlaps = False  # Buffer starts with the last cluster of the previous segment
+        self._in_flight_bytes = 0
+        self._tasks: list[tuple[asyncio.Task, bool]] = []
+    
+    @property
+    def buffered_bytes(self) -> int:
+        """Audio bytes currently held in memory"""
+        return len(self._buffer) + self._in_flight_bytes
+    
+    async def add_chunk(self, data: bytes):
+        """
+        Buffer the next chunk of the answer
+        
+        Args:
+            data: Audio chunk bytes
+            
+        Raises:
+            ValueError: If buffered audio would exceed max_buffered_bytes
+        """
+        if self.buffered_bytes + len(data) > self.max_buffered_bytes:
+            raise ValueError("Buffered answer audio exceeds the memory limit")
+        
+        self._buffer.extend(data)
+        if self._whole_answer or len(self._buffer) < self.segment_bytes:
+            return
+        
+        if self._header is None:
+            clusters = find_clusters(self._buffer)
+            if not clusters or clusters[0] == 0:
+                # No WebM header to repeat: segments could not be decoded on their own
+                self._whole_answer = True
+                return
+            self._header = bytes(self._buffer[:clusters[0]])
+            del self._buffer[:clusters[0]]
+        
+        await self._cut()
+    
+    async def _cut(self):
+        """Send the buffer up to a Cluster boundary to be transcribed"""
+        # The buffer always starts with a Cluster; candidate cuts are the later ones
+        boundaries = find_clusters(self._buffer, 1)
+        if not boundaries:
+            return
+        
+        buffered = bytes(self._buffer)
+        cut = await asyncio.to_thread(self._find_pause, buffered, boundaries)
+        if cut is not None:
+            keep_from, overlaps = cut, False
+        elif len(boundaries) >= 2:
+            # Mid-word cut: repeat the last cluster so the word is heard whole once
+            cut, keep_from, overlaps = boundaries[-1], boundaries[-2], True
+        else:
+            # Nothing to overlap yet; wait for the next cluster
+            return
+        
+        self._dispatch(buffered[:cut], self._buffer_overlaps)
+        del self._buffer[:keep_from]
+        self._buffer_overlaps = overlaps
+    
+    def _find_pause(self, buffered: bytes, boundaries: list[int]) -> Optional[int]:
+        """Latest of the last few Cluster boundaries that falls in a pause, if any"""
+        starts = [0] + boundaries
+        for i in range(len(boundaries) - 1, max(len(boundaries) - 1 - PAUSE_PROBE_CLUSTERS, -1), -1):
+            if ends_in_silence(self._header + buffered[starts[i]:boundaries[i]]):
+                return boundaries[i]
+        return None
+    
+    def _dispatch(self, audio: bytes, overlaps: bool):
+        """Transcribe one segment in the background"""
+        segment = (self._header or b"") + audio
+        self._in_flight_bytes += len(segment)
+        
+        async def _transcribe():
+            try:
+                return await self.transcribe(segment)
+            finally:
+                self._in_flight_bytes -= len(segment)
+        
+        self._tasks.append((asyncio.create_task(_transcribe()), overlaps))
+    
+    async def finish(self) -> str:
+        """
+        Transcribe the remaining tail and join all segment transcripts
+        
+        Returns:
+            Transcript of the whole answer
+        """
+        if self._buffer:
+            self._dispatch(bytes(self._buffer), self._buffer_overlaps)
+            self._buffer = bytearray()
+        tasks, self._tasks = self._tasks, []
+        transcripts = await asyncio.gather(*(task for task, _ in tasks))
+        
+        transcript = ""
+        for (_, overlaps), text in zip(tasks, transcripts):
+            text = (text or "").strip()
+            if overlaps:
+                transcript = merge_transcripts(transcript, text)
+            else:
+                transcript = " ".join(part for part in (transcript, text) if part)
+        return transcript
+    
+    def cancel(self):
+        """Drop the answer and cancel any transcription in flight"""
+        for task, _ in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self._buffer = bytearray()
+
+
+def find_clusters(data: bytes, start: int = 0) -> list[int]:
+    """
+    Offsets of the WebM Cluster elements in a buffer
+    
+    A match only counts when it is followed by an element size and the
+    cluster's Timecode element, so Cluster-like bytes inside audio frames
+    are skipped.
+    
+    Args:
+        data: WebM bytes
+        start: Offset to search from
+        
+    Returns:
+        Cluster offsets in ascending order
+    """
+    offsets = []
+    pos = data.find(WEBM_CLUSTER_ID, start)
+    while pos != -1:
+        size_at = pos + len(WEBM_CLUSTER_ID)
+        if size_at < len(data) and data[size_at]:
+            # EBML sizes are variable-length: leading zero bits give the length
+            timecode_at = size_at + 9 - data[size_at].bit_length()
+            if timecode_at < len(data) and data[timecode_at] == WEBM_TIMECODE_ID:
+                offsets.append(pos)
+        pos = data.find(WEBM_CLUSTER_ID, pos + 1)
+    return offsets
+
+
+def merge_transcripts(previous: str, following: str) -> str:
+    """
+    Join the transcripts of two segments that share their seam audio
+    
+    The end of ``previous`` and the start of ``following`` cover the same
+    cluster. The longest run of words both contain there is kept once. Up
+    to SEAM_WORDS words on either side of that run may differ, since the
+    word cut off at a segment edge is often misheard; those are dropped.
+    
+    Args:
+        previous: Transcript so far
+        following: Transcript of the next segment
+        
+    Returns:
+        Combined transcript (simply concatenated if no shared run is found)
+    """
+    prev_words, next_words = previous.split(), following.split()
+    prev_norm = [re.sub(r"[^\w']", "", word.lower()) for word in prev_words]
+    next_norm = [re.sub(r"[^\w']", "", word.lower()) for word in next_words]
+    
+    longest = min(len(prev_words), len(next_words), MAX_OVERLAP_WORDS)
+    for size in range(longest, MIN_OVERLAP_WORDS - 1, -1):
+        for trim_prev in range(SEAM_WORDS + 1):
+            end = len(prev_words) - trim_prev
+            if end < size:
+                break
+            for trim_next in range(SEAM_WORDS + 1):
+                if trim_next + size > len(next_words):
+                    break
+                if prev_norm[end - size:end] == next_norm[trim_next:trim_next + size]:
+                    return " ".join(prev_words[:end - size] + next_words[trim_next:])
+    
+    return " ".join(prev_words + next_words)
 
 
 class TextToSpeechService:
     """Text-to-Speech using Edge-TTS"""
     
-    def __init__(self, voice: str = "en-US-AriaNeural"):
+    def __init__(
+        self,
+        voice: str = "en-US-AriaNeural",
+        cache: Optional[TTSCache] = tts_cache,
+        codec: str = MP3
+    ):
         """
         Initialize TTS service
         
         Args:
             voice: Voice to use for synthesis
+            cache: Audio cache shared across sessions (None disables caching)
+            codec: Output codec MIME type (see core.audio_codecs)
         """
         self.voice = voice
+        self.cache = cache
+        self.codec = codec
         # Available voices:
         # en-US-AriaNeural (female, professional)
         # en-US-GuyNeural (male, professional)
         # en-US-JennyNeural (female, friendly)
         # en-US-ChristopherNeural (male, warm)
     
-    async def synthesize_speech(self, text: str, output_path: str = None) -> str:
+    async def synthesize_speech(self, text: str, codec: Optional[str] = None) -> bytes:
         """
         Convert text to speech
         
         Args:
             text: Text to convert
-            output_path: Path to save audio file (creates temp if None)
+            codec: Output codec (defaults to the service codec)
             
         Returns:
-            Path to generated audio file
+            Audio bytes (empty on failure)
         """
-        try:
-            # Create temp file if no path provided
-            if output_path is None:
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-                output_path = temp_file.name
-                temp_file.close()
-            
-            # Generate speech
-            communicate = edge_tts.Communicate(text, self.voice)
-            await communicate.save(output_path)
-            
-            return output_path
-        
-        except Exception as e:
-            print(f"Error in TTS: {e}")
-            return ""
+        buffer = bytearray()
+        async for chunk in self.synthesize_speech_stream(text, codec):
+            buffer.extend(chunk)
+        return bytes(buffer)
     
-    async def synthesize_speech_stream(self, text: str) -> AsyncGenerator[bytes, None]:
+    async def synthesize_speech_stream(self, text: str, codec: Optional[str] = None) -> AsyncGenerator[bytes, None]:
         """
         Stream audio synthesis (for real-time playback)
         
+        Cached utterances are yielded as a single chunk. Otherwise MP3 chunks
+        are yielded as edge-tts produces them, while other codecs are
+        transcoded from the complete MP3 in a worker thread and yielded as
+        one chunk. The complete audio is cached either way.
+        
         Args:
             text: Text to convert
+            codec: Output codec (defaults to the service codec)
             
         Yields:
             Audio bytes chunks
         """
+        codec = codec or self.codec
+        if self.cache is not None:
+            cached = await self.cache.get(self.voice, text, codec)
+            if cached is not None:
+                yield cached
+                return
+        
+        if codec != MP3:
+            mp3_audio = await self.synthesize_speech(text, MP3)
+            audio = await asyncio.to_thread(transcode, mp3_audio, codec)
+            if not audio:
+                return
+            if self.cache is not None:
+                await self.cache.put(self.voice, text, audio, codec)
+            yield audio
+            return
+        
+        buffer = bytearray()
+        start = time.perf_counter()
         try:
             communicate = edge_tts.Communicate(text, self.voice)
             async for chunk in communicate.stream():
                 if chunk["type"] == "audio":
+                    buffer.extend(chunk["data"])
                     yield chunk["data"]
         
         except Exception as e:
             print(f"Error in TTS streaming: {e}")
+            return
+        
+        if self.cache is not None and buffer:
+            self.cache.record_synthesis(time.perf_counter() - start)
+            await self.cache.put(self.voice, text, bytes(buffer))
     
     @staticmethod
     async def list_voices():
@@ -138,6 +404,106 @@ class TextToSpeechService:
         return voices
 
 
+class SentenceSpeechPipeline:
+    """
+    Synthesize streamed text one sentence at a time
+    
+    Text is fed in as it arrives from the LLM. Each completed sentence is
+    handed to edge-tts immediately, so the first sentence is being spoken
+    while later ones are still being written. Segments are yielded in order,
+    and each segment's audio chunks are forwarded as edge-tts produces them;
+    chunks of later sentences are buffered until their turn.
+    """
+    
+    def __init__(self, tts: "TextToSpeechService", min_sentence_chars: int = 20):
+        """
+        Initialize the pipeline
+        
+        Args:
+            tts: TTS service used for each sentence
+            min_sentence_chars: Shortest text cut as a sentence (avoids tiny
+                segments for things like "Hi." or "Dr.")
+        """
+        self.tts = tts
+        self.min_sentence_chars = min_sentence_chars
+        self._buffer = ""
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+    
+    def feed(self, text: str):
+        """
+        Add streamed text and dispatch any completed sentences
+        
+        Args:
+            text: Next piece of LLM output
+        """
+        self._buffer += text
+        while True:
+            boundary = next(
+                (m for m in SENTENCE_BOUNDARY.finditer(self._buffer) if m.end() >= self.min_sentence_chars),
+                None
+            )
+            if boundary is None:
+                return
+            sentence = self._buffer[:boundary.end()].strip()
+            self._buffer = self._buffer[boundary.end():]
+            self._dispatch(sentence)
+    
+    def close(self):
+        """Flush the remaining text as the last sentence and end the stream"""
+        if self._buffer.strip():
+            self._dispatch(self._buffer.strip())
+        self._buffer = ""
+        self._queue.put_nowait(None)
+    
+    def cancel(self):
+        """Cancel any synthesis still in flight"""
+        for task in self._tasks:
+            task.cancel()
+    
+    def _dispatch(self, sentence: str):
+        """Start synthesizing a sentence in the background"""
+        chunks: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(self._synthesize(sentence, chunks))
+        self._tasks.append(task)
+        self._queue.put_nowait((sentence, chunks, task))
+    
+    async def _synthesize(self, sentence: str, chunks: asyncio.Queue):
+        """Queue a sentence's audio chunks as they are synthesized, then None"""
+        try:
+            async for chunk in self.tts.synthesize_speech_stream(sentence):
+                chunks.put_nowait(chunk)
+        finally:
+            chunks.put_nowait(None)
+    
+    @staticmethod
+    async def _drain(chunks: asyncio.Queue, task: asyncio.Task) -> AsyncGenerator[bytes, None]:
+        """Yield one sentence's audio chunks until its synthesis ends"""
+        while True:
+            chunk = await chunks.get()
+            if chunk is None:
+                await task
+                return
+            yield chunk
+    
+    async def segments(self) -> AsyncGenerator[tuple[str, AsyncGenerator[bytes, None]], None]:
+        """
+        Yield sentences in order, each with its audio as it is synthesized
+        
+        Each chunk iterator must be consumed before the next sentence is
+        requested.
+        
+        Yields:
+            Tuple of (sentence, async iterator of audio chunks)
+        """
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            sentence, chunks, task = item
+            yield sentence, self._drain(chunks, task)
+
+
 class AudioProcessor:
     """Combined audio processing service"""
     
@@ -152,36 +518,54 @@ class AudioProcessor:
         self.stt = SpeechToTextService(api_key=groq_api_key)
         self.tts = TextToSpeechService(voice=tts_voice)
     
-    async def process_interview_turn(self, audio_file_path: str) -> tuple[str, str]:
+    async def transcribe_speech(self, audio_data: bytes) -> str:
+        """
+        Trim silence from a recording, then transcribe it
+        
+        Recordings without speech never reach Whisper.
+        
+        Args:
+            audio_data: Recorded audio bytes
+            
+        Returns:
+            Transcript, or an empty string if no speech was detected
+        """
+        prepared = await asyncio.to_thread(prepare_for_transcription, audio_data)
+        if prepared is None:
+            return ""
+        
+        speech, filename = prepared
+        return await self.stt.transcribe_audio_async(speech, filename)
+    
+    async def process_interview_turn(self, audio_data: bytes) -> str:
         """
-        Process one interview turn: audio -> text -> response -> audio
+        Process one interview turn: audio -> text
         
         Args:
-            audio_file_path: Path to recorded audio
+            audio_data: Recorded audio bytes
             
         Returns:
-            Tuple of (transcript, response_audio_path)
+            Transcript of the recorded audio
         """
         # Transcribe user audio
-        transcript = await self.stt.transcribe_audio_async(audio_file_path)
+        transcript = await self.transcribe_speech(audio_data)
         
         # Note: Response generation should be done by InterviewAgent
         # This function would be called from WebSocket handler
         
         return transcript
     
-    async def generate_speech_response(self, text: str, output_path: str = None) -> str:
+    async def generate_speech_response(self, text: str) -> bytes:
         """
         Generate speech from text
         
         Args:
             text: Text to speak
-            output_path: Where to save audio
             
         Returns:
-            Path to audio file
+            Audio bytes in the TTS service codec
         """
-        return await self.tts.synthesize_speech(text, output_path)
+        return await self.tts.synthesize_speech(text)
 
 
 # Example usage
@@ -191,10 +575,10 @@ async def test_audio_services():
     
     # Test TTS
     print("Testing TTS...")
-    audio_path = await processor.tts.synthesize_speech(
+    audio_bytes = await processor.tts.synthesize_speech(
         "Hello! I'm your AI interviewer. Let's begin the interview."
     )
-    print(f"Audio saved to: {audio_path}")
+    print(f"Synthesized {len(audio_bytes)} bytes (~{estimate_mp3_duration(len(audio_bytes)):.1f}s)")
     
     # List voices
     print("\nAvailable voices:")
@@ -3,37 +3,51 @@ Authentication utilities
 Password hashing, JWT token generation/validation, and route dependencies
 """
 import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Dict, Optional, TypeVar
 import bcrypt
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
+from core.database import get_async_read_db
 from core.models import User, Candidate
+from core.principal_cache import principal_cache
 
 # JWT Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
+# bcrypt cost factor (each +1 doubles hashing time) and the hashing pool
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", "64"))
+
 # Security scheme
 security = HTTPBearer()
 
+T = TypeVar("T")
+
 
 def hash_password(password: str) -> str:
     """
     Hash a password using bcrypt
     
+    Blocks for the whole bcrypt computation; async code should use
+    ahash_password instead.
+    
     Args:
         password: Plain text password
         
     Returns:
         Hashed password string
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -42,6 +56,10 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash
     
+    Blocks for the whole bcrypt computation; async code should use
+    averify_password instead. The cost is read from the hash, so hashes
+    made with an earlier BCRYPT_ROUNDS still verify.
+    
     Args:
         plain_password: Plain text password to verify
         hashed_password: Hashed password from database
@@ -55,6 +73,83 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+class PasswordExecutor:
+    """
+    Dedicated thread pool for bcrypt
+    bcrypt releases the GIL, so hashing runs in parallel with the event loop
+    instead of stalling it (and every interview WebSocket on the worker).
+    The pool is separate from the default executor used by asyncio.to_thread,
+    and the number of waiting jobs is bounded: beyond it, requests get a 503
+    rather than queueing behind a login storm.
+    """
+    
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_queued: int = PASSWORD_HASH_QUEUE):
+        """
+        Initialize the executor
+        
+        Args:
+            workers: Threads hashing concurrently (0 runs bcrypt on the
+                event loop, as before; only useful for comparison)
+            max_queued: Jobs allowed to wait for a free thread
+        """
+        self.workers = workers
+        self.max_queued = max_queued
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt") if workers else None
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+    
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """
+        Run a bcrypt function on the pool
+        
+        Raises:
+            HTTPException: 503 when the queue is full
+        """
+        if self._executor is None:
+            return func(*args)
+        if self.in_flight >= self.workers + self.max_queued:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-in requests, please retry",
+                headers={"Retry-After": "1"},
+            )
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+    
+    def stats(self) -> Dict[str, int]:
+        """Pool size and job counters"""
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+    
+    def shutdown(self):
+        """Stop the threads (application shutdown)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+password_executor = PasswordExecutor()
+
+
+async def ahash_password(password: str) -> str:
+    """Hash a password on the password executor"""
+    return await password_executor.run(hash_password, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the password executor"""
+    return await password_executor.run(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token
@@ -111,7 +206,7 @@ def verify_token(token: str) -> dict:
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ) -> User:
     """
     Dependency to get the current authenticated user
@@ -126,7 +221,24 @@ async def get_current_user(
     Raises:
         HTTPException: If authentication fails
     """
-    token = credentials.credentials
+    return await authenticate_token(credentials.credentials, db)
+
+
+async def authenticate_token(token: str, db: AsyncSession) -> User:
+    """
+    Resolve a JWT to its user (for callers without a Bearer header,
+    e.g. EventSource streams that pass the token as a query parameter)
+    
+    Args:
+        token: JWT token string
+        db: Database session
+        
+    Returns:
+        User object
+        
+    Raises:
+        HTTPException: If authentication fails
+    """
     payload = verify_token(token)
     
     user_id = payload.get("user_id")
@@ -136,13 +248,19 @@ async def get_current_user(
             detail="Invalid authentication credentials"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    # Recently resolved users skip the database (see core/principal_cache.py)
+    user = principal_cache.get(user_id)
+    if user is not None:
+        return user
+    
+    user = await db.scalar(select(User).where(User.id == user_id))
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
     
+    principal_cache.put(user)
     return user
 
 
@@ -0,0 +1,128 @@
+"""
+Shared LLM and speech clients
+Built once per process and reused by every interview session and route,
+so HTTP connections to Groq stay pooled (keep-alive) and no client or
+agent construction happens on the request path
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable
+import httpx
+from groq import Groq as GroqClient
+from agno.agent import Agent
+from agno.models.groq import Groq
+
+# Connection pool shared by all Groq API calls made through the SDK client
+GROQ_HTTP_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("GROQ_MAX_CONNECTIONS", "100")),
+    max_keepalive_connections=int(os.getenv("GROQ_MAX_KEEPALIVE", "20")),
+    keepalive_expiry=float(os.getenv("GROQ_KEEPALIVE_EXPIRY", "60")),
+)
+
+# Agent keys include the client-supplied job role, so the agent cache is an
+# LRU: a role that falls out is rebuilt on next use, sessions keep theirs
+AGENT_CACHE_SIZE = int(os.getenv("AGENT_CACHE_SIZE", "64"))
+
+_lock = threading.Lock()
+_groq_clients: Dict[str, GroqClient] = {}
+_models: Dict[str, Groq] = {}
+_agents: "OrderedDict[Hashable, Agent]" = OrderedDict()
+
+
+def get_groq_client(api_key: str = None) -> GroqClient:
+    """
+    Get the shared Groq SDK client (used for Whisper transcription)
+
+    Args:
+        api_key: Groq API key (reads from env if not provided)
+
+    Returns:
+        Groq client with a pooled keep-alive HTTP connection
+
+    Raises:
+        ValueError: If no API key is available
+    """
+    api_key = api_key or os.getenv("GROQ_API_KEY")
+    if not api_key:
+        raise ValueError("GROQ_API_KEY not found in environment")
+
+    client = _groq_clients.get(api_key)
+    if client is None:
+        with _lock:
+            client = _groq_clients.get(api_key)
+            if client is None:
+                client = GroqClient(
+                    api_key=api_key,
+                    http_client=httpx.Client(limits=GROQ_HTTP_LIMITS),
+                )
+                _groq_clients[api_key] = client
+    return client
+
+
+def get_groq_model(model_id: str = "llama-3.3-70b-versatile") -> Groq:
+    """
+    Get the shared agno Groq model for a model id
+
+    The model lazily creates and keeps its own sync and async Groq clients,
+    so sharing the model shares their connection pools.
+
+    Args:
+        model_id: Groq model id
+
+    Returns:
+        Shared agno model instance
+    """
+    model = _models.get(model_id)
+    if model is None:
+        with _lock:
+            model = _models.get(model_id)
+            if model is None:
+                model = Groq(id=model_id)
+                _models[model_id] = model
+    return model
+
+
+def get_agent(key: Hashable, factory: Callable[[], Agent]) -> Agent:
+    """
+    Get a shared agent, building it on first use
+
+    Agents here run without stored history, so each run is independent and
+    one instance can serve concurrent sessions with the same configuration.
+    At most AGENT_CACHE_SIZE agents are kept, least recently used go first.
+
+    Args:
+        key: Identifies the agent configuration (e.g. ("interviewer", job_role, model))
+        factory: Builds the agent if it is not cached yet
+
+    Returns:
+        Shared agent instance
+    """
+    with _lock:
+        agent = _agents.get(key)
+        if agent is not None:
+            _agents.move_to_end(key)
+            return agent
+
+    # Built outside the lock: factories take it again through get_groq_model
+    built = factory()
+    with _lock:
+        agent = _agents.get(key)
+        if agent is not None:
+            # Another thread built it first; keep theirs so all callers share one
+            _agents.move_to_end(key)
+            return agent
+        _agents[key] = built
+        while len(_agents) > AGENT_CACHE_SIZE:
+            _agents.popitem(last=False)
+    return built
+
+
+def clear_clients():
+    """Drop all cached clients, models and agents (used by benchmarks and reloads)"""
+    with _lock:
+        for client in _groq_clients.values():
+            client.close()
+        _groq_clients.clear()
+        _models.clear()
+        _agents.clear()
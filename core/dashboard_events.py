@@ -0,0 +1,131 @@
+"""
+Live admin dashboard events
+Paths that change a candidate (quiz submit, interview completion, re-attempt
+grant) publish one event to an in-process bus after committing, and every
+connected admin's /dashboard/stream receives it. Admins no longer poll, so
+nothing is queried while nothing changes. Events carry the candidate's
+listing fields and the current dashboard statistics, read once per change
+rather than once per admin.
+
+The bus is per process: with several workers, an admin only sees changes
+made by the worker serving their stream.
+"""
+import os
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import Candidate, DashboardStats
+from core.dashboard_stats import STATS_ID, as_response, candidate_status
+
+logger = logging.getLogger(__name__)
+
+# Undelivered events kept per subscriber; a slower client is told to resync
+DASHBOARD_EVENT_QUEUE_SIZE = int(os.getenv("DASHBOARD_EVENT_QUEUE_SIZE", "100"))
+
+
+class EventBus:
+    """Fan-out of events to subscriber queues on the event loop"""
+
+    def __init__(self, queue_size: int = DASHBOARD_EVENT_QUEUE_SIZE):
+        """
+        Initialize the bus
+
+        Args:
+            queue_size: Maximum queued events per subscriber
+        """
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._next_id = 1
+        self.published = 0
+        self.resyncs = 0
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber and return its queue"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a subscriber"""
+        self._subscribers.discard(queue)
+
+    def publish(self, event_type: str, data: Dict[str, Any]):
+        """
+        Deliver an event to every subscriber without waiting
+
+        A subscriber whose queue is full has its backlog replaced by a single
+        "resync" event, telling the client to reload instead of replaying.
+
+        Args:
+            event_type: SSE event name
+            data: JSON-serializable payload
+        """
+        event = {"id": self._next_id, "type": event_type, "data": data}
+        self._next_id += 1
+        self.published += 1
+
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"id": event["id"], "type": "resync", "data": {}})
+                self.resyncs += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Subscriber and delivery counters"""
+        return {
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "resyncs": self.resyncs,
+        }
+
+
+dashboard_events = EventBus()
+
+
+def candidate_event(candidate: Candidate, reason: str, stats: Optional[Dict[str, int]]) -> Dict[str, Any]:
+    """Event payload with the candidate's listing fields (no user columns)"""
+    return {
+        "reason": reason,
+        "candidate": {
+            "id": candidate.id,
+            "candidateName": candidate.full_name,
+            "role": candidate.role_applied_for or "Not specified",
+            "status": candidate_status(candidate),
+            "score": candidate.round_3_score,
+            "currentRound": candidate.current_round,
+            "round1Score": candidate.round_1_score,
+            "round2Score": candidate.round_2_score,
+            "round3Score": candidate.round_3_score,
+            "updatedAt": candidate.updated_at.isoformat() if candidate.updated_at else None,
+        },
+        "stats": stats,
+    }
+
+
+async def publish_candidate_change(db: AsyncSession, candidate: Candidate, reason: str):
+    """
+    Publish a committed candidate change to connected admin dashboards
+
+    Never raises: a failure to notify must not fail the request that
+    changed the candidate.
+
+    Args:
+        db: Session the change was committed on (used to read the stats row)
+        candidate: Changed candidate, with its columns loaded
+        reason: "quiz_submitted", "interview_completed" or "reattempt_granted"
+    """
+    if not dashboard_events.stats()["subscribers"]:
+        return
+    try:
+        table = DashboardStats.__table__
+        row = (await db.execute(select(table).where(table.c.id == STATS_ID))).first()
+        stats = as_response(row) if row is not None else None
+        dashboard_events.publish("candidate_updated", candidate_event(candidate, reason, stats))
+    except Exception as e:
+        logger.warning(f"Could not publish dashboard event: {e}")
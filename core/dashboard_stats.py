@@ -0,0 +1,184 @@
+"""
+Incrementally maintained dashboard statistics
+The admin dashboard reads a single DashboardStats row instead of counting
+and averaging over candidates on every refresh. A before_flush hook on every
+Session (sync and async) turns the pending Candidate inserts, updates and
+deletes into deltas and applies them to that row in the same transaction,
+so signup, quiz submit, interview completion and re-attempt grants keep it
+current without extra code at each call site. rebuild() recomputes the row
+from the candidates table (migration 3 and
+migrations/rebuild_dashboard_stats.py).
+"""
+from datetime import datetime
+from typing import Dict, Optional
+from sqlalchemy import case, delete, event, func, inspect, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from core.models import Candidate, DashboardStats
+
+STATS_ID = 1
+
+STAT_COLUMNS = (
+    "total_candidates",
+    "active_candidates",
+    "interviewed_candidates",
+    "round_3_score_sum",
+    "round_3_score_count",
+)
+
+# Candidate attributes the aggregates depend on
+TRACKED = ("application_completed", "current_round", "round_3_score")
+
+# Marker for an old value the session never loaded
+_UNKNOWN = object()
+
+
+def _contribution(key: str, value) -> Dict[str, int]:
+    """What one candidate attribute value adds to the aggregates"""
+    if key == "application_completed":
+        return {"active_candidates": int(bool(value))}
+    if key == "current_round":
+        return {"interviewed_candidates": int((value or 0) > 0)}
+    return {"round_3_score_sum": int(value or 0), "round_3_score_count": int(value is not None)}
+
+
+def _add(delta: Dict[str, int], key: str, value, sign: int):
+    """Add (sign=1) or remove (sign=-1) a value's contribution"""
+    for column, amount in _contribution(key, value).items():
+        delta[column] += sign * amount
+
+
+def _current(history):
+    """Value the flush will write"""
+    if history.added:
+        return history.added[0]
+    return history.unchanged[0] if history.unchanged else None
+
+
+def _previous(history):
+    """Value stored in the database before this flush"""
+    if history.deleted:
+        return history.deleted[0]
+    return history.unchanged[0] if history.unchanged else _UNKNOWN
+
+
+def pending_delta(session: Session) -> Optional[Dict[str, int]]:
+    """
+    Aggregate changes for the Candidate rows a session is about to flush
+
+    Args:
+        session: Session in before_flush
+
+    Returns:
+        Column deltas, or None if an old value is unknown and the
+        aggregates must be rebuilt instead
+    """
+    delta = dict.fromkeys(STAT_COLUMNS, 0)
+
+    for candidate in session.new:
+        if isinstance(candidate, Candidate):
+            delta["total_candidates"] += 1
+            state = inspect(candidate)
+            for key in TRACKED:
+                _add(delta, key, _current(state.attrs[key].history), 1)
+
+    for candidate in session.dirty:
+        if isinstance(candidate, Candidate):
+            state = inspect(candidate)
+            for key in TRACKED:
+                history = state.attrs[key].history
+                if not history.added:
+                    continue
+                previous = _previous(history)
+                if previous is _UNKNOWN:
+                    return None
+                _add(delta, key, previous, -1)
+                _add(delta, key, history.added[0], 1)
+
+    for candidate in session.deleted:
+        if isinstance(candidate, Candidate):
+            delta["total_candidates"] -= 1
+            state = inspect(candidate)
+            for key in TRACKED:
+                previous = _previous(state.attrs[key].history)
+                if previous is _UNKNOWN:
+                    return None
+                _add(delta, key, previous, -1)
+
+    return delta
+
+
+def rebuild(conn: Connection) -> Dict[str, int]:
+    """
+    Recompute the aggregates from the candidates table and store them
+
+    Args:
+        conn: Connection inside the caller's transaction
+
+    Returns:
+        The recomputed statistics
+    """
+    row = conn.execute(select(
+        func.count(Candidate.id),
+        func.coalesce(func.sum(case((Candidate.application_completed == True, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Candidate.current_round > 0, 1), else_=0)), 0),
+        func.coalesce(func.sum(Candidate.round_3_score), 0),
+        func.count(Candidate.round_3_score),
+    )).one()
+    stats = dict(zip(STAT_COLUMNS, (int(value) for value in row)))
+
+    table = DashboardStats.__table__
+    conn.execute(delete(table))
+    conn.execute(table.insert().values(id=STATS_ID, rebuilt_at=datetime.utcnow(), **stats))
+    return stats
+
+
+def candidate_status(candidate: Candidate) -> str:
+    """Listing status from round progress and the Round 3 score"""
+    if candidate.current_round == 0:
+        return "registered"
+    if candidate.current_round < 3:
+        return "in_progress"
+    if candidate.current_round == 3 and candidate.round_3_score is not None:
+        return "completed"
+    return "pending"
+
+
+def as_response(stats: DashboardStats) -> Dict[str, int]:
+    """Dashboard stats payload from the aggregate row"""
+    count = stats.round_3_score_count
+    return {
+        "total_interviews": stats.interviewed_candidates,
+        "active_candidates": stats.active_candidates,
+        "avg_score": round(stats.round_3_score_sum / count) if count else 0,
+        "total_candidates": stats.total_candidates,
+    }
+
+
+@event.listens_for(Session, "before_flush")
+def _apply_candidate_changes(session, flush_context, instances):
+    """Apply pending Candidate changes to the aggregates in this transaction"""
+    delta = pending_delta(session)
+    if delta is None:
+        session.info["rebuild_dashboard_stats"] = True
+        return
+    if not any(delta.values()):
+        return
+
+    table = DashboardStats.__table__
+    # No row yet (database not migrated): the dashboard falls back to live queries
+    session.connection().execute(
+        update(table).where(table.c.id == STATS_ID).values(
+            {column: table.c[column] + amount for column, amount in delta.items() if amount}
+        )
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _rebuild_if_needed(session, flush_context):
+    """Rebuild from scratch when a flush changed values the session never loaded"""
+    if session.info.pop("rebuild_dashboard_stats", False):
+        connection = session.connection()
+        if connection.execute(select(DashboardStats.id)).first() is not None:
+            rebuild(connection)
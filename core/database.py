@@ -1,7 +1,11 @@
 """
 Database configuration and setup
 """
-from sqlalchemy import create_engine
+import os
+from typing import Tuple
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from pathlib import Path
@@ -10,19 +14,107 @@ from pathlib import Path
 BASE_DIR = Path(__file__).parent.parent
 DATABASE_PATH = BASE_DIR / "hiring_manager.db"
 
-# SQLite database URL
+# SQLite database URLs (sync driver and aiosqlite for async handlers)
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{DATABASE_PATH}"
 
-# Create engine
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False},
-    echo=False  # Set to True for SQL query logging
-)
+# Engine profile: "wal" enables WAL, tuned pragmas and a separate read-only
+# pool; "default" keeps SQLite's rollback journal and a single shared pool
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "wal")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_READ_POOL_SIZE = int(os.getenv("SQLITE_READ_POOL_SIZE", "8"))
+
+
+def _set_pragmas(dbapi_connection, readonly: bool):
+    """Apply the "wal" profile pragmas to a new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    if not readonly:
+        # Persistent for the file; readers pick it up from the writer
+        cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    cursor.close()
+
+
+def _on_connect(engine: Engine, readonly: bool = False):
+    """Register the pragma hook on an engine"""
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        _set_pragmas(dbapi_connection, readonly)
+
+
+def create_engines(
+    database_path: Path = DATABASE_PATH,
+    profile: str = SQLITE_PROFILE
+) -> Tuple[Engine, AsyncEngine, AsyncEngine]:
+    """
+    Create the engines for a database file
+
+    With the "wal" profile the async writer holds a single connection, so
+    writes from async handlers queue in-process instead of contending for
+    the SQLite lock, and reads go through a separate pool of read-only
+    connections that WAL lets run alongside the writer.
+
+    The sync engine is a second writer: interview checkpoints
+    (core/session_store.py), the application pipeline
+    (core/notification_service.py), migrations and scripts write through it,
+    from worker threads when called by async code. Its writes contend with
+    the async writer for the SQLite lock, so it waits up to
+    SQLITE_BUSY_TIMEOUT_MS for the lock in every profile.
+
+    Args:
+        database_path: SQLite database file
+        profile: "wal" or "default"
+
+    Returns:
+        Tuple of (sync_engine, async_write_engine, async_read_engine). With
+        the "default" profile the read engine is the write engine.
+    """
+    sync_engine = create_engine(
+        f"sqlite:///{database_path}",
+        connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+        echo=False  # Set to True for SQL query logging
+    )
+    if profile != "wal":
+        async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{database_path}",
+            connect_args={"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+            echo=False
+        )
+        return sync_engine, async_engine, async_engine
+
+    write_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{database_path}",
+        pool_size=1,
+        max_overflow=0,
+        echo=False
+    )
+    read_engine = create_async_engine(
+        f"sqlite+aiosqlite:///file:{database_path}?mode=ro&uri=true",
+        pool_size=SQLITE_READ_POOL_SIZE,
+        max_overflow=0,
+        echo=False
+    )
+    _on_connect(sync_engine)
+    _on_connect(write_engine.sync_engine)
+    _on_connect(read_engine.sync_engine, readonly=True)
+    return sync_engine, write_engine, read_engine
+
+
+# Create engines
+engine, async_engine, async_read_engine = create_engines()
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async session factories for route and WebSocket handlers, so queries do
+# not block the event loop. Objects stay usable after commit. Read-only
+# queries (dashboard, results, auth lookups) use the read factory.
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
+
 # Base class for models
 Base = declarative_base()
 
@@ -38,11 +130,37 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """
+    Async database session dependency for FastAPI routes
+    Yields an AsyncSession and closes it after use
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_async_read_db():
+    """
+    Read-only async database session dependency for FastAPI routes
+    Yields an AsyncSession on the read pool and closes it after use
+    """
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+async def dispose_engines():
+    """Close pooled connections (application shutdown)"""
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+
 def init_db():
     """
-    Initialize database - create all tables
+    Initialize database - create all tables, then apply pending migrations
+    for changes to tables that already existed
     """
-    from core.models import User, Candidate, Admin, CandidateAttempt
-    Base.metadata.create_all(bind=engine)
+    from core.models import User, Candidate, Admin, CandidateAttempt, InterviewCheckpoint, DashboardStats, ApplicationPipeline
+    from core.migrations import migrate, write_locked
+    # Workers starting together would race on CREATE TABLE otherwise
+    with write_locked(engine) as conn:
+        Base.metadata.create_all(bind=conn)
+    migrate(engine)
     print("Database initialized successfully")
-
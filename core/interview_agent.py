@@ -2,11 +2,14 @@
 HR Interview Agent - Manages interview flow, questions, and scoring
 """
 import os
-from typing import List, Dict, Optional
+import re
+import asyncio
+from typing import Callable, List, Dict, Optional, Tuple
 from enum import Enum
 from dotenv import load_dotenv
 from agno.agent import Agent
-from agno.models.groq import Groq
+from core.clients import get_agent, get_groq_model
+from core.metrics import stage_metrics
 from pydantic import BaseModel, Field
 
 # Load environment variables
@@ -44,24 +47,12 @@ class InterviewAgent:
         """
         self.job_role = job_role
         self.state = InterviewState()
+        self._score_task: Optional[asyncio.Task] = None
         
-        # Initialize Agno agent with Groq
-        self.agent = Agent(
-            name="HR Interviewer",
-            model=Groq(id=model_name),
-            description=f"Professional HR interviewer conducting interviews for {job_role} position",
-            instructions=[
-                "You are a professional HR interviewer conducting a structured interview.",
-                f"You are interviewing candidates for the {job_role} position.",
-                "Be professional, friendly, and encouraging.",
-                "Ask clear, relevant questions one at a time.",
-                "Listen carefully to answers and ask follow-up questions when needed.",
-                "Keep responses concise and conversational (2-3 sentences max).",
-                "Don't use special formatting, emojis, or bullet points in speech.",
-                "Speak naturally as if having a real conversation.",
-            ],
-            markdown=False,
-            debug_mode=False,
+        # Shared Agno agent with Groq, one per role and model for the whole process
+        self.agent = get_agent(
+            ("interviewer", job_role, model_name),
+            lambda: self._build_agent(job_role, model_name)
         )
         
         # Interview questions by stage
@@ -82,84 +73,281 @@ class InterviewAgent:
             ]
         }
     
-    def get_introduction(self) -> str:
-        """Get interview introduction"""
+    @staticmethod
+    def _build_agent(job_role: str, model_name: str) -> Agent:
+        """Build the Agno interviewer agent for a role"""
+        return Agent(
+            name="HR Interviewer",
+            model=get_groq_model(model_name),
+            description=f"Professional HR interviewer conducting interviews for {job_role} position",
+            instructions=[
+                "You are a professional HR interviewer conducting a structured interview.",
+                f"You are interviewing candidates for the {job_role} position.",
+                "Be professional, friendly, and encouraging.",
+                "Ask clear, relevant questions one at a time.",
+                "Listen carefully to answers and ask follow-up questions when needed.",
+                "Keep responses concise and conversational (2-3 sentences max).",
+                "Don't use special formatting, emojis, or bullet points in speech.",
+                "Speak naturally as if having a real conversation.",
+            ],
+            markdown=False,
+            debug_mode=False,
+        )
+    
+    @staticmethod
+    def _content(response) -> str:
+        """Extract text content from an agent run result"""
+        return response.content if hasattr(response, 'content') else str(response)
+    
+    def _run(self, prompt: str) -> str:
+        """Run the agent synchronously and return its text"""
+        return self._content(self.agent.run(prompt))
+    
+    async def _arun(self, prompt: str, on_delta: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Run the agent without blocking the event loop and return its text
+        
+        Args:
+            prompt: Prompt to send
+            on_delta: Called with each content token as it streams in (non-streaming if None)
+            
+        Returns:
+            Full response text
+        """
+        if on_delta is None:
+            return self._content(await self.agent.arun(prompt))
+        
+        parts = []
+        async for event in self.agent.arun(prompt, stream=True):
+            if getattr(event, "event", None) != "RunContent":
+                continue
+            delta = getattr(event, "content", None)
+            if isinstance(delta, str) and delta:
+                parts.append(delta)
+                on_delta(delta)
+        return "".join(parts)
+    
+    def _introduction_prompt(self) -> str:
+        """Prompt for the interview introduction"""
         self.state.stage = InterviewStage.INTRODUCTION
         
-        intro = self.agent.run(
+        return (
             f"Greet the candidate warmly and introduce yourself. "
             f"Explain that this is an interview for the {self.job_role} position. "
             f"Tell them the interview will have technical and behavioral questions. "
             f"Ask for their name and if they're ready to begin. Keep it brief and natural."
         )
+    
+    def get_introduction(self) -> str:
+        """Get interview introduction"""
+        return self._run(self._introduction_prompt())
+    
+    async def aget_introduction(self, on_delta: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Async version of get_introduction
         
-        return intro.content if hasattr(intro, 'content') else str(intro)
+        Args:
+            on_delta: Optional callback receiving the reply as it streams in
+        """
+        return await self._arun(self._introduction_prompt(), on_delta)
     
-    def process_candidate_response(self, transcript: str) -> str:
+    def _handle_introduction(self, transcript: str) -> bool:
         """
-        Process candidate's response and generate next question or feedback
+        Handle the candidate's reply to the introduction
         
         Args:
             transcript: What the candidate said
             
         Returns:
-            Interviewer's response (next question or feedback)
+            True if the reply was the introduction and a first question should be asked
         """
-        # Extract name during introduction
-        if self.state.stage == InterviewStage.INTRODUCTION and not self.state.candidate_name:
-            # Simple name extraction (can be improved)
-            words = transcript.strip().split()
-            for i, word in enumerate(words):
-                if word.lower() in ["i'm", "im", "i am", "my name is", "this is", "name's"]:
-                    if i + 1 < len(words):
-                        self.state.candidate_name = words[i + 1].strip(".,!?")
-                        break
-            
-            # Move to technical questions
-            self.state.stage = InterviewStage.TECHNICAL
-            return self._ask_next_question()
+        if self.state.stage != InterviewStage.INTRODUCTION or self.state.candidate_name:
+            return False
         
-        # Save the response
+        # Simple name extraction (can be improved)
+        words = transcript.strip().split()
+        for i, word in enumerate(words):
+            if word.lower() in ["i'm", "im", "i am", "my name is", "this is", "name's"]:
+                if i + 1 < len(words):
+                    self.state.candidate_name = words[i + 1].strip(".,!?")
+                    break
+        
+        # Move to technical questions
+        self.state.stage = InterviewStage.TECHNICAL
+        return True
+    
+    def _record_response(self, transcript: str):
+        """Save the candidate's answer to the current question"""
         self.state.responses.append({
             "question": self.state.current_question or "Introduction",
             "answer": transcript,
             "stage": self.state.stage
         })
+    
+    def _advance(self) -> str:
+        """
+        Progress through the interview after a scored answer
         
-        # Score the response (simple scoring for now)
-        score = self._score_response(transcript)
-        self.state.scores.append(score)
-        
-        # Progress through interview
+        Returns:
+            Next step: "transition", "conclude" or "question"
+        """
         self.state.questions_asked += 1
         
         # Decide next action based on stage and questions asked
         if self.state.stage == InterviewStage.TECHNICAL and self.state.questions_asked >= 3:
             self.state.stage = InterviewStage.BEHAVIORAL
             self.state.questions_asked = 0
-            return self._transition_to_behavioral()
+            return "transition"
         
         elif self.state.stage == InterviewStage.BEHAVIORAL and self.state.questions_asked >= 2:
             self.state.stage = InterviewStage.CONCLUSION
-            return self._conclude_interview()
+            return "conclude"
         
+        # Ask follow-up or next question
+        return "question"
+    
+    def _peek_step(self) -> str:
+        """Step _advance will take after the next answer, without changing state"""
+        questions_asked = self.state.questions_asked + 1
+        if self.state.stage == InterviewStage.TECHNICAL and questions_asked >= 3:
+            return "transition"
+        elif self.state.stage == InterviewStage.BEHAVIORAL and questions_asked >= 2:
+            return "conclude"
+        return "question"
+    
+    def process_candidate_response(self, transcript: str) -> str:
+        """
+        Process candidate's response and generate next question or feedback
+        
+        Args:
+            transcript: What the candidate said
+            
+        Returns:
+            Interviewer's response (next question or feedback)
+        """
+        # Extract name during introduction
+        if self._handle_introduction(transcript):
+            return self._ask_next_question()
+        
+        # Save the response
+        self._record_response(transcript)
+        
+        # Score the response
+        score = self._score_response(transcript)
+        self.state.scores.append(score)
+        
+        step = self._advance()
+        if step == "transition":
+            return self._transition_to_behavioral()
+        elif step == "conclude":
+            return self._conclude_interview()
         else:
-            # Ask follow-up or next question
             return self._ask_next_question()
     
-    def _ask_next_question(self) -> str:
-        """Ask the next question based on current stage and previous answers"""
-        # Build context from previous responses
+    async def aprocess_candidate_response(
+        self,
+        transcript: str,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Async version of process_candidate_response
+        
+        The answer is scored in the background while the next question is
+        generated, so the reply does not wait on the scoring round trip.
+        Only the conclusion, which reports the final score, waits for it.
+        
+        Args:
+            transcript: What the candidate said
+            on_delta: Optional callback receiving the reply as it streams in
+            
+        Returns:
+            Interviewer's response (next question or feedback)
+        """
+        # Extract name during introduction
+        if self._handle_introduction(transcript):
+            return await self._aask_next_question(on_delta)
+        
+        # Save the response
+        self._record_response(transcript)
+        
+        # Score the response concurrently with the next step
+        self._schedule_score(transcript)
+        
+        step = self._advance()
+        if step == "transition":
+            return await self._atransition_to_behavioral(on_delta)
+        elif step == "conclude":
+            await self.wait_for_scores()
+            return await self._aconclude_interview(on_delta)
+        else:
+            return await self._aask_next_question(on_delta)
+    
+    def _schedule_score(self, transcript: str):
+        """
+        Score a response in a background task
+        
+        The evaluation prompt is built immediately so it refers to the
+        question that was answered, not the one being generated. Scores are
+        appended in answer order by chaining each task on the previous one.
+        
+        Args:
+            transcript: Candidate's response
+        """
+        evaluation_prompt = self._evaluation_prompt(transcript)
+        previous = self._score_task
+        
+        async def _score():
+            # Off the reply path, so timed here rather than as part of a turn
+            with stage_metrics.time("scoring", self.job_role):
+                score = await self._ascore_response(transcript, evaluation_prompt)
+            if previous is not None:
+                await previous
+            self.state.scores.append(score)
+        
+        self._score_task = asyncio.create_task(_score())
+    
+    async def wait_for_scores(self):
+        """Wait until every scheduled score has been recorded"""
+        if self._score_task is not None:
+            await self._score_task
+    
+    def _next_question_prompt(self) -> Optional[str]:
+        """
+        Build the prompt for the next question based on current stage and previous answers
+        
+        Returns:
+            Prompt text, or None if no further questions should be asked
+        """
+        last_answer = self.state.responses[-1]['answer'] if self.state.responses else None
+        return self._question_prompt(self.state.stage, self.state.questions_asked + 1, last_answer)
+    
+    def _question_prompt(
+        self,
+        stage: InterviewStage,
+        question_number: int,
+        last_answer: Optional[str]
+    ) -> Optional[str]:
+        """
+        Build a question prompt
+        
+        Args:
+            stage: Interview stage the question belongs to
+            question_number: 1-based number of the question within the stage
+            last_answer: Candidate's previous answer used as context, if any
+            
+        Returns:
+            Prompt text, or None if the stage has no questions
+        """
+        # Build context from the previous response
         context = ""
-        if self.state.responses:
-            last_response = self.state.responses[-1]
-            context = f"\n\nThe candidate's last answer was: '{last_response['answer']}'"
+        if last_answer is not None:
+            context = f"\n\nThe candidate's last answer was: '{last_answer}'"
         
         # Generate dynamic question using LLM
-        if self.state.stage == InterviewStage.TECHNICAL:
-            prompt = f"""You are conducting a technical interview for a {self.job_role} position.
+        if stage == InterviewStage.TECHNICAL:
+            return f"""You are conducting a technical interview for a {self.job_role} position.
             
-Question number: {self.state.questions_asked + 1} of 3
+Question number: {question_number} of 3
 Stage: Technical Questions
 {context}
 
@@ -171,10 +359,10 @@ Generate ONE relevant technical question. Consider:
 
 Ask the question naturally in 1-2 sentences. Be conversational, not robotic."""
 
-        elif self.state.stage == InterviewStage.BEHAVIORAL:
-            prompt = f"""You are conducting a behavioral interview for a {self.job_role} position.
+        elif stage == InterviewStage.BEHAVIORAL:
+            return f"""You are conducting a behavioral interview for a {self.job_role} position.
             
-Question number: {self.state.questions_asked + 1} of 2
+Question number: {question_number} of 2
 Stage: Behavioral Questions
 {context}
 
@@ -186,53 +374,142 @@ Generate ONE relevant behavioral question. Focus on:
 
 Ask the question naturally in 1-2 sentences. Be conversational."""
 
-        else:
+        return None
+    
+    def _ask_next_question(self) -> str:
+        """Ask the next question based on current stage and previous answers"""
+        prompt = self._next_question_prompt()
+        if prompt is None:
             return "Thank you for your time today."
         
         # Get LLM-generated question
-        response = self.agent.run(prompt)
-        question_text = response.content if hasattr(response, 'content') else str(response)
+        question_text = self._run(prompt)
         
         self.state.current_question = question_text
         return question_text
     
-    def _transition_to_behavioral(self) -> str:
-        """Transition from technical to behavioral questions"""
-        response = self.agent.run(
+    async def _aask_next_question(self, on_delta: Optional[Callable[[str], None]] = None) -> str:
+        """Async version of _ask_next_question"""
+        prompt = self._next_question_prompt()
+        if prompt is None:
+            closing = "Thank you for your time today."
+            if on_delta is not None:
+                on_delta(closing)
+            return closing
+        
+        # Get LLM-generated question
+        question_text = await self._arun(prompt, on_delta)
+        
+        self.state.current_question = question_text
+        return question_text
+    
+    def speculative_question_prompt(self) -> Optional[Tuple[str, bool]]:
+        """
+        Prompt for the question that will follow the current one
+        
+        Built before the candidate answers, so it carries no answer context.
+        
+        Returns:
+            Tuple of (prompt, depends_on_answer), or None if the next reply
+            will not be a question (transition or conclusion). depends_on_answer
+            is False when the real prompt will be identical.
+        """
+        if self.state.stage == InterviewStage.INTRODUCTION and not self.state.candidate_name:
+            # The first technical question never has answer context
+            return self._question_prompt(InterviewStage.TECHNICAL, 1, None), False
+        
+        if self._peek_step() != "question":
+            return None
+        
+        # _advance will have counted the pending answer
+        prompt = self._question_prompt(self.state.stage, self.state.questions_asked + 2, None)
+        if prompt is None:
+            return None
+        return prompt, True
+    
+    async def aprefetch_question(self, prompt: str) -> str:
+        """
+        Generate a question ahead of time without changing interview state
+        
+        Args:
+            prompt: Prompt from speculative_question_prompt
+            
+        Returns:
+            Question text
+        """
+        return await self._arun(prompt)
+    
+    def accept_prefetched_question(self, transcript: str, question_text: str) -> str:
+        """
+        Apply the candidate's answer and ask a question generated ahead of it
+        
+        Only valid when speculative_question_prompt was built on the current
+        turn, i.e. the next step is known to be a question.
+        
+        Args:
+            transcript: What the candidate said
+            question_text: Prefetched question
+            
+        Returns:
+            The question, now the current question
+        """
+        if not self._handle_introduction(transcript):
+            self._record_response(transcript)
+            self._schedule_score(transcript)
+            self._advance()
+        
+        self.state.current_question = question_text
+        return question_text
+    
+    def _transition_prompt(self) -> str:
+        """Prompt for moving from technical to behavioral questions"""
+        return (
             "Thank the candidate for their technical answers. "
             "Now transition to behavioral questions to learn more about their work style. "
             "Keep it brief and natural."
         )
-        return response.content if hasattr(response, 'content') else str(response)
     
-    def _conclude_interview(self) -> str:
-        """Conclude the interview with final score"""
+    def _transition_to_behavioral(self) -> str:
+        """Transition from technical to behavioral questions"""
+        return self._run(self._transition_prompt())
+    
+    async def _atransition_to_behavioral(self, on_delta: Optional[Callable[[str], None]] = None) -> str:
+        """Async version of _transition_to_behavioral"""
+        return await self._arun(self._transition_prompt(), on_delta)
+    
+    def _conclusion_prompt(self) -> str:
+        """Prompt for concluding the interview with the final score"""
         final_score = self.get_final_score()
         
-        response = self.agent.run(
+        return (
             f"Thank the candidate {self.state.candidate_name or ''} for their time. "
             f"Provide brief, encouraging feedback. "
             f"Mention that they scored {final_score['total_score']:.1f} out of 100. "
             f"Tell them the team will be in touch soon. Keep it warm and professional."
         )
-        
-        return response.content if hasattr(response, 'content') else str(response)
     
-    def _score_response(self, transcript: str) -> float:
+    def _conclude_interview(self) -> str:
+        """Conclude the interview with final score"""
+        return self._run(self._conclusion_prompt())
+    
+    async def _aconclude_interview(self, on_delta: Optional[Callable[[str], None]] = None) -> str:
+        """Async version of _conclude_interview"""
+        return await self._arun(self._conclusion_prompt(), on_delta)
+    
+    def _evaluation_prompt(self, transcript: str) -> str:
         """
-        Score a response using LLM evaluation
+        Build the LLM evaluation prompt for a response
         
         Args:
             transcript: Candidate's response
             
         Returns:
-            Score from 0-100
+            Prompt asking for a 0-100 score
         """
         question = self.state.current_question or "Previous question"
         stage = self.state.stage
         
-        # Use LLM to evaluate the answer
-        evaluation_prompt = f"""You are evaluating a candidate's interview answer.
+        return f"""You are evaluating a candidate's interview answer.
 
 Question asked: "{question}"
 Stage: {stage}
@@ -254,20 +531,47 @@ For Behavioral Questions:
 - Professional demeanor (20 points)
 
 Respond with ONLY a number between 0 and 100. No explanation, just the score."""
-
+    
+    def _parse_score(self, score_text: str, transcript: str) -> float:
+        """Extract a 0-100 score from the LLM evaluation"""
+        numbers = re.findall(r'\d+', score_text)
+        if numbers:
+            score = float(numbers[0])
+            return min(max(score, 0), 100)  # Clamp between 0-100
+        # Fallback to basic scoring if LLM doesn't return a number
+        return self._fallback_score(transcript)
+    
+    def _score_response(self, transcript: str) -> float:
+        """
+        Score a response using LLM evaluation
+        
+        Args:
+            transcript: Candidate's response
+            
+        Returns:
+            Score from 0-100
+        """
         try:
-            response = self.agent.run(evaluation_prompt)
-            score_text = response.content if hasattr(response, 'content') else str(response)
+            return self._parse_score(self._run(self._evaluation_prompt(transcript)), transcript)
+        except Exception as e:
+            print(f"Error in LLM scoring: {e}")
+            return self._fallback_score(transcript)
+    
+    async def _ascore_response(self, transcript: str, evaluation_prompt: Optional[str] = None) -> float:
+        """
+        Async version of _score_response
+        
+        Args:
+            transcript: Candidate's response
+            evaluation_prompt: Prebuilt evaluation prompt (built from current state if None)
             
-            # Extract number from response
-            import re
-            numbers = re.findall(r'\d+', score_text)
-            if numbers:
-                score = float(numbers[0])
-                return min(max(score, 0), 100)  # Clamp between 0-100
-            else:
-                # Fallback to basic scoring if LLM doesn't return a number
-                return self._fallback_score(transcript)
+        Returns:
+            Score from 0-100
+        """
+        if evaluation_prompt is None:
+            evaluation_prompt = self._evaluation_prompt(transcript)
+        try:
+            return self._parse_score(await self._arun(evaluation_prompt), transcript)
         except Exception as e:
             print(f"Error in LLM scoring: {e}")
             return self._fallback_score(transcript)
@@ -320,3 +624,4 @@ Respond with ONLY a number between 0 and 100. No explanation, just the score."""
     def reset(self):
         """Reset interview state for new candidate"""
         self.state = InterviewState()
+        self._score_task = None
@@ -0,0 +1,165 @@
+"""
+Warm pool of pre-generated interview introductions
+The introduction only depends on the job role, so a few text + audio
+variants per role are generated in the background at startup and
+refreshed periodically. start_interview can then greet the candidate
+without waiting on an LLM round trip and a TTS synthesis. Each variant is
+kept in every codec the server can produce, so clients that negotiate
+Opus get the same instant greeting.
+
+Only the configured roles (INTRO_POOL_ROLES) are pooled. The job role comes
+from the client, so other roles are generated per session instead of
+costing LLM and TTS calls, memory and refreshes for every string sent.
+"""
+import os
+import random
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+from core.interview_agent import InterviewAgent
+from core.audio_codecs import MP3, available_codecs
+from core.audio_services import TextToSpeechService
+
+logger = logging.getLogger(__name__)
+
+INTRO_POOL_ROLES = [
+    role.strip() for role in os.getenv("INTRO_POOL_ROLES", "Software Engineer").split(",") if role.strip()
+]
+INTRO_POOL_VARIANTS = int(os.getenv("INTRO_POOL_VARIANTS", "3"))
+INTRO_POOL_REFRESH_SECONDS = int(os.getenv("INTRO_POOL_REFRESH_SECONDS", str(6 * 60 * 60)))
+
+
+class IntroductionPool:
+    """Per-role pool of introduction variants, each with its audio per codec"""
+
+    def __init__(
+        self,
+        roles: Iterable[str] = INTRO_POOL_ROLES,
+        variants_per_role: int = INTRO_POOL_VARIANTS,
+        refresh_seconds: int = INTRO_POOL_REFRESH_SECONDS
+    ):
+        """
+        Initialize the pool
+
+        Args:
+            roles: Roles introductions are pooled for
+            variants_per_role: Number of introductions kept per role
+            refresh_seconds: Interval between background regenerations
+        """
+        self.roles = frozenset(roles)
+        self.variants_per_role = variants_per_role
+        self.refresh_seconds = refresh_seconds
+        self.tts = TextToSpeechService()
+        self._pool: Dict[str, List[Tuple[str, Dict[str, bytes]]]] = {}
+        self._warming: Dict[str, asyncio.Task] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+
+    def take(self, job_role: str, codec: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Get a ready introduction for a role
+
+        A miss on a pooled role schedules it to be warmed so later
+        sessions hit; other roles are never warmed.
+
+        Args:
+            job_role: Role being interviewed for
+            codec: Codec MIME type the audio is needed in
+
+        Returns:
+            Tuple of (intro_text, intro_audio), or None if none is ready
+        """
+        variants = [
+            (intro_text, audio[codec]) for intro_text, audio in self._pool.get(job_role, []) if codec in audio
+        ]
+        if not variants:
+            self.misses += 1
+            if job_role in self.roles:
+                self.schedule(job_role)
+            return None
+        self.hits += 1
+        return random.choice(variants)
+
+    def schedule(self, job_role: str):
+        """Warm a role in the background unless it is already being warmed"""
+        task = self._warming.get(job_role)
+        if task is None or task.done():
+            self._warming[job_role] = asyncio.create_task(self.warm(job_role))
+
+    async def warm(self, job_role: str):
+        """
+        Generate a fresh set of variants for a role and swap them in
+
+        Args:
+            job_role: Role to generate introductions for
+        """
+        results = await asyncio.gather(
+            *(self._generate(job_role) for _ in range(self.variants_per_role)),
+            return_exceptions=True
+        )
+        variants = [r for r in results if isinstance(r, tuple)]
+        for r in results:
+            if isinstance(r, BaseException):
+                logger.warning(f"Could not pre-generate introduction for {job_role}: {r}")
+        if variants:
+            self._pool[job_role] = variants
+            logger.info(f"Introduction pool ready for {job_role} ({len(variants)} variants)")
+
+    async def _generate(self, job_role: str) -> Tuple[str, Dict[str, bytes]]:
+        """
+        Generate one introduction variant in every available codec
+
+        The variant is kept if its MP3 synthesis succeeds; a codec whose
+        transcode fails is left out and served by start_interview instead.
+        """
+        intro_text = await InterviewAgent(job_role=job_role).aget_introduction()
+        intro_audio = {}
+        for codec in available_codecs():
+            # MP3 first: later codecs are transcoded from its cached synthesis
+            audio = await self.tts.synthesize_speech(intro_text, codec)
+            if audio:
+                intro_audio[codec] = audio
+            elif codec == MP3:
+                raise RuntimeError("TTS returned no audio")
+            else:
+                logger.warning(f"Could not pre-generate {codec} introduction for {job_role}")
+        return intro_text, intro_audio
+
+    def start(self):
+        """Start warming the pooled roles and the periodic refresh (returns immediately)"""
+        for role in sorted(self.roles):
+            self.schedule(role)
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """Cancel background warming and refresh"""
+        tasks = list(self._warming.values())
+        if self._refresh_task is not None:
+            tasks.append(self._refresh_task)
+            self._refresh_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._warming.clear()
+
+    async def _refresh_loop(self):
+        """Periodically regenerate every role in the pool"""
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            for role in list(self._pool):
+                await self.warm(role)
+
+    def stats(self) -> Dict[str, object]:
+        """Pool contents and hit counters"""
+        return {
+            "roles": {role: len(variants) for role, variants in self._pool.items()},
+            "codecs": list(available_codecs()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Process-wide pool used by interview sessions
+intro_pool = IntroductionPool()
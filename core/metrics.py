@@ -0,0 +1,184 @@
+"""
+In-process latency metrics for interview turns
+Every turn is timed by stage (transcription, reply generation, speech
+synthesis, socket send, ...) and recorded per job role, both as cumulative
+histogram buckets and as a window of recent samples for percentiles.
+Rendered in the Prometheus text format by the /metrics endpoint.
+
+The job role is sent by the client, so only configured roles
+(METRICS_JOB_ROLES) get their own series; any other role is recorded as
+"other" to keep the number of series bounded.
+"""
+import os
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+# Histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Recent samples kept per series for percentiles
+SAMPLE_WINDOW = 1000
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Job roles recorded under their own label; the rest share OTHER_JOB_ROLE
+METRICS_JOB_ROLES = [
+    role.strip() for role in os.getenv("METRICS_JOB_ROLES", "Software Engineer").split(",") if role.strip()
+]
+OTHER_JOB_ROLE = "other"
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    """Format a Prometheus label set"""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+class LatencyHistogram:
+    """Cumulative bucket counts plus a window of recent samples"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS, window: int = SAMPLE_WINDOW):
+        """
+        Initialize the histogram
+
+        Args:
+            buckets: Bucket upper bounds in seconds
+            window: Number of recent samples kept for percentiles
+        """
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float):
+        """Record one sample"""
+        self.count += 1
+        self.sum += seconds
+        self._recent.append(seconds)
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.bucket_counts[i] += 1
+
+    def percentile(self, p: float) -> float:
+        """Percentile (0-1) over the recent samples"""
+        samples = sorted(self._recent)
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(p * len(samples)))]
+
+    def summary(self) -> Dict[str, float]:
+        """Count, sum and recent percentiles"""
+        result = {"count": self.count, "sum": self.sum}
+        for q in QUANTILES:
+            result[f"p{int(q * 100)}"] = self.percentile(q)
+        return result
+
+
+class StageMetrics:
+    """Latency histograms keyed by (stage, job_role)"""
+
+    def __init__(self, job_roles: Iterable[str] = METRICS_JOB_ROLES):
+        """
+        Initialize the metrics
+
+        Args:
+            job_roles: Roles given their own series (others are labelled "other")
+        """
+        self.job_roles = frozenset(job_roles)
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, job_role: str, seconds: float):
+        """
+        Record the duration of one stage
+
+        Args:
+            stage: Stage name (e.g. "stt", "llm", "tts", "send")
+            job_role: Role being interviewed for
+            seconds: Measured duration
+        """
+        if job_role not in self.job_roles:
+            job_role = OTHER_JOB_ROLE
+        with self._lock:
+            histogram = self._histograms.get((stage, job_role))
+            if histogram is None:
+                histogram = self._histograms[(stage, job_role)] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, stage: str, job_role: str) -> Iterator[None]:
+        """Time the enclosed block as one stage sample"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, job_role, time.perf_counter() - start)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Summaries as {stage: {job_role: {count, sum, p50, p95, p99}}}"""
+        with self._lock:
+            items = sorted(self._histograms.items())
+            result: Dict[str, Dict[str, Dict[str, float]]] = {}
+            for (stage, job_role), histogram in items:
+                result.setdefault(stage, {})[job_role] = histogram.summary()
+            return result
+
+    def render_prometheus(self) -> str:
+        """Render every series in the Prometheus text exposition format"""
+        name = "interview_stage_duration_seconds"
+        quantile_name = "interview_stage_duration_quantile_seconds"
+        lines: List[str] = [
+            f"# HELP {name} Interview turn latency by stage and job role",
+            f"# TYPE {name} histogram",
+        ]
+        quantile_lines: List[str] = [
+            f"# HELP {quantile_name} Recent interview turn latency percentiles",
+            f"# TYPE {quantile_name} gauge",
+        ]
+
+        with self._lock:
+            for (stage, job_role), histogram in sorted(self._histograms.items()):
+                for bound, count in zip(histogram.buckets, histogram.bucket_counts):
+                    lines.append(f"{name}_bucket{_labels(stage=stage, job_role=job_role, le=bound)} {count}")
+                lines.append(f"{name}_bucket{_labels(stage=stage, job_role=job_role, le='+Inf')} {histogram.count}")
+                lines.append(f"{name}_sum{_labels(stage=stage, job_role=job_role)} {histogram.sum}")
+                lines.append(f"{name}_count{_labels(stage=stage, job_role=job_role)} {histogram.count}")
+                for q in QUANTILES:
+                    quantile_lines.append(
+                        f"{quantile_name}{_labels(stage=stage, job_role=job_role, quantile=q)} "
+                        f"{histogram.percentile(q)}"
+                    )
+
+        return "\n".join(lines + quantile_lines) + "\n"
+
+
+def render_gauges(prefix: str, stats: Mapping[str, object]) -> str:
+    """
+    Render the numeric values of a stats dict as Prometheus gauges
+
+    Args:
+        prefix: Metric name prefix (e.g. "interview_admission")
+        stats: Stats dict such as AdmissionController.stats()
+
+    Returns:
+        Exposition text, one gauge per numeric entry
+    """
+    lines: List[str] = []
+    for key, value in stats.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        lines.append(f"# TYPE {prefix}_{key} gauge")
+        lines.append(f"{prefix}_{key} {value}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+# Process-wide stage latency metrics
+stage_metrics = StageMetrics()
@@ -0,0 +1,195 @@
+"""
+Versioned schema migrations
+create_all only creates missing tables, so changes to existing tables
+(new columns, new indexes) are applied here. Each migration runs once per
+database, in version order, inside a transaction, and is recorded in the
+schema_migrations table. Migrations must be idempotent so they are also
+safe on a database that create_all has just built.
+
+Several workers may start at once, so each migration holds SQLite's write
+lock (BEGIN IMMEDIATE) while it runs, and the applied version is re-read
+under the lock: a migration another worker already applied is skipped.
+"""
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Iterator, List, Set, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+SCHEMA_MIGRATIONS_DDL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    description TEXT NOT NULL,
+    applied_at TIMESTAMP NOT NULL
+)
+"""
+
+
+def _column_names(conn: Connection, table: str) -> Set[str]:
+    """Columns of an existing table"""
+    return {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
+
+
+def _applied_version(conn: Connection) -> int:
+    """Latest version recorded in schema_migrations"""
+    return conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")).scalar()
+
+
+@contextmanager
+def write_locked(engine: Engine) -> Iterator[Connection]:
+    """
+    Connection inside a transaction that holds the database write lock
+
+    pysqlite does not begin transactions before DDL by default, so the
+    driver's transaction handling is switched off and BEGIN IMMEDIATE is
+    issued explicitly: the DDL and the schema_migrations row commit or roll
+    back together, and concurrent migrators wait for the lock.
+    """
+    with engine.connect() as conn:
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+        conn.exec_driver_sql("COMMIT")
+
+
+def _add_column(conn: Connection, table: str, name: str, ddl: str):
+    """Add a column unless it already exists"""
+    if name not in _column_names(conn, table):
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+
+
+def reattempt_support(conn: Connection):
+    """Re-attempt columns on candidates and the candidate_attempts table"""
+    from core.models import CandidateAttempt
+
+    _add_column(conn, "candidates", "can_reattempt", "BOOLEAN DEFAULT 0")
+    _add_column(conn, "candidates", "current_attempt_number", "INTEGER DEFAULT 1")
+    CandidateAttempt.__table__.create(conn, checkfirst=True)
+
+
+def hot_query_indexes(conn: Connection):
+    """Indexes for the dashboard, round filter and attempt history queries"""
+    # Candidate.user_id lookups are served by its unique constraint's index
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_candidates_updated_at ON candidates (updated_at)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_candidates_current_round ON candidates (current_round)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_candidate_attempts_candidate_attempt "
+        "ON candidate_attempts (candidate_id, attempt_number)"
+    ))
+
+
+def dashboard_stats(conn: Connection):
+    """Aggregate table for the admin dashboard, filled from candidates"""
+    from core.models import DashboardStats
+    from core.dashboard_stats import rebuild
+
+    DashboardStats.__table__.create(conn, checkfirst=True)
+    rebuild(conn)
+
+
+def candidate_listing_indexes(conn: Connection):
+    """Indexes for filtered, score-sorted and keyset-paginated candidate listing"""
+    # (current_round, updated_at) also serves current_round lookups
+    conn.execute(text("DROP INDEX IF EXISTS ix_candidates_current_round"))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_candidates_round_updated_at "
+        "ON candidates (current_round, updated_at)"
+    ))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_candidates_role_updated_at "
+        "ON candidates (role_applied_for, updated_at)"
+    ))
+    for column in ("round_1_score", "round_2_score", "round_3_score"):
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_candidates_{column} ON candidates ({column})"))
+
+
+def application_pipelines(conn: Connection):
+    """Application pipeline table, filled from the legacy candidates.json"""
+    from core.models import ApplicationPipeline
+    from core.notification_service import CANDIDATES_FILE, import_candidates_json
+
+    ApplicationPipeline.__table__.create(conn, checkfirst=True)
+    imported = import_candidates_json(conn, CANDIDATES_FILE)
+    if imported:
+        print(f"Imported {imported} candidates from {CANDIDATES_FILE}")
+
+
+def checkpoint_speculative(conn: Connection):
+    """Speculative-question flag on interview checkpoints"""
+    _add_column(conn, "interview_checkpoints", "speculative", "BOOLEAN DEFAULT 0")
+
+
+def listing_status_index(conn: Connection):
+    """Round 3 score in the round listing index, so status and score filters read no extra rows"""
+    conn.execute(text("DROP INDEX IF EXISTS ix_candidates_round_updated_at"))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_candidates_round_updated_at_score "
+        "ON candidates (current_round, updated_at, id, round_3_score)"
+    ))
+
+
+# (version, description, migration) in the order they must be applied
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "Re-attempt support", reattempt_support),
+    (2, "Indexes for hot candidate queries", hot_query_indexes),
+    (3, "Dashboard statistics aggregate", dashboard_stats),
+    (4, "Indexes for candidate listing filters and sorts", candidate_listing_indexes),
+    (5, "Application pipeline table (from candidates.json)", application_pipelines),
+    (6, "Speculative flag on interview checkpoints", checkpoint_speculative),
+    (7, "Round 3 score in the candidate listing round index", listing_status_index),
+]
+
+
+def current_version(engine: Engine) -> int:
+    """
+    Latest migration applied to a database
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        Version number, 0 if no migration has run
+    """
+    with engine.begin() as conn:
+        conn.execute(text(SCHEMA_MIGRATIONS_DDL))
+        return _applied_version(conn)
+
+
+def migrate(engine: Engine) -> List[int]:
+    """
+    Apply pending migrations in order
+
+    Args:
+        engine: Database engine (tables must already exist, see init_db)
+
+    Returns:
+        Versions applied by this call (not those applied meanwhile by another process)
+    """
+    applied = []
+    version = current_version(engine)
+
+    for number, description, migration in MIGRATIONS:
+        if number <= version:
+            continue
+        with write_locked(engine) as conn:
+            # Another worker may have applied it while this one waited for the lock
+            version = _applied_version(conn)
+            if number <= version:
+                continue
+            migration(conn)
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, description, applied_at) VALUES (:v, :d, :t)"),
+                {"v": number, "d": description, "t": datetime.utcnow()}
+            )
+        print(f"Applied migration {number}: {description}")
+        applied.append(number)
+
+    return applied
@@ -1,7 +1,7 @@
 """
 Database models for authentication and candidate management
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from core.database import Base
@@ -45,6 +45,11 @@ class Candidate(Base):
     Linked to User model via user_id
     """
     __tablename__ = "candidates"
+    __table_args__ = (
+        # Admin listing filters by status (round, Round 3 score) or role, newest first
+        Index("ix_candidates_round_updated_at_score", "current_round", "updated_at", "id", "round_3_score"),
+        Index("ix_candidates_role_updated_at", "role_applied_for", "updated_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True)
@@ -56,9 +61,9 @@ class Candidate(Base):
     
     # Interview progress
     current_round = Column(Integer, default=0)  # 0 = not started, 1-3 = rounds
-    round_1_score = Column(Integer, nullable=True)  # Aptitude score (out of 5)
-    round_2_score = Column(Integer, nullable=True)  # DSA score (out of 5)
-    round_3_score = Column(Integer, nullable=True)  # Voice interview score (0-100)
+    round_1_score = Column(Integer, nullable=True, index=True)  # Aptitude score (out of 5)
+    round_2_score = Column(Integer, nullable=True, index=True)  # DSA score (out of 5)
+    round_3_score = Column(Integer, nullable=True, index=True)  # Voice interview score (0-100)
     round_3_analysis = Column(Text, nullable=True)  # JSON string with detailed feedback
     overall_analysis = Column(Text, nullable=True)  # Comprehensive analysis from all rounds (admin-only)
     
@@ -69,7 +74,7 @@ class Candidate(Base):
     )  # registered, applied, in_progress, completed, rejected
     
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Re-attempt fields
     can_reattempt = Column(Boolean, default=False)
@@ -86,6 +91,10 @@ class CandidateAttempt(Base):
     Each time a candidate re-attempts, their previous scores are archived here
     """
     __tablename__ = "candidate_attempts"
+    __table_args__ = (
+        # Attempt history is read per candidate in attempt order
+        Index("ix_candidate_attempts_candidate_attempt", "candidate_id", "attempt_number"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     candidate_id = Column(Integer, ForeignKey("candidates.id"), nullable=False)
@@ -110,3 +119,67 @@ class CandidateAttempt(Base):
     # Relationship
     candidate = relationship("Candidate", back_populates="attempts")
 
+
+class InterviewCheckpoint(Base):
+    """
+    Interview session checkpoint
+    Written after every turn so a dropped WebSocket can resume the interview
+    (on any worker) without regenerating questions or audio
+    """
+    __tablename__ = "interview_checkpoints"
+    
+    session_id = Column(String, primary_key=True)
+    resume_token = Column(String, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    job_role = Column(String, nullable=False)
+    streaming = Column(Boolean, default=False)
+    speculative = Column(Boolean, default=False)
+    turn = Column(Integer, default=0)  # Increases with every checkpoint
+    state = Column(Text, nullable=False)  # InterviewState JSON
+    conversation_log = Column(Text, nullable=False)  # JSON list
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class ApplicationPipeline(Base):
+    """
+    Resume-screening application pipeline (OTP-gated rounds)
+    One row per applicant email, read and written individually by
+    core/notification_service.py; replaces data/candidates.json
+    """
+    __tablename__ = "application_pipelines"
+    
+    email = Column(String, primary_key=True)
+    name = Column(String)
+    role = Column(String)
+    current_round = Column(String)
+    next_round = Column(String)
+    otp = Column(String)
+    otp_verified = Column(Boolean, default=False)
+    status = Column(String, index=True)  # Shortlisted, Completed
+    rounds = Column(Text, nullable=False)  # JSON: round name -> {"status", "otp", ...}
+    version = Column(Integer, nullable=False)  # Optimistic lock against concurrent updates
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __mapper_args__ = {"version_id_col": version}
+
+
+class DashboardStats(Base):
+    """
+    Admin dashboard aggregates over candidates (single row, id=1)
+    Kept current by the flush hook in core/dashboard_stats.py, in the same
+    transaction as the candidate change
+    """
+    __tablename__ = "dashboard_stats"
+    
+    id = Column(Integer, primary_key=True)
+    total_candidates = Column(Integer, nullable=False, default=0)
+    active_candidates = Column(Integer, nullable=False, default=0)  # application_completed
+    interviewed_candidates = Column(Integer, nullable=False, default=0)  # current_round > 0
+    round_3_score_sum = Column(Integer, nullable=False, default=0)
+    round_3_score_count = Column(Integer, nullable=False, default=0)
+    rebuilt_at = Column(DateTime, nullable=True)
+
+
+# Registers the flush hook that maintains DashboardStats
+import core.dashboard_stats  # noqa: E402,F401
@@ -2,27 +2,147 @@ import random
 import string
 import json
 from pathlib import Path
+from typing import Callable, Optional
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm.exc import StaleDataError
 from core.config import DATA_DIR, RESEND_API_KEY, SENDER_EMAIL
+from core.database import SessionLocal
+from core.models import ApplicationPipeline
 
+# Legacy JSON store, imported once into application_pipelines (migration 5)
 CANDIDATES_FILE = DATA_DIR / "candidates.json"
 
-def get_candidates_db():
-    if not CANDIDATES_FILE.exists():
-        with open(CANDIDATES_FILE, 'w') as f:
-            json.dump({}, f)
-        return {}
-    
+# Attempts at a read-modify-write that lost a race with another worker
+UPDATE_ATTEMPTS = 3
+
+def _as_dict(row: ApplicationPipeline) -> dict:
+    """Candidate record in the shape the JSON store used"""
+    return {
+        "email": row.email,
+        "name": row.name,
+        "role": row.role,
+        "current_round": row.current_round,
+        "next_round": row.next_round,
+        "otp": row.otp,
+        "otp_verified": row.otp_verified,
+        "status": row.status,
+        "rounds": json.loads(row.rounds),
+    }
+
+def _columns(data: dict) -> dict:
+    """Column values for a candidate record"""
+    return {
+        "name": data.get("name"),
+        "role": data.get("role"),
+        "current_round": data.get("current_round"),
+        "next_round": data.get("next_round"),
+        "otp": data.get("otp"),
+        "otp_verified": bool(data.get("otp_verified", False)),
+        "status": data.get("status"),
+        "rounds": json.dumps(data.get("rounds", {})),
+    }
+
+def _apply(row: ApplicationPipeline, data: dict):
+    """Copy a candidate record onto its row"""
+    for column, value in _columns(data).items():
+        setattr(row, column, value)
+
+def get_candidate(email) -> Optional[dict]:
+    """Single-row lookup of a candidate record"""
+    db = SessionLocal()
     try:
-        with open(CANDIDATES_FILE, 'r') as f:
-            return json.load(f)
-    except Exception:
-        return {}
+        row = db.get(ApplicationPipeline, email)
+        return _as_dict(row) if row else None
+    finally:
+        db.close()
 
 def save_candidate(email, data):
-    db = get_candidates_db()
-    db[email] = data
-    with open(CANDIDATES_FILE, 'w') as f:
-        json.dump(db, f, indent=4)
+    """Insert or replace a candidate record"""
+    def replace(candidate):
+        candidate.clear()
+        candidate.update(data)
+        return candidate
+    
+    if update_candidate(email, replace) is not None:
+        return
+    db = SessionLocal()
+    try:
+        row = ApplicationPipeline(email=email)
+        _apply(row, data)
+        db.add(row)
+        db.commit()
+    except IntegrityError:
+        # Inserted concurrently by another request
+        db.rollback()
+        update_candidate(email, replace)
+    finally:
+        db.close()
+
+def update_candidate(email, mutate: Callable[[dict], object]):
+    """
+    Read-modify-write one candidate record in a transaction
+
+    The row's version column makes a concurrent update from another worker
+    fail instead of being overwritten; the change is then retried on the
+    fresh record.
+
+    Args:
+        email: Candidate email
+        mutate: Changes the record dict in place; its return value is passed
+            through (the change is not saved if it returns None)
+
+    Returns:
+        mutate's return value, or None if the candidate does not exist
+    """
+    for attempt in range(UPDATE_ATTEMPTS):
+        db = SessionLocal()
+        try:
+            row = db.get(ApplicationPipeline, email)
+            if row is None:
+                return None
+            candidate = _as_dict(row)
+            result = mutate(candidate)
+            if result is not None:
+                _apply(row, candidate)
+                db.commit()
+            return result
+        except (StaleDataError, OperationalError):
+            db.rollback()
+            if attempt == UPDATE_ATTEMPTS - 1:
+                raise
+        finally:
+            db.close()
+
+def import_candidates_json(conn: Connection, path: Path = CANDIDATES_FILE) -> int:
+    """
+    One-time import of the legacy candidates.json store
+
+    Records whose email already has a row are left alone, so the import can
+    be re-run safely.
+
+    Args:
+        conn: Connection inside the caller's transaction
+        path: JSON file mapping email to candidate record
+
+    Returns:
+        Number of records imported
+    """
+    if not Path(path).exists():
+        return 0
+    with open(path, 'r') as f:
+        records = json.load(f)
+
+    table = ApplicationPipeline.__table__
+    existing = set(conn.execute(select(table.c.email)).scalars())
+    rows = [
+        {"email": email, "version": 1, **_columns(data)}
+        for email, data in records.items() if email not in existing
+    ]
+    if rows:
+        conn.execute(table.insert(), rows)
+    return len(rows)
 
 def generate_otp(length=6):
     """Generate a random numeric OTP"""
@@ -252,40 +372,43 @@ def initialize_candidate(email, name, role):
     return candidate_data, otp
 
 def verify_otp(email, user_otp):
-    db = get_candidates_db()
-    if email not in db:
-        return False, "Candidate not found"
-    
-    candidate = db[email]
+    outcome = (False, "Candidate not found")
     
-    # Get current pending round
-    current_round = candidate.get("next_round")
-    round_info = candidate["rounds"].get(current_round)
-    
-    if not round_info or round_info.get("status") != "Pending":
-        return False, "No pending OTP for this round"
-    
-    if round_info.get("otp") == user_otp:
+    def verify(candidate):
+        nonlocal outcome
+        # Get current pending round
+        current_round = candidate.get("next_round")
+        round_info = candidate["rounds"].get(current_round)
+        
+        if not round_info or round_info.get("status") != "Pending":
+            outcome = (False, "No pending OTP for this round")
+            return None
+        
+        if round_info.get("otp") != user_otp:
+            outcome = (False, "Invalid OTP")
+            return None
+        
         # Success! Mark round as Ready
         round_info["status"] = "Verified"
         candidate["otp_verified"] = True
-        save_candidate(email, candidate)
-        return True, "OTP Verified successfully"
-    else:
-        return False, "Invalid OTP"
+        outcome = (True, "OTP Verified successfully")
+        return True
+    
+    update_candidate(email, verify)
+    return outcome
 
 def advance_candidate(email):
     """Call this when a round is completed to generate next OTP"""
-    db = get_candidates_db()
-    if email not in db:
-        return None
-    
-    candidate = db[email]
     rounds_order = ["Resume Screening", "Aptitude Round", "DSA Round", "HR Interview"]
-    current_round = candidate["next_round"]
     
-    try:
-        curr_idx = rounds_order.index(current_round)
+    def advance(candidate):
+        current_round = candidate["next_round"]
+        
+        try:
+            curr_idx = rounds_order.index(current_round)
+        except ValueError:
+            return None
+        
         # Mark current round as Passed
         candidate["rounds"][current_round]["status"] = "Passed"
         
@@ -300,15 +423,13 @@ def advance_candidate(email):
                 "otp": new_otp
             }
             candidate["otp_verified"] = False
-            save_candidate(email, candidate)
             # Note: send_otp_email will be called as a background task
             return candidate, new_otp, next_round
         else:
             # All rounds completed
             candidate["status"] = "Completed"
             candidate["next_round"] = "Offer Letter Sent"
-            save_candidate(email, candidate)
             # Note: send_offer_letter_email will be called as a background task
             return candidate, None, None
-    except ValueError:
-        return None
+    
+    return update_candidate(email, advance)
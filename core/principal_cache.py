@@ -0,0 +1,131 @@
+"""
+Cache of authenticated principals
+get_current_user resolves the JWT's user id to a User on every request.
+Resolved users are kept here for a short TTL in a size-bounded LRU, so
+repeat requests skip the database. Entries are snapshots of the user's
+columns (never the password hash); each hit returns a fresh, detached User
+built from the snapshot, so requests never share ORM state.
+
+Any flush that changes or deletes a User invalidates its entry once the
+transaction commits (see the Session hooks below). Other worker processes
+keep their entry until the TTL expires, which bounds how long a role change
+can take to apply everywhere.
+"""
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from core.models import User
+
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "10000"))
+
+# Columns copied into the cache (password_hash is left out on purpose)
+PRINCIPAL_COLUMNS = ("id", "email", "name", "role", "created_at")
+
+
+class PrincipalCache:
+    """TTL + LRU cache of user snapshots keyed by user id"""
+
+    def __init__(self, ttl_seconds: float = AUTH_CACHE_TTL_SECONDS, max_entries: int = AUTH_CACHE_SIZE):
+        """
+        Initialize the cache
+
+        Args:
+            ttl_seconds: Lifetime of an entry (0 disables the cache)
+            max_entries: Maximum cached users; least recently used go first
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()  # user_id -> (expires_at, snapshot)
+        self._lock = threading.Lock()
+
+        # Counters (per process)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, user_id: int) -> Optional[User]:
+        """
+        Look up a cached user
+
+        Args:
+            user_id: User id from the token
+
+        Returns:
+            Detached User, or None on a miss or expired entry
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return User(**entry[1])
+
+    def put(self, user: User):
+        """Cache a snapshot of a user loaded from the database"""
+        if self.ttl_seconds <= 0:
+            return
+        snapshot = {column: getattr(user, column) for column in PRINCIPAL_COLUMNS}
+        with self._lock:
+            self._entries[user.id] = (time.monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        """Drop a user's entry (after the user was modified or deleted)"""
+        with self._lock:
+            if self._entries.pop(user_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Size and hit counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+
+principal_cache = PrincipalCache()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_modified_users(session, flush_context):
+    """Remember users changed in this transaction"""
+    for obj in list(session.dirty) + list(session.deleted):
+        identity = inspect(obj).identity
+        if isinstance(obj, User) and identity is not None:
+            session.info.setdefault("modified_user_ids", set()).add(identity[0])
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_modified_users(session):
+    """Invalidate changed users once their new state is visible to readers"""
+    for user_id in session.info.pop("modified_user_ids", ()):
+        principal_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_modified_users(session):
+    """Nothing changed after a rollback"""
+    session.info.pop("modified_user_ids", None)
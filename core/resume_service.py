@@ -2,7 +2,7 @@ import os
 from pypdf import PdfReader
 from agno.agent import Agent
 from agno.models.openrouter import OpenRouter
-from agno.models.groq import Groq
+from core.clients import get_agent, get_groq_model
 from core.config import MODEL_NAME, MODEL_PROVIDER
 
 def extract_text_from_pdf(pdf_path):
@@ -25,18 +25,19 @@ def screen_resume(resume_text: str, job_role: str) -> bool:
     if not resume_text:
         return False
 
-    # Initialize agent with Groq (more reliable for screening)
-    model = Groq(id="llama-3.3-70b-versatile")
-
-    screening_agent = Agent(
-        model=model,
-        instructions=[
-            "You are an expert HR recruiter.",
-            f"Your task is to determine if the candidate's resume is suitable for the role of '{job_role}'.",
-            "Evaluate based on skills, experience, and education.",
-            "Respond ONLY with 'yes' or 'no'. No other text, no explanation.",
-        ],
-        markdown=False,
+    # Shared screening agent per role, using Groq (more reliable for screening)
+    screening_agent = get_agent(
+        ("resume_screener", job_role),
+        lambda: Agent(
+            model=get_groq_model("llama-3.3-70b-versatile"),
+            instructions=[
+                "You are an expert HR recruiter.",
+                f"Your task is to determine if the candidate's resume is suitable for the role of '{job_role}'.",
+                "Evaluate based on skills, experience, and education.",
+                "Respond ONLY with 'yes' or 'no'. No other text, no explanation.",
+            ],
+            markdown=False,
+        )
     )
 
     # Truncate resume if too long to avoid token issues
@@ -0,0 +1,119 @@
+"""
+Durable store for interview session checkpoints
+Backed by the application database, so a checkpoint written by one worker
+can be resumed by another
+"""
+import os
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from core.database import SessionLocal
+from core.models import InterviewCheckpoint
+
+logger = logging.getLogger(__name__)
+
+# How long a dropped interview can be resumed
+CHECKPOINT_TTL_SECONDS = int(os.getenv("CHECKPOINT_TTL_SECONDS", "3600"))
+
+# Columns written from a checkpoint dict (besides session_id)
+CHECKPOINT_FIELDS = (
+    "resume_token", "user_id", "job_role", "streaming", "speculative", "turn", "state", "conversation_log"
+)
+
+
+def save_checkpoint(checkpoint: Dict) -> bool:
+    """
+    Insert or update a session checkpoint
+    
+    Older turns of the same session never overwrite newer ones, so
+    out-of-order writes are safe. A row left under the same id by another
+    session (different resume_token) is replaced.
+    
+    Args:
+        checkpoint: Dict with session_id, resume_token, user_id, job_role,
+            streaming, speculative, turn, state and conversation_log (JSON strings)
+            
+    Returns:
+        True if the checkpoint was stored
+    """
+    db = SessionLocal()
+    try:
+        row = db.query(InterviewCheckpoint).filter(
+            InterviewCheckpoint.session_id == checkpoint["session_id"]
+        ).first()
+        
+        if row is None:
+            row = InterviewCheckpoint(session_id=checkpoint["session_id"])
+            db.add(row)
+        elif (
+            row.resume_token == checkpoint["resume_token"]
+            and row.turn is not None
+            and row.turn > checkpoint["turn"]
+        ):
+            return False
+        
+        for field in CHECKPOINT_FIELDS:
+            setattr(row, field, checkpoint[field])
+        row.updated_at = datetime.utcnow()
+        
+        db.commit()
+        return True
+    except Exception as e:
+        logger.error(f"Error saving interview checkpoint: {e}")
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+
+def load_checkpoint(session_id: str, resume_token: str) -> Optional[Dict]:
+    """
+    Load a resumable checkpoint
+    
+    Args:
+        session_id: Session to resume
+        resume_token: Secret issued to the client when the session started
+        
+    Returns:
+        Checkpoint dict, or None if missing, expired or the token does not match
+    """
+    db = SessionLocal()
+    try:
+        row = db.query(InterviewCheckpoint).filter(
+            InterviewCheckpoint.session_id == session_id
+        ).first()
+        
+        if row is None or row.resume_token != resume_token:
+            return None
+        
+        if row.updated_at < datetime.utcnow() - timedelta(seconds=CHECKPOINT_TTL_SECONDS):
+            db.delete(row)
+            db.commit()
+            return None
+        
+        return {
+            "session_id": row.session_id,
+            **{field: getattr(row, field) for field in CHECKPOINT_FIELDS},
+        }
+    finally:
+        db.close()
+
+
+def delete_checkpoint(session_id: str):
+    """
+    Delete a session checkpoint (the interview finished)
+    
+    Args:
+        session_id: Session whose checkpoint to remove
+    """
+    db = SessionLocal()
+    try:
+        db.query(InterviewCheckpoint).filter(
+            InterviewCheckpoint.session_id == session_id
+        ).delete()
+        db.commit()
+    except Exception as e:
+        logger.error(f"Error deleting interview checkpoint: {e}")
+        db.rollback()
+    finally:
+        db.close()
@@ -0,0 +1,129 @@
+"""
+Speculative prefetch of the next interview question
+While the candidate is answering, the question that would follow is
+generated (and synthesized) from a prompt that does not include the answer.
+When the answer arrives the prefetched question is either accepted, so the
+reply is sent without an LLM or TTS round trip, or discarded and the
+question regenerated with the answer as context.
+"""
+import os
+import re
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SPECULATIVE_QUESTIONS = os.getenv("SPECULATIVE_QUESTIONS", "false").lower() in ("1", "true", "yes")
+
+# Answers longer than this are worth a follow-up, so the prefetched
+# (answer-agnostic) question is regenerated with context
+SPECULATION_MAX_ANSWER_WORDS = int(os.getenv("SPECULATION_MAX_ANSWER_WORDS", "40"))
+
+# Reject a prefetched question when this share of its content words already
+# appear in the answer (the candidate has covered that topic)
+SPECULATION_MAX_OVERLAP = 0.5
+
+CONTENT_WORD = re.compile(r"[a-z']{4,}")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)"""
+    return max(1, len(text) // 4)
+
+
+class SpeculationStats:
+    """Process-wide hit and waste counters for speculative questions"""
+
+    def __init__(self):
+        self.started = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.cancelled = 0
+        self.wasted_tokens = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Hit rate and estimated tokens spent on discarded questions"""
+        resolved = self.accepted + self.rejected + self.cancelled
+        return {
+            "started": self.started,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "cancelled": self.cancelled,
+            "hit_rate": self.accepted / resolved if resolved else 0.0,
+            "wasted_tokens": self.wasted_tokens,
+        }
+
+
+speculation_stats = SpeculationStats()
+
+
+class SpeculativeQuestion:
+    """A next question being generated ahead of the candidate's answer"""
+
+    def __init__(self, prompt: str, depends_on_answer: bool, turn: int, task: asyncio.Task):
+        """
+        Initialize the speculation
+
+        Args:
+            prompt: Prompt the question is generated from
+            depends_on_answer: False when the real prompt will be identical
+                (the question can always be accepted)
+            turn: Session turn the speculation was started on
+            task: Task producing (question_text, question_audio)
+        """
+        self.prompt = prompt
+        self.depends_on_answer = depends_on_answer
+        self.turn = turn
+        self.task = task
+        speculation_stats.started += 1
+
+    async def resolve(self, transcript: str, turn: int) -> Optional[Tuple[str, Optional[bytes]]]:
+        """
+        Decide whether the prefetched question can answer this transcript
+
+        Args:
+            transcript: Candidate's answer
+            turn: Current session turn
+
+        Returns:
+            Tuple of (question_text, question_audio) if accepted, otherwise None
+        """
+        if turn != self.turn or (self.depends_on_answer and len(transcript.split()) > SPECULATION_MAX_ANSWER_WORDS):
+            self.cancel()
+            return None
+
+        try:
+            question_text, question_audio = await self.task
+        except Exception as e:
+            logger.warning(f"Speculative question failed: {e}")
+            speculation_stats.cancelled += 1
+            return None
+
+        if self.depends_on_answer and self._covered_by(question_text, transcript):
+            speculation_stats.rejected += 1
+            speculation_stats.wasted_tokens += estimate_tokens(self.prompt) + estimate_tokens(question_text)
+            return None
+
+        speculation_stats.accepted += 1
+        return question_text, question_audio
+
+    @staticmethod
+    def _covered_by(question: str, answer: str) -> bool:
+        """Whether the answer already covers most of the question's topic"""
+        question_words = set(CONTENT_WORD.findall(question.lower()))
+        if not question_words:
+            return False
+        answer_words = set(CONTENT_WORD.findall(answer.lower()))
+        return len(question_words & answer_words) / len(question_words) > SPECULATION_MAX_OVERLAP
+
+    def cancel(self):
+        """Discard the speculation, counting whatever it already spent"""
+        speculation_stats.cancelled += 1
+        if self.task.done() and not self.task.cancelled() and self.task.exception() is None:
+            question_text, _ = self.task.result()
+            speculation_stats.wasted_tokens += estimate_tokens(self.prompt) + estimate_tokens(question_text)
+        else:
+            # The prompt was sent even if generation had not finished
+            speculation_stats.wasted_tokens += estimate_tokens(self.prompt)
+            self.task.cancel()
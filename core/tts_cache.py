@@ -0,0 +1,213 @@
+"""
+Content-addressed cache for synthesized interviewer speech
+Keeps recently used audio in a size-bounded in-memory LRU and every entry
+on disk, so repeated utterances (greetings, transitions, closings) skip
+edge-tts across sessions and worker processes. Entries are stored per
+output codec, so transcoded replies are cached as well.
+"""
+import os
+import asyncio
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+from core.config import DATA_DIR
+from core.audio_codecs import FILE_EXTENSIONS, MP3
+
+logger = logging.getLogger(__name__)
+
+TTS_CACHE_DIR = Path(os.getenv("TTS_CACHE_DIR", str(DATA_DIR / "tts_cache")))
+TTS_CACHE_MEMORY_BYTES = int(os.getenv("TTS_CACHE_MEMORY_MB", "64")) * 1024 * 1024
+TTS_CACHE_DISK_BYTES = int(os.getenv("TTS_CACHE_DISK_MB", "512")) * 1024 * 1024
+
+# Check the disk tier against its size limit after this many writes
+DISK_PRUNE_INTERVAL = 100
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different strings share an entry"""
+    return " ".join(text.split())
+
+
+class TTSCache:
+    """Two-tier (memory LRU + disk) audio cache keyed by (voice, codec, normalized text)"""
+
+    def __init__(
+        self,
+        cache_dir: Path = TTS_CACHE_DIR,
+        max_memory_bytes: int = TTS_CACHE_MEMORY_BYTES,
+        max_disk_bytes: int = TTS_CACHE_DISK_BYTES
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory for the on-disk tier (shared between workers)
+            max_memory_bytes: Size limit of the in-memory LRU tier
+            max_disk_bytes: Size limit of the on-disk tier
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+
+        # Counters (per process)
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.synthesis_count = 0
+        self.synthesis_seconds = 0.0
+
+    @staticmethod
+    def key(voice: str, text: str, codec: str = MP3) -> str:
+        """Content address for an utterance in one codec"""
+        return hashlib.sha256(f"{voice}\n{codec}\n{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, codec: str) -> Path:
+        """On-disk location of an entry (sharded by key prefix)"""
+        return self.cache_dir / key[:2] / f"{key}.{FILE_EXTENSIONS[codec]}"
+
+    async def get(self, voice: str, text: str, codec: str = MP3) -> Optional[bytes]:
+        """
+        Look up cached audio
+
+        Args:
+            voice: TTS voice
+            text: Utterance text
+            codec: Codec MIME type of the audio
+
+        Returns:
+            Audio bytes, or None on a miss
+        """
+        key = self.key(voice, text, codec)
+
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return audio
+
+        audio = await asyncio.to_thread(self._read_disk, key, codec)
+        if audio is not None:
+            self.disk_hits += 1
+            self._remember(key, audio)
+            return audio
+
+        self.misses += 1
+        return None
+
+    async def put(self, voice: str, text: str, audio: bytes, codec: str = MP3):
+        """
+        Store synthesized audio in both tiers
+
+        Args:
+            voice: TTS voice
+            text: Utterance text
+            audio: Audio bytes
+            codec: Codec MIME type of the audio
+        """
+        if not audio:
+            return
+        key = self.key(voice, text, codec)
+        self._remember(key, audio)
+        await asyncio.to_thread(self._write_disk, key, codec, audio)
+
+    def record_synthesis(self, seconds: float):
+        """Record the edge-tts time spent on a cache miss"""
+        self.synthesis_count += 1
+        self.synthesis_seconds += seconds
+
+    def stats(self) -> Dict[str, float]:
+        """Hit-rate counters and an estimate of edge-tts time saved"""
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        avg_synthesis = self.synthesis_seconds / self.synthesis_count if self.synthesis_count else 0.0
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "avg_synthesis_seconds": avg_synthesis,
+            "estimated_seconds_saved": hits * avg_synthesis,
+        }
+
+    def _remember(self, key: str, audio: bytes):
+        """Insert into the memory tier, evicting least recently used entries"""
+        if len(audio) > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = audio
+            self._memory_bytes += len(audio)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def _read_disk(self, key: str, codec: str) -> Optional[bytes]:
+        """Read an entry from the disk tier"""
+        path = self._path(key, codec)
+        try:
+            audio = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            # Touch so pruning keeps recently used entries
+            os.utime(path)
+        except OSError:
+            pass
+        return audio or None
+
+    def _write_disk(self, key: str, codec: str, audio: bytes):
+        """Atomically write an entry so concurrent workers never read a partial file"""
+        path = self._path(key, codec)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Error writing TTS cache entry: {e}")
+            return
+
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= DISK_PRUNE_INTERVAL:
+            self._writes_since_prune = 0
+            self.prune_disk()
+
+    def prune_disk(self):
+        """Delete least recently used disk entries until the tier fits its limit"""
+        try:
+            entries = [
+                (p.stat(), p)
+                for extension in set(FILE_EXTENSIONS.values())
+                for p in self.cache_dir.glob(f"*/*.{extension}")
+            ]
+        except OSError:
+            return
+        total = sum(st.st_size for st, _ in entries)
+        if total <= self.max_disk_bytes:
+            return
+        for st, path in sorted(entries, key=lambda e: e[0].st_mtime):
+            try:
+                path.unlink()
+                total -= st.st_size
+            except OSError:
+                continue
+            if total <= self.max_disk_bytes:
+                break
+
+
+# Process-wide cache shared by every TextToSpeechService
+tts_cache = TTSCache()
@@ -0,0 +1,188 @@
+"""
+Voice activity detection for candidate recordings
+Decodes the recording to 16 kHz mono PCM, finds the span that contains
+speech with a NumPy frame-energy detector, and trims leading and trailing
+silence before the audio is uploaded to Whisper. Entirely silent turns are
+reported so the caller can skip transcription and the LLM.
+
+Decoding and re-encoding use PyAV when it is installed; without it, or
+when re-encoding would not make the upload smaller, the original recording
+is uploaded unchanged.
+"""
+import io
+import logging
+from typing import Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+FRAME_MS = 30
+PADDING_MS = 200  # Kept around detected speech so word edges are not clipped
+MIN_SPEECH_MS = 250  # Less voiced audio than this counts as silence
+ENERGY_MARGIN_DB = 10.0  # Speech must be this far above the noise floor
+ABSOLUTE_FLOOR_DB = -50.0  # ...and above this level (dBFS)
+MIN_TRIM_RATIO = 0.1  # Only re-encode when at least this much audio is removed
+SILENCE_TAIL_MS = 200  # Unvoiced audio (beyond padding) that makes a pause
+
+
+def decode_to_pcm(audio_data: bytes) -> Optional[np.ndarray]:
+    """
+    Decode a recording to mono float32 PCM at SAMPLE_RATE
+
+    Args:
+        audio_data: Encoded audio (WebM/Opus, MP3, WAV, ...)
+
+    Returns:
+        Samples in [-1, 1], or None if PyAV is unavailable or decoding fails
+    """
+    try:
+        import av
+    except ImportError:
+        return None
+
+    try:
+        with av.open(io.BytesIO(audio_data)) as container:
+            resampler = av.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+            chunks = []
+            for frame in container.decode(audio=0):
+                for resampled in resampler.resample(frame):
+                    chunks.append(resampled.to_ndarray().reshape(-1))
+            for resampled in resampler.resample(None):
+                chunks.append(resampled.to_ndarray().reshape(-1))
+    except Exception as e:
+        logger.warning(f"Could not decode audio for VAD: {e}")
+        return None
+
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks).astype(np.float32) / 32768.0
+
+
+def detect_speech(pcm: np.ndarray) -> Optional[Tuple[int, int]]:
+    """
+    Find the span of a recording that contains speech
+
+    Frames are classified by RMS energy against an adaptive threshold: the
+    noise floor (10th percentile of frame energy) plus a margin, never
+    below an absolute floor. A recording whose level hardly varies has no
+    quiet stretch to measure the noise on (continuous speech, e.g. a segment
+    cut from the middle of an answer), so only the absolute floor applies.
+
+    Args:
+        pcm: Mono float32 samples at SAMPLE_RATE
+
+    Returns:
+        (start_sample, end_sample) including padding, or None if silent
+    """
+    frame_len = SAMPLE_RATE * FRAME_MS // 1000
+    n_frames = len(pcm) // frame_len
+    if n_frames == 0:
+        return None
+
+    frames = pcm[:n_frames * frame_len].reshape(n_frames, frame_len)
+    rms = np.sqrt(np.mean(frames ** 2, axis=1))
+    energy_db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+    noise_floor, loud = np.percentile(energy_db, [10, 90])
+    if loud - noise_floor < ENERGY_MARGIN_DB:
+        threshold = ABSOLUTE_FLOOR_DB
+    else:
+        threshold = max(noise_floor + ENERGY_MARGIN_DB, ABSOLUTE_FLOOR_DB)
+    voiced = np.flatnonzero(energy_db > threshold)
+
+    if len(voiced) * FRAME_MS < MIN_SPEECH_MS:
+        return None
+
+    padding = PADDING_MS // FRAME_MS
+    first = max(int(voiced[0]) - padding, 0)
+    last = min(int(voiced[-1]) + padding + 1, n_frames)
+    return first * frame_len, min(last * frame_len, len(pcm))
+
+
+def ends_in_silence(audio_data: bytes) -> bool:
+    """
+    Check whether a recording ends in a pause
+
+    Used to cut a chunked answer where no word is being spoken.
+
+    Args:
+        audio_data: Encoded recording
+
+    Returns:
+        True if no speech was detected in the last PADDING_MS +
+        SILENCE_TAIL_MS; False otherwise, or if it cannot be decoded
+    """
+    pcm = decode_to_pcm(audio_data)
+    if pcm is None or len(pcm) < SAMPLE_RATE * (PADDING_MS + SILENCE_TAIL_MS) // 1000:
+        return False
+
+    span = detect_speech(pcm)
+    if span is None:
+        return True
+    return span[1] <= len(pcm) - SAMPLE_RATE * SILENCE_TAIL_MS // 1000
+
+
+def encode_for_upload(pcm: np.ndarray) -> Optional[Tuple[bytes, str]]:
+    """
+    Encode trimmed PCM compactly for the Whisper upload
+
+    Args:
+        pcm: Mono float32 samples at SAMPLE_RATE
+
+    Returns:
+        Tuple of (audio_bytes, filename) as Ogg/Opus, or None if PyAV or its
+        Opus encoder is unavailable (uncompressed PCM would be larger than
+        the original recording)
+    """
+    samples = np.clip(pcm * 32768.0, -32768, 32767).astype(np.int16)
+
+    try:
+        import av
+
+        out = io.BytesIO()
+        with av.open(out, mode="w", format="ogg") as container:
+            stream = container.add_stream("libopus", rate=SAMPLE_RATE)
+            frame = av.AudioFrame.from_ndarray(samples.reshape(1, -1), format="s16", layout="mono")
+            frame.sample_rate = SAMPLE_RATE
+            for packet in stream.encode(frame):
+                container.mux(packet)
+            for packet in stream.encode(None):
+                container.mux(packet)
+        return out.getvalue(), "audio.ogg"
+    except Exception as e:
+        logger.warning(f"Could not encode trimmed audio, uploading the original: {e}")
+        return None
+
+
+def prepare_for_transcription(audio_data: bytes, filename: str = "audio.webm") -> Optional[Tuple[bytes, str]]:
+    """
+    Trim silence from a recording before transcription
+
+    Args:
+        audio_data: Encoded recording
+        filename: Upload name for the original recording
+
+    Returns:
+        Tuple of (audio_bytes, filename) to upload, or None if the recording
+        contains no speech
+    """
+    pcm = decode_to_pcm(audio_data)
+    if pcm is None:
+        # Cannot analyse this recording; let Whisper handle it as before
+        return audio_data, filename
+
+    span = detect_speech(pcm)
+    if span is None:
+        return None
+
+    start, end = span
+    if (len(pcm) - (end - start)) < MIN_TRIM_RATIO * len(pcm):
+        # Little silence to remove; keep the original compressed upload
+        return audio_data, filename
+
+    encoded = encode_for_upload(pcm[start:end])
+    if encoded is None or len(encoded[0]) >= len(audio_data):
+        # Re-encoding would not shrink the upload; send the original as is
+        return audio_data, filename
+    return encoded
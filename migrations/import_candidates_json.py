@@ -0,0 +1,31 @@
+"""
+Import the legacy candidates.json pipeline store into application_pipelines
+Migration 5 runs this once automatically; use this script to import a file
+from another location or one written by an older deployment afterwards.
+Emails that already have a row are skipped.
+
+Usage: python migrations/import_candidates_json.py [path/to/candidates.json]
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.database import engine, init_db
+from core.notification_service import CANDIDATES_FILE, import_candidates_json
+
+def import_file(path: Path):
+    """Import one JSON file"""
+    print(f"Database: {engine.url}")
+    if not path.exists():
+        print(f"Nothing to import: {path} does not exist")
+        return
+
+    init_db()
+    with engine.begin() as conn:
+        imported = import_candidates_json(conn, path)
+    print(f"✓ Imported {imported} candidates from {path}")
+
+if __name__ == "__main__":
+    import_file(Path(sys.argv[1]) if len(sys.argv) > 1 else CANDIDATES_FILE)
@@ -0,0 +1,33 @@
+"""
+Apply pending schema migrations (see core/migrations.py)
+Creates any missing tables, then runs each migration the database has not
+recorded in schema_migrations yet.
+
+Usage: python migrations/migrate.py
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.database import engine, Base
+from core.migrations import MIGRATIONS, current_version, migrate, write_locked
+import core.models  # noqa: F401  (register tables on Base.metadata)
+
+def migrate_database():
+    """Bring the database schema up to date"""
+    print(f"Database: {engine.url}")
+    print(f"Schema version: {current_version(engine)} (latest {MIGRATIONS[-1][0]})")
+
+    with write_locked(engine) as conn:
+        Base.metadata.create_all(bind=conn)
+    applied = migrate(engine)
+
+    if applied:
+        print(f"✓ Applied {len(applied)} migration(s), now at version {applied[-1]}")
+    else:
+        print("✓ Schema is up to date")
+
+if __name__ == "__main__":
+    migrate_database()
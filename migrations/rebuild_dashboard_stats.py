@@ -0,0 +1,60 @@
+"""
+Rebuild the dashboard statistics aggregate (see core/dashboard_stats.py)
+Recomputes the dashboard_stats row from the candidates table and reports
+any drift from the stored values. With --check nothing is written and the
+exit status is 1 if the stored row is missing or out of date.
+
+Usage: python migrations/rebuild_dashboard_stats.py [--check]
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+
+from core.database import engine
+from core.models import DashboardStats
+from core.dashboard_stats import STATS_ID, STAT_COLUMNS, rebuild
+
+def rebuild_dashboard_stats(check: bool = False) -> bool:
+    """
+    Recompute the aggregates and compare them with the stored row
+
+    Args:
+        check: Only compare, roll back the recomputed row
+
+    Returns:
+        True if the stored row matched
+    """
+    print(f"Database: {engine.url}")
+
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        stored = conn.execute(select(DashboardStats.__table__).where(DashboardStats.id == STATS_ID)).mappings().first()
+        fresh = rebuild(conn)
+        if check:
+            transaction.rollback()
+        else:
+            transaction.commit()
+
+    if stored is None:
+        print("Stored row: missing")
+        consistent = False
+    else:
+        consistent = True
+        for column in STAT_COLUMNS:
+            if stored[column] != fresh[column]:
+                consistent = False
+                print(f"  {column}: stored {stored[column]}, actual {fresh[column]}")
+
+    if consistent:
+        print("✓ Stored statistics match the candidates table")
+    if not check:
+        print("✓ Dashboard statistics rebuilt")
+    return consistent
+
+if __name__ == "__main__":
+    consistent = rebuild_dashboard_stats(check="--check" in sys.argv[1:])
+    sys.exit(0 if consistent or "--check" not in sys.argv[1:] else 1)
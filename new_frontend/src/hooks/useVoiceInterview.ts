@@ -57,7 +57,13 @@ export function useVoiceInterview({ onComplete, candidateName, jobRole }: UseVoi
             const source = audioContextRef.current.createBufferSource();
             source.buffer = audioBuffer;
             source.connect(audioContextRef.current.destination);
-            source.onended = () => setIsAiSpeaking(false);
+            source.onended = () => {
+                setIsAiSpeaking(false);
+                // Let the server know playback finished (used to close the interview cleanly)
+                if (wsRef.current?.readyState === WebSocket.OPEN) {
+                    wsRef.current.send(JSON.stringify({ type: "playback_complete" }));
+                }
+            };
 
             activeSourceRef.current = source;
             source.start(0);